@@ -0,0 +1,68 @@
+import asyncio
+from functools import partial
+from asgiref.sync import sync_to_async
+from django.db import connections
+from django.http import HttpResponse
+from django.views.decorators.http import require_GET
+from rest_framework.settings import api_settings
+from .conditional import conditional_response
+from .services.table_versions import make_etag
+from .signals import counter_service
+from .views import dashboard_counts, parse_search_params, search_section
+
+
+def json_response(data, status=200):
+    """The body the sync view's JSON renderer would give, without DRF's sync request cycle."""
+    renderer = api_settings.DEFAULT_RENDERER_CLASSES[0]()
+    return HttpResponse(renderer.render(data), content_type="application/json", status=status)
+
+
+def on_own_connection(call):
+    """Wrap a blocking ORM call to run on an executor thread and close its connections when it returns."""
+    def run():
+        try:
+            return call()
+        finally:
+            # Always closed, whatever CONN_MAX_AGE says: the shared executor has up to ~32 threads and
+            # nothing would ever clean up their idle persistent connections (pooled ones go back to the pool)
+            connections.close_all()
+    return run
+
+
+async def gather_queries(*calls):
+    """Run blocking ORM calls concurrently, each on its own executor thread and database connection.
+
+    Django's async ORM methods (``aget``, ``acount``...) all hop onto the one thread-sensitive
+    thread, so gathering them still runs the queries one after another; ``thread_sensitive=False``
+    gives every call its own thread, and so its own connection.
+    """
+    return await asyncio.gather(*(
+        sync_to_async(on_own_connection(call), thread_sensitive=False)() for call in calls
+    ))
+
+
+@require_GET
+async def search_all(request):
+    """``/api/search/`` with its sections searched concurrently; same parameters and body.
+
+    Each section's FTS match, capped count and page fetch run on their own connection, so the
+    response takes as long as the slowest section rather than the sum of all four.
+    """
+    try:
+        query, limit, sections, position = parse_search_params(request.GET)
+        results = await gather_queries(*(partial(search_section, name, query, limit, position) for name in sections))
+    except ValueError as e:
+        return json_response({"error": str(e)}, status=400)
+
+    data = {name: rows for name, (rows, _) in zip(sections, results)}
+    meta = {name: section_meta for name, (_, section_meta) in zip(sections, results)}
+    return json_response({**data, "meta": meta})
+
+
+@require_GET
+async def dashboard_summary(request):
+    """``/api/dashboard-summary/`` read through the async ORM, with the same ETag as the JSON sync view."""
+    counters = await counter_service.aread()
+    counts = dashboard_counts(counters)
+    etag = make_etag(*counts.values(), counters.updated_at, "json")
+    return conditional_response(request, etag, counters.updated_at, lambda: json_response(counts))
@@ -0,0 +1 @@
+"""Benchmark scenarios run by ``python manage.py benchmark <scenario>``."""
@@ -0,0 +1,114 @@
+import asyncio
+import statistics
+import threading
+import time
+from django.db import connections
+from django.test import AsyncClient, Client, override_settings
+from api.models import Student
+from .base import percentile, seed_dataset
+from .endpoints import middle
+
+DEFAULT_CLIENTS = [1, 8, 32]
+DATASET_REGISTRATIONS = 10_000
+# endpoint -> (sync view served as under WSGI, async view served as under ASGI)
+ENDPOINTS = {
+    "search": ("/api/search/?q={q}", "/api/search/async/?q={q}"),
+    "dashboard": ("/api/dashboard-summary/", "/api/dashboard-summary/async/"),
+}
+# The sync dashboard would otherwise be answered from the response cache after its first request
+NO_RESPONSE_CACHE = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "responses": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"},
+}
+
+
+def run(sizes, iterations, stdout):
+    """Tail latency of search_all and dashboard_summary under concurrent load, WSGI against ASGI.
+
+    ``sizes`` are numbers of concurrent clients, each issuing ``iterations`` requests back to back.
+    The WSGI path runs the sync views from one thread per client with the test Client; the ASGI
+    path runs the async views from one coroutine per client on a single event loop with
+    AsyncClient, which drives the middleware chain in async mode as an ASGI server would.
+    """
+    stdout.write(f"Generating {DATASET_REGISTRATIONS} registrations...")
+    seed_dataset(DATASET_REGISTRATIONS)
+    query = middle(Student.objects.all()).name_last
+    results = []
+    with override_settings(CACHES=NO_RESPONSE_CACHE):
+        for clients in sizes or DEFAULT_CLIENTS:
+            for endpoint, (sync_url, async_url) in ENDPOINTS.items():
+                for path, result in [
+                    ("wsgi", run_threads(sync_url.format(q=query), clients, iterations)),
+                    ("asgi", run_coroutines(async_url.format(q=query), clients, iterations)),
+                ]:
+                    stdout.write(
+                        f"  {endpoint} {path} x{clients}: p99 {result['p99_ms']} ms, "
+                        f"{result['ops_per_s']:.0f} req/s, {result['errors']} errors"
+                    )
+                    results.append({"scenario": f"{endpoint}_{path}_{clients}c", "rows": DATASET_REGISTRATIONS, **result})
+    return results
+
+
+def run_threads(url, clients, iterations):
+    timings = []
+    errors = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(clients + 1)
+
+    def worker():
+        client = Client(raise_request_exception=False)
+        local = []
+        failed = 0
+        barrier.wait()
+        try:
+            for _ in range(iterations):
+                start = time.perf_counter()
+                response = client.get(url)
+                local.append((time.perf_counter() - start) * 1000)
+                failed += response.status_code >= 500
+        finally:
+            connections.close_all()
+        with lock:
+            timings.extend(local)
+            errors.append(failed)
+
+    workers = [threading.Thread(target=worker) for _ in range(clients)]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    return summarize_load(timings, time.perf_counter() - start, sum(errors))
+
+
+def run_coroutines(url, clients, iterations):
+    async def worker(client):
+        local = []
+        failed = 0
+        for _ in range(iterations):
+            start = time.perf_counter()
+            response = await client.get(url)
+            local.append((time.perf_counter() - start) * 1000)
+            failed += response.status_code >= 500
+        return local, failed
+
+    async def load():
+        start = time.perf_counter()
+        outcomes = await asyncio.gather(*(worker(AsyncClient(raise_request_exception=False)) for _ in range(clients)))
+        return outcomes, time.perf_counter() - start
+
+    outcomes, elapsed = asyncio.run(load())
+    timings = [timing for local, _ in outcomes for timing in local]
+    return summarize_load(timings, elapsed, sum(failed for _, failed in outcomes))
+
+
+def summarize_load(timings, elapsed, errors):
+    return {
+        "p50_ms": round(percentile(timings, 0.50), 3),
+        "p95_ms": round(percentile(timings, 0.95), 3),
+        "p99_ms": round(percentile(timings, 0.99), 3),
+        "mean_ms": round(statistics.fmean(timings), 3),
+        "ops_per_s": round(len(timings) / elapsed, 1),
+        "errors": errors,
+    }
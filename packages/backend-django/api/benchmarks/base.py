@@ -0,0 +1,173 @@
+import statistics
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import date, timedelta
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from api.models import Instructor, Course, Student, Registration
+from api.services.bulk_load import clear_tables, refresh_derived_state
+from api.services.dataset_generator import DatasetGenerator
+from api.signals import counter_service
+
+BATCH_SIZE = 5000
+# Extra requests per measurement run under tracemalloc, kept out of the latency figures
+ALLOCATION_SAMPLES = 3
+
+
+@contextmanager
+def benchmark_database():
+    """Run the wrapped block against a throwaway test database, never the dev database."""
+    old_name = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+def clear_data():
+    """Empty the seeded tables, skipping per-object delete signals."""
+    clear_tables()
+    refresh_derived_state()
+
+
+def seed_students(count):
+    """Bulk insert ``count`` students with distinct names and emails."""
+    clear_data()
+    students = Student.objects.bulk_create(
+        (
+            Student(name_first=f"Student{i}", name_last=f"Bench{i % 997}", email=f"student{i}@bench.com")
+            for i in range(count)
+        ),
+        batch_size=BATCH_SIZE,
+    )
+    # bulk_create skips the write hooks, so bring the counters back in line
+    counter_service.reconcile()
+    return students
+
+
+def seed_registrations(count, students_per_registration=10, course_count=50, instructor_count=10):
+    """Bulk insert ``count`` registrations spread over a proportional set of students and courses."""
+    clear_data()
+    instructors = Instructor.objects.bulk_create(
+        Instructor(name_first=f"Instructor{i}", name_last="Bench", email=f"instructor{i}@bench.com")
+        for i in range(instructor_count)
+    )
+    start = date.today() - timedelta(days=30)
+    courses = Course.objects.bulk_create(
+        Course(
+            course_code=f"BENCH-{i:04}",
+            title=f"Benchmark Course {i}",
+            description="Benchmark",
+            description_full="Benchmark course used for latency measurements",
+            instructor=instructors[i % instructor_count],
+            start_date=start,
+            end_date=start + timedelta(days=90),
+            course_fee=100,
+        )
+        for i in range(course_count)
+    )
+    student_count = max(1, count // students_per_registration)
+    students = Student.objects.bulk_create(
+        (
+            Student(name_first=f"Student{i}", name_last="Bench", email=f"student{i}@bench.com")
+            for i in range(student_count)
+        ),
+        batch_size=BATCH_SIZE,
+    )
+    Registration.objects.bulk_create(
+        (
+            Registration(student=students[i % student_count], course=courses[(i // student_count) % course_count])
+            for i in range(count)
+        ),
+        batch_size=BATCH_SIZE,
+    )
+    counter_service.reconcile()
+    return {"instructors": instructors, "courses": courses, "students": students}
+
+
+def seed_dataset(registrations, seed=0):
+    """Replace all data with a generated dataset scaled from the registration count."""
+    clear_data()
+    courses = max(100, registrations // 500)
+    counts = DatasetGenerator(seed=seed).generate(
+        instructors=max(10, courses // 10),
+        courses=courses,
+        students=max(1, registrations // 10),
+        registrations=registrations,
+    )
+    refresh_derived_state()
+    return counts
+
+
+def measure(url, iterations=20, method="get", data=None, client=None, prepare=None):
+    """Issue ``iterations`` requests to ``url`` and summarise latency, query counts and allocations."""
+    client = client or Client()
+    send = getattr(client, method)
+
+    def call(_):
+        return send(url, data, content_type="application/json") if data is not None else send(url)
+
+    return measure_calls(call, iterations, prepare=prepare, label=f"{method.upper()} {url}")
+
+
+def measure_calls(call, iterations, prepare=None, label="request"):
+    """Time ``call(i)`` for ``i`` in ``range(iterations)``, then trace ALLOCATION_SAMPLES more calls.
+
+    ``call`` returns the response; calls that are not idempotent can use ``i`` to pick fresh
+    rows, and need ``iterations + ALLOCATION_SAMPLES`` of them. ``prepare`` runs before every
+    call, outside the measurement (e.g. to empty a cache).
+    """
+    timings = []
+    queries = []
+    for i in range(iterations):
+        if prepare:
+            prepare()
+        # queries_log is a bounded deque; a full log would hide this request's queries
+        connection.queries_log.clear()
+        with CaptureQueriesContext(connection) as context:
+            start = time.perf_counter()
+            response = call(i)
+            timings.append((time.perf_counter() - start) * 1000)
+        queries.append(len(context.captured_queries))
+        check_response(response, label)
+
+    allocations = []
+    for i in range(iterations, iterations + ALLOCATION_SAMPLES):
+        if prepare:
+            prepare()
+        tracemalloc.start()
+        try:
+            response = call(i)
+            allocations.append(tracemalloc.get_traced_memory()[1] / 1024)
+        finally:
+            tracemalloc.stop()
+        check_response(response, label)
+    return summarize(timings, queries, allocations)
+
+
+def check_response(response, label):
+    if response.status_code >= 400:
+        raise RuntimeError(f"{label} returned {response.status_code}")
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summarize(timings, queries, allocations=None):
+    summary = {
+        "p50_ms": round(percentile(timings, 0.50), 3),
+        "p95_ms": round(percentile(timings, 0.95), 3),
+        "p99_ms": round(percentile(timings, 0.99), 3),
+        "mean_ms": round(statistics.fmean(timings), 3),
+        "queries": max(queries),
+    }
+    if allocations:
+        # Peak Python memory allocated while serving one request
+        summary["alloc_kib"] = round(statistics.median(allocations), 1)
+    return summary
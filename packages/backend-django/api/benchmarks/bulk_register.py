@@ -0,0 +1,48 @@
+import json
+import time
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from api.views import BULK_REGISTRATION_MAX
+from .base import seed_registrations, summarize
+
+DEFAULT_SIZES = [500]
+
+
+def run(sizes, iterations, stdout):
+    """Time enrolling a whole cohort through /api/registrations/register-bulk/.
+
+    A cohort is one request, so sizes are capped at BULK_REGISTRATION_MAX. Confirmation emails go
+    to the locmem backend with no outbox workers, so no thread outlives the benchmark database.
+    """
+    sizes = sizes or DEFAULT_SIZES
+    too_large = [size for size in sizes if size > BULK_REGISTRATION_MAX]
+    if too_large:
+        raise CommandError(f"register-bulk takes at most {BULK_REGISTRATION_MAX} pairs per request; got --sizes {too_large}")
+    with override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend", EMAIL_OUTBOX_WORKERS=0):
+        return [run_size(size, iterations, stdout) for size in sizes]
+
+
+def run_size(size, iterations, stdout):
+    client = Client()
+    stdout.write(f"Seeding {size} students...")
+    # one registration per student leaves every later course free for a fresh cohort
+    seeded = seed_registrations(size, students_per_registration=1, course_count=iterations + 1)
+    timings = []
+    queries = []
+    for course in seeded["courses"][1:iterations + 1]:
+        payload = {"registrations": [
+            {"student_id": str(student.id), "course_id": str(course.id)} for student in seeded["students"]
+        ]}
+        connection.queries_log.clear()
+        with CaptureQueriesContext(connection) as context:
+            start = time.perf_counter()
+            response = client.post("/api/registrations/register-bulk/", json.dumps(payload), content_type="application/json")
+            timings.append((time.perf_counter() - start) * 1000)
+        queries.append(len(context.captured_queries))
+        if response.status_code != 200:
+            raise RuntimeError(f"register-bulk returned {response.status_code}: {response.content[:200]!r}")
+        if response.json()["registered"] != size:
+            raise RuntimeError(f"Bulk registration failed: {response.json()['results'][:3]}")
+    return {"scenario": "register_bulk", "rows": size, **summarize(timings, queries)}
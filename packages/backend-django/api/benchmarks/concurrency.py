@@ -0,0 +1,122 @@
+import os
+import random
+import statistics
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from django.db import connections
+from django.test import Client
+from api.models import Student
+from core.database import database_config
+from .base import percentile, seed_dataset
+
+DEFAULT_THREADS = [1, 4, 8]
+DATASET_REGISTRATIONS = 10_000
+# Share of requests that write (PATCH a student the thread owns)
+WRITE_FRACTION = 0.2
+READ_URLS = ["/api/students/?page_size=20", "/api/registrations/?page_size=20", "/api/students/{id}/"]
+
+
+def run(sizes, iterations, stdout):
+    """Mixed read/write throughput from concurrent threads, per database profile.
+
+    ``sizes`` are thread counts; every thread issues ``iterations`` requests. Each profile gets a
+    fresh file database (SQLite) or test database (PostgreSQL, only when POSTGRES_HOST is set),
+    built with the same settings as DB_PROFILE would give the server.
+    """
+    profiles = ["sqlite-basic", "sqlite"]
+    if os.getenv("POSTGRES_HOST"):
+        profiles.append("postgres")
+    else:
+        stdout.write("POSTGRES_HOST not set; skipping the postgres profile")
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for profile in profiles:
+            stdout.write(f"Profile {profile}: generating {DATASET_REGISTRATIONS} registrations...")
+            with database_profile(profile, os.path.join(directory, f"{profile}.sqlite3")):
+                seed_dataset(DATASET_REGISTRATIONS)
+                student_ids = [str(pk) for pk in Student.objects.values_list("id", flat=True)]
+                for threads in sizes or DEFAULT_THREADS:
+                    result = run_threads(threads, iterations, student_ids)
+                    stdout.write(
+                        f"  {threads} threads: {result['ops_per_s']:.0f} req/s, read p95 {result['read_p95_ms']} ms, "
+                        f"write p95 {result['write_p95_ms']} ms, {result['errors']} errors"
+                    )
+                    results.append({"scenario": f"{profile}_{threads}t", "rows": DATASET_REGISTRATIONS, **result})
+    return results
+
+
+@contextmanager
+def database_profile(profile, sqlite_path):
+    """Point the default alias at a new test database configured as ``profile``, for every thread."""
+    original_settings = connections.settings["default"]
+    original_connection = connections["default"]
+    config = database_config(profile, sqlite_path)
+    config["TEST"] = {"NAME": sqlite_path}
+    connections.settings["default"] = connections.configure_settings({"default": config})["default"]
+    connection = connections["default"] = connections.create_connection("default")
+    old_name = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        connection.close()
+        connections.settings["default"] = original_settings
+        connections["default"] = original_connection
+
+
+def run_threads(threads, requests_per_thread, student_ids):
+    timings = {"read": [], "write": []}
+    errors = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(index):
+        rng = random.Random(index)
+        # Each thread writes only its own students, so errors come from locking, not conflicts
+        owned = student_ids[index::threads]
+        client = Client(raise_request_exception=False)
+        local = {"read": [], "write": []}
+        failed = 0
+        barrier.wait()
+        try:
+            for i in range(requests_per_thread):
+                kind = "write" if rng.random() < WRITE_FRACTION else "read"
+                start = time.perf_counter()
+                if kind == "write":
+                    response = client.patch(
+                        f"/api/students/{rng.choice(owned)}/", {"notes": f"update {i}"}, content_type="application/json"
+                    )
+                else:
+                    response = client.get(rng.choice(READ_URLS).format(id=rng.choice(student_ids)))
+                local[kind].append((time.perf_counter() - start) * 1000)
+                failed += response.status_code >= 500
+        finally:
+            connections.close_all()
+        with lock:
+            for kind, values in local.items():
+                timings[kind] += values
+            errors.append(failed)
+
+    workers = [threading.Thread(target=worker, args=(index,)) for index in range(threads)]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    every = timings["read"] + timings["write"]
+    return {
+        "p50_ms": round(percentile(every, 0.50), 3),
+        "p95_ms": round(percentile(every, 0.95), 3),
+        "p99_ms": round(percentile(every, 0.99), 3),
+        "mean_ms": round(statistics.fmean(every), 3),
+        "read_p95_ms": round(percentile(timings["read"], 0.95), 3) if timings["read"] else None,
+        "write_p95_ms": round(percentile(timings["write"], 0.95), 3) if timings["write"] else None,
+        "ops_per_s": round(len(every) / elapsed, 1),
+        "errors": sum(errors),
+    }
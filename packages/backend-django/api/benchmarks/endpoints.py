@@ -0,0 +1,79 @@
+from django.test import Client, override_settings
+from api.conditional import response_cache
+from api.models import Instructor, Course, Student, Registration
+from .base import ALLOCATION_SAMPLES, seed_dataset, measure, measure_calls
+
+DEFAULT_SIZES = [10_000, 100_000]
+
+
+def run(sizes, iterations, stdout):
+    """Latency, queries and allocations for every endpoint over a generated dataset.
+
+    Reads run with the response cache emptied before each request, so they measure the work
+    behind a cache miss. Emails are delivered inline to the locmem backend, so register and
+    unregister include their outbox round trip.
+    """
+    results = []
+    for size in sizes or DEFAULT_SIZES:
+        stdout.write(f"Generating {size} registrations...")
+        seed_dataset(size)
+        for name, result in read_scenarios(iterations):
+            results.append({"scenario": name, "rows": size, **result})
+        with override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend", EMAIL_OUTBOX_WORKERS=0):
+            for name, result in write_scenarios(iterations):
+                results.append({"scenario": name, "rows": size, **result})
+    return results
+
+
+def middle(queryset):
+    """The row halfway through ``queryset`` by id: neither the first nor the last page."""
+    return queryset.order_by("id")[queryset.count() // 2]
+
+
+def read_scenarios(iterations):
+    student = middle(Student.objects.all())
+    course = middle(Course.objects.all())
+    instructor = middle(Instructor.objects.all())
+    registration = middle(Registration.objects.all())
+    urls = {
+        "list_students": "/api/students/?page_size=100",
+        "list_courses": "/api/courses/?page_size=100",
+        "list_instructors": "/api/instructors/?page_size=100",
+        "list_registrations": "/api/registrations/?page_size=100",
+        "retrieve_student": f"/api/students/{student.id}/",
+        "retrieve_course": f"/api/courses/{course.id}/",
+        "retrieve_instructor": f"/api/instructors/{instructor.id}/",
+        "retrieve_registration": f"/api/registrations/{registration.id}/",
+        "search_name": f"/api/search/?q={student.name_last}",
+        "search_email": f"/api/search/?q={student.email}",
+        "search_course_code": f"/api/search/?q={course.course_code}",
+        "dashboard": "/api/dashboard-summary/",
+    }
+    client = Client()
+    for name, url in urls.items():
+        yield name, measure(url, iterations, client=client, prepare=response_cache.clear)
+
+
+def write_scenarios(iterations):
+    """Register fresh students for a course without prerequisites, then unregister the same pairs."""
+    course = next(
+        course_id for course_id, prerequisites in Course.objects.values_list("id", "prerequisites")
+        if not prerequisites
+    )
+    needed = iterations + ALLOCATION_SAMPLES
+    students = list(
+        Student.objects.exclude(id__in=Registration.objects.filter(course_id=course).values("student_id"))
+        .values_list("id", flat=True)[:needed]
+    )
+    if len(students) < needed:
+        raise RuntimeError(f"Only {len(students)} students can register for {course}; lower --iterations")
+    client = Client()
+
+    def post(url):
+        def call(i):
+            payload = {"student_id": str(students[i]), "course_id": str(course)}
+            return client.post(url, payload, content_type="application/json")
+        return call
+
+    yield "register", measure_calls(post("/api/registrations/register/"), iterations, label="register")
+    yield "unregister", measure_calls(post("/api/registrations/unregister/"), iterations, label="unregister")
@@ -0,0 +1,47 @@
+import time
+import tracemalloc
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from .base import seed_registrations, summarize
+
+DEFAULT_SIZES = [100_000, 1_000_000]
+MAX_ITERATIONS = 3
+
+
+def run(sizes, iterations, stdout):
+    """Stream the full registration export and report latency and peak Python memory per size.
+
+    Flat peak memory across sizes is the point: the export never holds the result set.
+    Exports are slow at these sizes, so at most MAX_ITERATIONS runs are timed.
+    """
+    client = Client()
+    results = []
+    for size in sizes or DEFAULT_SIZES:
+        stdout.write(f"Seeding {size} registrations...")
+        seed_registrations(size)
+        for export_format in ["csv", "ndjson"]:
+            url = f"/api/registrations/export/?export_format={export_format}"
+            timings = []
+            queries = []
+            for _ in range(min(iterations, MAX_ITERATIONS)):
+                connection.queries_log.clear()
+                with CaptureQueriesContext(connection) as context:
+                    start = time.perf_counter()
+                    consume(client.get(url), size)
+                    timings.append((time.perf_counter() - start) * 1000)
+                queries.append(len(context.captured_queries))
+
+            tracemalloc.start()
+            consume(client.get(url), size)
+            peak_kib = tracemalloc.get_traced_memory()[1] / 1024
+            tracemalloc.stop()
+            stdout.write(f"export_{export_format} {size} rows: peak {peak_kib:.0f} KiB")
+            results.append({"scenario": f"export_{export_format}", "rows": size, **summarize(timings, queries, [peak_kib])})
+    return results
+
+
+def consume(response, size):
+    lines = sum(chunk.count(b"\n") for chunk in response.streaming_content)
+    if lines < size:
+        raise RuntimeError(f"Export returned {lines} lines for {size} rows")
@@ -0,0 +1,59 @@
+import time
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.renderers import JSONRenderer
+from api.fast_read import encoder_for
+from api.models import Student, Registration
+from api.serializers import RegistrationSerializer, StudentSerializer
+from api.views import select_registration_related
+from .base import seed_dataset, summarize
+
+DEFAULT_PAGE_SIZES = [25, 100, 1000]
+DATASET_REGISTRATIONS = 100_000
+# model name -> (serializer, queryset the list endpoint serializes)
+LISTS = {
+    "students": (StudentSerializer, lambda: Student.objects.filter(is_active=True).order_by("-created_at")),
+    "registrations": (
+        RegistrationSerializer,
+        lambda: select_registration_related(Registration.objects.filter(is_active=True).order_by("-created_at")),
+    ),
+}
+
+
+def run(sizes, iterations, stdout):
+    """Fetching and rendering one list page: ModelSerializer instances against values() rows.
+
+    ``sizes`` are page sizes; the endpoints cap pages at 100, so the pages are sliced and
+    rendered directly, as the list views do. Both paths render with DRF's JSONRenderer and
+    must give the same bytes.
+    """
+    stdout.write(f"Generating {DATASET_REGISTRATIONS} registrations...")
+    seed_dataset(DATASET_REGISTRATIONS)
+    renderer = JSONRenderer()
+    results = []
+    for page_size in sizes or DEFAULT_PAGE_SIZES:
+        for name, (serializer_class, queryset) in LISTS.items():
+            encoder = encoder_for(serializer_class())
+            paths = {
+                "serializer": lambda: renderer.render(serializer_class(queryset()[:page_size], many=True).data),
+                "values": lambda: renderer.render(encoder.encode(queryset().values(*encoder.paths)[:page_size])),
+            }
+            bodies = {path: render() for path, render in paths.items()}
+            if bodies["serializer"] != bodies["values"]:
+                raise RuntimeError(f"{name}: the values() page differs from the serializer page")
+            for path, render in paths.items():
+                results.append({"scenario": f"{name}_{path}", "rows": page_size, **time_render(render, iterations)})
+    return results
+
+
+def time_render(render, iterations):
+    timings = []
+    queries = []
+    for _ in range(iterations):
+        connection.queries_log.clear()
+        with CaptureQueriesContext(connection) as context:
+            start = time.perf_counter()
+            render()
+            timings.append((time.perf_counter() - start) * 1000)
+        queries.append(len(context.captured_queries))
+    return summarize(timings, queries)
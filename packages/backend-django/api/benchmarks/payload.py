@@ -0,0 +1,61 @@
+import statistics
+import time
+from django.test import Client
+from rest_framework.renderers import JSONRenderer
+from api import compression
+from api.models import Student
+from api.renderers import FastJSONRenderer
+from .base import percentile, seed_dataset
+from .endpoints import middle
+
+DEFAULT_SIZES = [100_000]
+RENDERERS = {"drf": JSONRenderer(), "fast": FastJSONRenderer()}
+
+
+def run(sizes, iterations, stdout):
+    """Render CPU time and bytes on the wire per renderer and Content-Encoding.
+
+    Each response's data is fetched once through its endpoint, then rendered ``iterations`` times
+    by DRF's JSONRenderer and by FastJSONRenderer, and the fast renderer's body is compressed with
+    gzip and (when installed) brotli at the configured levels. Times are CPU time of the
+    rendering thread; ``wire_kib`` is the body size sent.
+    """
+    if compression.brotli is None:
+        stdout.write("brotli not installed; skipping br")
+    results = []
+    for size in sizes or DEFAULT_SIZES:
+        stdout.write(f"Generating {size} registrations...")
+        seed_dataset(size)
+        query = middle(Student.objects.all()).name_last
+        urls = {
+            "students": "/api/students/?page_size=100",
+            "registrations": "/api/registrations/?page_size=100",
+            "courses": "/api/courses/?page_size=100",
+            "search": f"/api/search/?q={query}&limit=100",
+        }
+        client = Client()
+        for name, url in urls.items():
+            data = client.get(url, HTTP_ACCEPT="application/json").data
+            for renderer_name, renderer in RENDERERS.items():
+                result = measure_cpu(lambda: renderer.render(data), iterations)
+                results.append({"scenario": f"{name}_{renderer_name}", "rows": size, **result})
+            body = RENDERERS["fast"].render(data)
+            for encoding in ["gzip", "br"] if compression.brotli else ["gzip"]:
+                result = measure_cpu(lambda: compression.compress(body, encoding), iterations)
+                results.append({"scenario": f"{name}_fast_{encoding}", "rows": size, **result})
+    return results
+
+
+def measure_cpu(call, iterations):
+    timings = []
+    for _ in range(iterations):
+        start = time.thread_time()
+        body = call()
+        timings.append((time.thread_time() - start) * 1000)
+    return {
+        "p50_ms": round(percentile(timings, 0.50), 3),
+        "p95_ms": round(percentile(timings, 0.95), 3),
+        "p99_ms": round(percentile(timings, 0.99), 3),
+        "mean_ms": round(statistics.fmean(timings), 3),
+        "wire_kib": round(len(body) / 1024, 1),
+    }
@@ -0,0 +1,37 @@
+from django.test import Client
+from .base import seed_registrations, measure
+
+DEFAULT_SIZES = [10_000, 100_000]
+
+
+def run(sizes, iterations, stdout):
+    """Registration list latency as the registrations table grows."""
+    results = []
+    for size in sizes or DEFAULT_SIZES:
+        stdout.write(f"Seeding {size} registrations...")
+        seeded = seed_registrations(size)
+        student = seeded["students"][0]
+        course = seeded["courses"][0]
+        deep_page = size // 100 - 1
+        urls = {
+            "list": "/api/registrations/?page_size=100",
+            "list_deep_page": f"/api/registrations/?page_size=100&page={deep_page}",
+            "list_cursor_deep": deep_cursor_url(deep_page),
+            "list_by_student": f"/api/registrations/?student_id={student.id}",
+            "list_by_course": f"/api/registrations/?course_id={course.id}&page_size=100",
+        }
+        for name, url in urls.items():
+            results.append({"scenario": name, "rows": size, **measure(url, iterations)})
+    return results
+
+
+def deep_cursor_url(pages):
+    """Follow cursor ``next`` links ``pages`` times and return the URL of the last page reached."""
+    client = Client()
+    url = "/api/registrations/?pagination=cursor&page_size=100"
+    for _ in range(pages):
+        next_url = client.get(url).json()["next"]
+        if not next_url:
+            break
+        url = next_url
+    return url
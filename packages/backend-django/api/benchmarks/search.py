@@ -0,0 +1,25 @@
+import time
+from api.services.search_index import SearchIndex
+from .base import seed_students, measure
+
+DEFAULT_SIZES = [100_000, 1_000_000]
+
+
+def run(sizes, iterations, stdout):
+    """search_all latency over the FTS5 index as the students table grows."""
+    search_index = SearchIndex()
+    results = []
+    for size in sizes or DEFAULT_SIZES:
+        stdout.write(f"Seeding {size} students...")
+        seed_students(size)
+        start = time.perf_counter()
+        search_index.rebuild()
+        stdout.write(f"Rebuilt search index in {time.perf_counter() - start:.1f}s")
+        urls = {
+            "search_email": f"/api/search/?q=student{size // 2}@bench.com",
+            "search_prefix": f"/api/search/?q=Student{size // 3}",
+            "search_two_words": f"/api/search/?q=Student{size // 4} Bench{(size // 4) % 997}",
+        }
+        for name, url in urls.items():
+            results.append({"scenario": name, "rows": size, **measure(url, iterations)})
+    return results
@@ -0,0 +1,57 @@
+from datetime import date, timedelta
+from api.models import Course, Registration
+from api.signals import counter_service
+from .base import seed_registrations, measure
+
+DEFAULT_SIZES = [1_000_000]
+SMALL_COURSE_SIZE = 30
+
+
+def run(sizes, iterations, stdout):
+    """Student list filters (course, instructor, eligibility) over a large registrations table.
+
+    Every seeded student holds ten registrations, so the first course is taken by every student;
+    a separate small course with a typical class size shows the selective case.
+    """
+    results = []
+    for size in sizes or DEFAULT_SIZES:
+        stdout.write(f"Seeding {size} registrations...")
+        seeded = seed_registrations(size)
+        full_course = seeded["courses"][0]
+        small_course = seed_small_course(seeded)
+        instructor = seeded["instructors"][0]
+        urls = {
+            "students_by_course": f"/api/students/?course_id={full_course.id}&page_size=100",
+            "students_by_small_course": f"/api/students/?course_id={small_course.id}",
+            "students_eligible_none": f"/api/students/?course_id={full_course.id}&eligible_for_course=true",
+            "students_eligible_small": f"/api/students/?course_id={small_course.id}&eligible_for_course=true",
+            "students_by_instructor": f"/api/students/?instructor_id={instructor.id}&page_size=100",
+            "students_course_instr": (
+                f"/api/students/?course_id={full_course.id}&instructor_id={instructor.id}&page_size=100"
+            ),
+        }
+        for name, url in urls.items():
+            results.append({"scenario": name, "rows": size, **measure(url, iterations)})
+    return results
+
+
+def seed_small_course(seeded):
+    """Add a course whose registrations are spread thinly across the seeded students."""
+    students = seeded["students"]
+    start = date.today() - timedelta(days=30)
+    course = Course.objects.create(
+        course_code="BENCH-SMALL",
+        title="Benchmark Small Course",
+        description="Benchmark",
+        description_full="Benchmark course with a typical class size",
+        instructor=seeded["instructors"][-1],
+        start_date=start,
+        end_date=start + timedelta(days=90),
+        course_fee=100,
+    )
+    step = max(1, len(students) // SMALL_COURSE_SIZE)
+    Registration.objects.bulk_create(
+        Registration(student=student, course=course) for student in students[::step][:SMALL_COURSE_SIZE]
+    )
+    counter_service.reconcile()
+    return course
@@ -0,0 +1,98 @@
+import gzip
+import zlib
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+from django.utils.http import parse_header_parameters
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+
+def accepted_encodings(header):
+    """The codings in an Accept-Encoding header mapped to their q-values; ``*`` stands for the rest."""
+    encodings = {}
+    for part in header.split(","):
+        coding, params = parse_header_parameters(part)
+        if not coding:
+            continue
+        try:
+            encodings[coding.lower()] = float(params.get("q", 1))
+        except ValueError:
+            continue
+    return encodings
+
+
+def choose_encoding(header):
+    """The best coding this server supports for ``header``: br, then gzip, or None."""
+    encodings = accepted_encodings(header)
+    wildcard = encodings.get("*", 0)
+    offered = ["br", "gzip"] if brotli is not None else ["gzip"]
+    best = max(offered, key=lambda coding: encodings.get(coding, wildcard))
+    return best if encodings.get(best, wildcard) > 0 else None
+
+
+def compress(content, encoding):
+    if encoding == "br":
+        return brotli.compress(content, quality=settings.COMPRESSION_BROTLI_QUALITY)
+    # mtime=0 keeps the bytes stable for the same body
+    return gzip.compress(content, compresslevel=settings.COMPRESSION_GZIP_LEVEL, mtime=0)
+
+
+def compress_stream(chunks, encoding):
+    if encoding == "br":
+        compressor = brotli.Compressor(quality=settings.COMPRESSION_BROTLI_QUALITY)
+        for chunk in chunks:
+            data = compressor.process(chunk)
+            if data:
+                yield data
+        yield compressor.finish()
+        return
+    # wbits=31 writes a gzip header and trailer around the deflate stream
+    compressor = zlib.compressobj(settings.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """Compresses responses with brotli (when installed) or gzip, as negotiated by Accept-Encoding.
+
+    Bodies under COMPRESSION_MIN_BYTES are sent as they are, as are bodies that got no smaller.
+    Streaming responses (exports) are compressed chunk by chunk. Like Django's GZipMiddleware,
+    strong ETags become weak, since the bytes now depend on the encoding; conditional GETs still
+    match them. Disabled with COMPRESSION_MIN_BYTES set to an empty value.
+    """
+
+    def process_response(self, request, response):
+        if settings.COMPRESSION_MIN_BYTES is None or response.has_header("Content-Encoding"):
+            return response
+        if not response.streaming and len(response.content) < settings.COMPRESSION_MIN_BYTES:
+            return response
+        patch_vary_headers(response, ["Accept-Encoding"])
+        encoding = choose_encoding(request.headers.get("Accept-Encoding", ""))
+        if encoding is None:
+            return response
+
+        if response.streaming:
+            if response.is_async:
+                # Export streams are sync generators; leave async ones to the server
+                return response
+            response.streaming_content = compress_stream(response.streaming_content, encoding)
+            del response.headers["Content-Length"]
+        else:
+            compressed = compress(response.content, encoding)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response.headers["Content-Length"] = str(len(compressed))
+
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = encoding
+        return response
@@ -0,0 +1,65 @@
+from functools import partial
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date
+from django.utils.timezone import now
+from rest_framework.response import Response
+from .services.response_cache import ResponseCache
+from .signals import table_versions
+
+response_cache = ResponseCache()
+
+
+def conditional_response(request, etag, last_modified, respond, cache=False):
+    """Answer a GET with 304 when the client's validators still match, else call ``respond``.
+
+    The validators must be computed without building the response, so the 304 path never touches
+    the querysets or serializers behind ``respond``. With ``cache``, a full response is served
+    from the response cache when one was rendered for the same request and ETag.
+    """
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    # The browsable API embeds per-request data (e.g. the CSRF token), so only JSON is cached
+    cache = cache and request.accepted_renderer.format == "json"
+    response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+    if response is None:
+        key = response_cache.key(request, etag) if cache else None
+        response = response_cache.get(key) if cache else None
+        if response is None:
+            response = respond()
+            if response.status_code != 200:
+                return response
+            if cache:
+                response.add_post_render_callback(partial(response_cache.store, key))
+    response["ETag"] = etag
+    if timestamp is not None:
+        response["Last-Modified"] = http_date(timestamp)
+    # Let browsers keep the body but revalidate it on every use
+    patch_cache_control(response, no_cache=True)
+    patch_vary_headers(response, ["Accept"])
+    return response
+
+
+class ConditionalGetMixin:
+    """Adds ETag/Last-Modified validators, taken from the per-table version stamps, to ``list`` and ``retrieve``.
+
+    ``version_models`` lists every model the viewset's responses read, including those used only
+    by filters or nested fields. The date is part of the ETag because filters such as
+    ``active_courses`` change with it. ``retrieve`` looks the object up before comparing, since the
+    stamps are table-wide: a missing pk is a 404 whatever validators the client sends, and the pk
+    is part of the ETag. Set ``cache_responses`` on read-heavy viewsets to also keep rendered
+    responses in the response cache.
+    """
+    version_models = ()
+    cache_responses = False
+
+    def list(self, request, *args, **kwargs):
+        return self.conditional(request, partial(super().list, request, *args, **kwargs))
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        return self.conditional(request, lambda: Response(self.get_serializer(instance).data), instance.pk)
+
+    def conditional(self, request, respond, *extra):
+        etag, last_modified = table_versions.validators(
+            self.version_models, request.accepted_renderer.format, now().date(), *extra
+        )
+        return conditional_response(request, etag, last_modified, respond, cache=self.cache_responses)
@@ -0,0 +1,73 @@
+import csv
+import io
+import json
+from django.http import StreamingHttpResponse
+from rest_framework.decorators import action
+from rest_framework.response import Response
+
+EXPORT_FORMATS = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+
+class ExportMixin:
+    """Adds ``GET <list>/export/?export_format=csv|ndjson``, streaming every row the list filters match.
+
+    Rows are read with ``queryset.iterator(chunk_size=export_chunk_size)`` and written out one
+    chunk at a time, so memory stays flat however many rows match. Each row is the viewset's
+    list representation (``get_serializer`` with ``action == "export"``).
+    """
+    export_chunk_size = 2000
+
+    @action(detail=False, methods=["get"], url_path="export")
+    def export(self, request):
+        export_format = request.query_params.get("export_format", "csv")
+        if export_format not in EXPORT_FORMATS:
+            return Response({"error": f"export_format must be one of: {', '.join(EXPORT_FORMATS)}"}, status=400)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        response = StreamingHttpResponse(
+            self.export_chunks(queryset, self.get_serializer(), export_format),
+            content_type=EXPORT_FORMATS[export_format],
+        )
+        filename = f"{queryset.model._meta.verbose_name_plural}.{export_format}"
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+
+    def export_chunks(self, queryset, serializer, export_format):
+        if export_format == "csv":
+            yield csv_lines([list(serializer.fields)])
+            write = csv_chunk
+        else:
+            write = ndjson_chunk
+        rows = []
+        for instance in queryset.iterator(chunk_size=self.export_chunk_size):
+            rows.append(serializer.to_representation(instance))
+            if len(rows) == self.export_chunk_size:
+                yield write(rows)
+                rows = []
+        if rows:
+            yield write(rows)
+
+
+def csv_lines(lines):
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(lines)
+    return buffer.getvalue()
+
+
+def csv_chunk(rows):
+    return csv_lines([csv_value(value) for value in row.values()] for row in rows)
+
+
+def csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, (list, dict)):
+        return json.dumps(value)
+    return value
+
+
+def ndjson_chunk(rows):
+    return "".join(json.dumps(row, default=str) + "\n" for row in rows)
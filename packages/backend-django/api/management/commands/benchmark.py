@@ -0,0 +1,119 @@
+import importlib
+import json
+import platform
+import sqlite3
+import subprocess
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from api.benchmarks.base import benchmark_database
+
+SCENARIOS = ["endpoints", "registrations", "students", "search", "bulk_register", "export", "concurrency", "asgi", "fast_read", "payload"]
+# Latency figures compared against a baseline; queries are compared exactly
+COMPARED_LATENCIES = ["p50_ms", "p95_ms"]
+
+
+class Command(BaseCommand):
+    help = "Run an endpoint benchmark scenario against a throwaway database and report latency"
+
+    def add_arguments(self, parser):
+        parser.add_argument("scenario", choices=SCENARIOS)
+        parser.add_argument("--sizes", type=int, nargs="+", help="Row counts to seed, one run per size")
+        parser.add_argument("--iterations", type=int, default=20, help="Requests per measured URL")
+        parser.add_argument("--output", help="Write results as JSON to this path")
+        parser.add_argument("--baseline", help="Compare against results previously written with --output")
+        parser.add_argument(
+            "--tolerance", type=float, default=0.2,
+            help="Fractional latency increase over the baseline reported as a regression (default 0.2)",
+        )
+
+    def handle(self, *args, **options):
+        if options["iterations"] < 1:
+            raise CommandError("--iterations must be at least 1")
+        baseline = self.load_baseline(options["baseline"]) if options["baseline"] else None
+        scenario = importlib.import_module(f"api.benchmarks.{options['scenario']}")
+
+        with benchmark_database():
+            results = scenario.run(options["sizes"], options["iterations"], self.stdout)
+
+        self.stdout.write(
+            f"{'scenario':<24}{'rows':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'queries':>9}{'alloc KiB':>11}"
+            f"{'req/s':>9}{'wire KiB':>10}"
+        )
+        for result in results:
+            self.stdout.write(
+                f"{result['scenario']:<24}{result['rows']:>10}{result['p50_ms']:>10.2f}"
+                f"{result['p95_ms']:>10.2f}{result['p99_ms']:>10.2f}{self.optional(result, 'queries', 9, 'd')}"
+                f"{self.optional(result, 'alloc_kib', 11, '.1f')}{self.optional(result, 'ops_per_s', 9, '.0f')}"
+                f"{self.optional(result, 'wire_kib', 10, '.1f')}"
+            )
+
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                json.dump({"environment": self.environment(), "results": results}, f, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"Results written to {options['output']}"))
+
+        if baseline is not None:
+            regressions = self.compare(results, baseline, options["tolerance"])
+            if regressions:
+                raise CommandError(f"{regressions} results regressed against {options['baseline']}")
+            self.stdout.write(self.style.SUCCESS("No regressions against the baseline."))
+
+    def optional(self, result, key, width, spec):
+        """A column only some scenarios report (e.g. throughput), or a dash."""
+        return f"{result[key]:>{width}{spec}}" if result.get(key) is not None else f"{'-':>{width}}"
+
+    def load_baseline(self, path):
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            raise CommandError(f"Cannot read baseline {path}: {e}")
+        # Files written before the environment block was added are a bare list of results
+        results = data["results"] if isinstance(data, dict) else data
+        return {(result["scenario"], result["rows"]): result for result in results}
+
+    def compare(self, results, baseline, tolerance):
+        """Print each result's change against the baseline and return how many regressed."""
+        self.stdout.write(f"\n{'scenario':<24}{'rows':>10}{'p50':>10}{'p95':>10}{'queries':>10}")
+        regressions = 0
+        for result in results:
+            before = baseline.get((result["scenario"], result["rows"]))
+            if before is None:
+                self.stdout.write(f"{result['scenario']:<24}{result['rows']:>10}  (not in baseline)")
+                continue
+            changes = {
+                key: result[key] / before[key] - 1 if before[key] else 0.0
+                for key in COMPARED_LATENCIES
+            }
+            query_delta = result["queries"] - before["queries"] if "queries" in result and "queries" in before else 0
+            regressed = query_delta > 0 or any(change > tolerance for change in changes.values())
+            line = (
+                f"{result['scenario']:<24}{result['rows']:>10}{changes['p50_ms']:>+10.0%}"
+                f"{changes['p95_ms']:>+10.0%}{query_delta:>+10}"
+            )
+            if result.get("ops_per_s") and before.get("ops_per_s"):
+                throughput = result["ops_per_s"] / before["ops_per_s"] - 1
+                line += f"{throughput:>+10.0%} req/s"
+                regressed = regressed or throughput < -tolerance
+            if regressed:
+                regressions += 1
+                self.stdout.write(self.style.ERROR(f"{line}  REGRESSION"))
+            else:
+                self.stdout.write(line)
+        return regressions
+
+    def environment(self):
+        """Where the results came from, so baselines from different commits or machines can be told apart."""
+        try:
+            commit = subprocess.run(
+                ["git", "rev-parse", "--short", "HEAD"], cwd=settings.BASE_DIR,
+                capture_output=True, text=True, check=True,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            commit = None
+        return {
+            "commit": commit,
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "machine": platform.machine(),
+        }
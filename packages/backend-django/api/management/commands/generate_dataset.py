@@ -0,0 +1,58 @@
+import time
+from datetime import date
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from api.services.bulk_load import clear_tables, refresh_derived_state
+from api.services.dataset_generator import DatasetGenerator
+
+
+class Command(BaseCommand):
+    help = "Replace all data with a seeded synthetic dataset (same seed and counts, same rows)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--yes", action="store_true", help="Don't ask for confirmation")
+        parser.add_argument("--seed", type=int, default=0, help="Random seed")
+        parser.add_argument("--instructors", type=int, default=100)
+        parser.add_argument("--courses", type=int, default=1000)
+        parser.add_argument("--students", type=int, default=10000)
+        parser.add_argument("--registrations", type=int, default=100000)
+        parser.add_argument("--batch-size", type=int, default=10000, help="Rows per executemany call")
+        parser.add_argument(
+            "--today", type=date.fromisoformat, help="Day course dates and timestamps are laid out around "
+            "(YYYY-MM-DD; default 2025-01-01, whatever the run date)",
+        )
+
+    def handle(self, *args, **options):
+        counts = {name: options[name] for name in ("instructors", "courses", "students", "registrations")}
+        for name, count in counts.items():
+            if count < 0:
+                raise CommandError(f"--{name} must not be negative")
+        if counts["courses"] and not counts["instructors"]:
+            raise CommandError("--courses needs at least one instructor")
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be at least 1")
+        if not options["yes"]:
+            confirm = input("This will DELETE ALL EXISTING data and generate a synthetic dataset. Are you sure? [y/N]: ")
+            if confirm.lower() != 'y':
+                self.stdout.write(self.style.WARNING("Operation cancelled."))
+                return
+
+        generator = DatasetGenerator(seed=options["seed"], today=options["today"], batch_size=options["batch_size"])
+        start = time.perf_counter()
+        # One transaction: a failed run leaves the old data in place
+        with transaction.atomic():
+            self.stdout.write("Deleting old data...")
+            clear_tables()
+
+            self.stdout.write(f"Generating data with seed {options['seed']}...")
+            written = generator.generate(**counts)
+            for name, count in written.items():
+                self.stdout.write(f"  {name}: {count} rows")
+            if written["registrations"] < counts["registrations"]:
+                self.stdout.write(self.style.WARNING("  Students ran out of eligible courses; add more courses"))
+
+            self.stdout.write("Rebuilding search index and counters...")
+            refresh_derived_state()
+
+        elapsed = time.perf_counter() - start
+        self.stdout.write(self.style.SUCCESS(f"Synthetic dataset generated in {elapsed:.1f}s."))
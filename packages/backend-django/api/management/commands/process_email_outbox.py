@@ -0,0 +1,22 @@
+import time
+from django.core.management.base import BaseCommand
+from api.services.email_outbox import OutboxDispatcher
+
+
+class Command(BaseCommand):
+    help = "Deliver queued outbox emails, including retries whose backoff has elapsed"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="Drain the outbox once and exit")
+        parser.add_argument("--interval", type=float, default=5.0, help="Seconds between polls")
+
+    def handle(self, *args, **options):
+        dispatcher = OutboxDispatcher()
+        while True:
+            sent, failed = dispatcher.dispatch_pending()
+            if sent or failed:
+                self.stdout.write(f"Sent {sent} emails, {failed} failed")
+            if options["once"]:
+                break
+            time.sleep(options["interval"])
+        self.stdout.write(self.style.SUCCESS("Outbox drained."))
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand, CommandError
+from api.services.search_index import SearchIndex
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search index from the student, instructor and course tables"
+
+    def handle(self, *args, **kwargs):
+        search_index = SearchIndex()
+        if not search_index.is_available():
+            raise CommandError("The search index requires SQLite with FTS5; run migrations first.")
+
+        self.stdout.write("Rebuilding search index...")
+        counts = search_index.rebuild()
+        for entity, count in counts.items():
+            self.stdout.write(f"  {entity}: {count} rows")
+        self.stdout.write(self.style.SUCCESS("Search index rebuilt successfully."))
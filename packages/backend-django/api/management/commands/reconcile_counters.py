@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+from api.signals import counter_service
+
+
+class Command(BaseCommand):
+    help = "Recompute the dashboard counters from the tables and repair any drift"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true", help="Report drift without repairing it")
+
+    def handle(self, *args, **options):
+        counters, drift = counter_service.reconcile(dry_run=options["dry_run"])
+
+        if not drift:
+            self.stdout.write(self.style.SUCCESS("Counters are in sync."))
+            return
+
+        for field, difference in drift.items():
+            self.stdout.write(f"  {field}: off by {difference:+d}")
+        if options["dry_run"]:
+            self.stdout.write(self.style.WARNING("Drift found; run without --dry-run to repair it."))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"Counters repaired: {counters}"))
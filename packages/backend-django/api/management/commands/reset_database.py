@@ -1,92 +1,130 @@
 import json
 import os
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 from django.conf import settings
+from django.db import transaction
 from api.models import Student, Course, Instructor, Registration
+from api.services.bulk_load import clear_tables, refresh_derived_state
 from uuid import UUID
 from datetime import datetime
 
+
 class Command(BaseCommand):
     help = "Reset all data and load sample data from JSON files"
 
-    def handle(self, *args, **kwargs):
-        confirm = input("This will DELETE ALL EXISTING data and reload sample data. Are you sure? [y/N]: ")
-        if confirm.lower() != 'y':
-            self.stdout.write(self.style.WARNING("Operation cancelled."))
-            return
+    def add_arguments(self, parser):
+        parser.add_argument("--yes", action="store_true", help="Don't ask for confirmation")
+        parser.add_argument(
+            "--data-dir",
+            default=os.path.join(settings.BASE_DIR, "data"),
+            help="Directory holding instructors.json, courses.json, students.json and optionally registrations.json",
+        )
+        parser.add_argument("--batch-size", type=int, default=5000, help="Rows per INSERT")
+
+    def handle(self, *args, **options):
+        if not options["yes"]:
+            confirm = input("This will DELETE ALL EXISTING data and reload sample data. Are you sure? [y/N]: ")
+            if confirm.lower() != 'y':
+                self.stdout.write(self.style.WARNING("Operation cancelled."))
+                return
+        self.data_dir = options["data_dir"]
+        self.batch_size = options["batch_size"]
+        if self.batch_size < 1:
+            raise CommandError("--batch-size must be at least 1")
+
+        # One transaction: a failed load leaves the old data in place
+        with transaction.atomic():
+            self.stdout.write("Deleting old data...")
+            clear_tables()
+
+            self.stdout.write("Loading instructors...")
+            self.load_data("instructors.json", Instructor, self.build_instructor)
+
+            self.stdout.write("Loading courses...")
+            courses = self.load_data("courses.json", Course, self.build_course)
 
-        self.stdout.write("Deleting old data...")
-        Student.objects.all().delete()
-        Course.objects.all().delete()
-        Instructor.objects.all().delete()
-        Registration.objects.all().delete()
+            self.stdout.write("Checking course prerequisites...")
+            self.check_prerequisites(courses)
 
-        self.stdout.write("Loading instructors...")
-        self.load_data("instructors.json", self.load_instructor)
- 
-        self.stdout.write("Loading courses...")
-        self.load_data("courses.json", self.load_course)
+            self.stdout.write("Loading students...")
+            self.load_data("students.json", Student, self.build_student)
 
-        self.stdout.write("Loading students...")
-        self.load_data("students.json", self.load_student)
+            if os.path.exists(self.path("registrations.json")):
+                self.stdout.write("Loading registrations...")
+                self.load_data("registrations.json", Registration, self.build_registration)
 
-        # set up some course prerequisites
-        self.stdout.write("Setting up course prerequisites...")
+            # bulk_create skips the save hooks, so refresh everything they maintain
+            self.stdout.write("Rebuilding search index and counters...")
+            refresh_derived_state()
 
         self.stdout.write(self.style.SUCCESS("Sample data reset and loaded successfully."))
 
-    def load_data(self, filename, loader):
-        path = os.path.join(settings.BASE_DIR, "data", filename)
-        with open(path, "r") as f:
-            for record in json.load(f):
-                loader(record)
+    def path(self, filename):
+        return os.path.join(self.data_dir, filename)
 
-    def load_instructor(self, data):
-        Instructor.objects.update_or_create(
+    def load_data(self, filename, model, builder):
+        with open(self.path(filename), "r") as f:
+            records = json.load(f)
+        # A repeated id keeps its last record, as the old row-by-row update_or_create did
+        unique = {record["id"]: record for record in records}
+        if len(unique) < len(records):
+            self.stdout.write(self.style.WARNING(f"  {len(records) - len(unique)} duplicate ids in {filename}"))
+        objects = [builder(record) for record in unique.values()]
+        model.objects.bulk_create(objects, batch_size=self.batch_size)
+        self.stdout.write(f"  {len(objects)} rows")
+        return objects
+
+    def check_prerequisites(self, courses):
+        codes = {course.course_code for course in courses}
+        linked = 0
+        for course in courses:
+            for code in course.prerequisites:
+                if code in codes:
+                    linked += 1
+                else:
+                    self.stdout.write(self.style.WARNING(f"  {course.course_code}: unknown prerequisite {code}"))
+        self.stdout.write(f"  {linked} prerequisite links")
+
+    def build_instructor(self, data):
+        return Instructor(
             id=UUID(data["id"]),
-            defaults={
-                "name_first": data["name_first"],
-                "name_last": data["name_last"],
-                "email": data["email"],
-                "bio": data.get("bio", ""),
-                "created_at": datetime.fromisoformat(data["created_at"]),
-                "updated_at": datetime.fromisoformat(data["updated_at"]),
-            },
+            name_first=data["name_first"],
+            name_last=data["name_last"],
+            email=data["email"],
+            bio=data.get("bio", ""),
         )
 
-    def load_course(self, data):
-        instructor = Instructor.objects.get(id=UUID(data["instructor_id"]))
+    def build_course(self, data):
+        return Course(
+            id=UUID(data["id"]),
+            title=data["title"],
+            course_code=data["course_code"],
+            description=data["description"],
+            description_full=data["description_full"],
+            instructor_id=UUID(data["instructor_id"]),
+            start_date=datetime.fromisoformat(data["start_date"]).date(),
+            end_date=datetime.fromisoformat(data["end_date"]).date(),
+            course_fee=data["course_fee"],
+            syllabus_url=data.get("syllabus_url"),
+            prerequisites=data.get("prerequisites", []),
+        )
 
-        Course.objects.update_or_create(
+    def build_student(self, data):
+        return Student(
             id=UUID(data["id"]),
-            defaults={
-                "title": data["title"],
-                "course_code": data["course_code"],
-                "description": data["description"],
-                "description_full": data["description_full"],
-                "instructor": instructor,
-                "start_date": datetime.fromisoformat(data["start_date"]).date(),
-                "end_date": datetime.fromisoformat(data["end_date"]).date(),
-                "course_fee": data["course_fee"],
-                "syllabus_url": data.get("syllabus_url"),
-                "prerequisites": data.get("prerequisites", []),
-                "created_at": datetime.fromisoformat(data["created_at"]),
-                "updated_at": datetime.fromisoformat(data["updated_at"]),
-            }
+            name_first=data["name_first"],
+            name_last=data["name_last"],
+            email=data["email"],
+            phone=data.get("phone"),
+            company=data.get("company"),
+            notes=data.get("notes"),
         )
 
-    def load_student(self, data):
-        print(f"Loading student: {data['name_first']} {data['name_last']}")
-        Student.objects.update_or_create(
+    def build_registration(self, data):
+        return Registration(
             id=UUID(data["id"]),
-            defaults={
-                "name_first": data["name_first"],
-                "name_last": data["name_last"],
-                "email": data["email"],
-                "phone": data.get("phone"),
-                "company": data.get("company"),
-                "notes": data.get("notes"),
-                "created_at": datetime.fromisoformat(data["created_at"]),
-                "updated_at": datetime.fromisoformat(data["updated_at"]),
-            },
-        )
\ No newline at end of file
+            student_id=UUID(data["student_id"]),
+            course_id=UUID(data["course_id"]),
+            registration_status=data.get("registration_status", "registered"),
+            payment_status=data.get("payment_status", "pending"),
+        )
@@ -0,0 +1,59 @@
+import glob
+import json
+import os
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from api.services.slow_query_log import group_by_fingerprint, read_entries
+
+SORT_KEYS = ["total", "count", "max", "mean"]
+
+
+class Command(BaseCommand):
+    help = "Summarize the slow-query log, grouping repeated statements by fingerprint"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--file", default=settings.SLOW_QUERY_LOG_FILE, help="Log file; its rotated backups are read too")
+        parser.add_argument("--sort", choices=SORT_KEYS, default="total", help="Order groups by total, count, max or mean time")
+        parser.add_argument("--top", type=int, default=20, help="Groups to show")
+        parser.add_argument("--view", help="Only statements from this URL name (e.g. student-list)")
+        parser.add_argument("--json", action="store_true", help="Print the groups as JSON")
+
+    def handle(self, *args, **options):
+        paths = self.log_files(options["file"])
+        if not paths:
+            raise CommandError(f"No slow-query log at {options['file']}")
+
+        entries = read_entries(paths)
+        if options["view"]:
+            entries = (entry for entry in entries if entry.get("view") == options["view"])
+        groups = group_by_fingerprint(entries)
+        sort_key = "count" if options["sort"] == "count" else f"{options['sort']}_ms"
+        groups.sort(key=lambda group: group[sort_key], reverse=True)
+        groups = groups[:options["top"]]
+
+        if options["json"]:
+            self.stdout.write(json.dumps(groups, indent=2))
+            return
+        if not groups:
+            self.stdout.write("No slow queries logged.")
+            return
+
+        for group in groups:
+            self.stdout.write(self.style.WARNING(
+                f"{group['fingerprint']}  {group['count']} x  total {group['total_ms']:.1f} ms  "
+                f"mean {group['mean_ms']:.1f} ms  max {group['max_ms']:.1f} ms"
+            ))
+            self.stdout.write(f"  {group['sql']}")
+            routes = ", ".join(f"{route} ({count})" for route, count in sorted(group["routes"].items(), key=lambda item: -item[1]))
+            self.stdout.write(f"  routes: {routes}")
+            slowest = group["slowest"]
+            self.stdout.write(f"  slowest: {slowest['time']} {slowest.get('path') or ''} params={json.dumps(slowest['params'])}")
+            for line in slowest.get("plan") or []:
+                self.stdout.write(f"    {line}")
+            self.stdout.write("")
+
+    def log_files(self, path):
+        """``path`` and its RotatingFileHandler backups (path.1 is the newest), oldest first."""
+        backups = [name for name in glob.glob(f"{glob.escape(path)}.*") if name.rsplit(".", 1)[1].isdigit()]
+        backups.sort(key=lambda name: int(name.rsplit(".", 1)[1]), reverse=True)
+        return backups + ([path] if os.path.exists(path) else [])
@@ -0,0 +1,45 @@
+# Generated by Django 5.2 on 2026-10-18 19:37
+
+from django.db import migrations, models
+
+
+def create_search_index(apps, schema_editor):
+    # FTS5 is SQLite-only; other backends fall back to icontains search
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')")
+        if not cursor.fetchone()[0]:
+            return
+    schema_editor.execute(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS api_search_index USING fts5("
+        "name, email, title, description, "
+        "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+    )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "sqlite":
+        schema_editor.execute("DROP TABLE IF EXISTS api_search_index")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0002_remove_course_prerequisites_course_prerequisites'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('entity', models.CharField(max_length=20)),
+                ('object_id', models.UUIDField()),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('entity', 'object_id'), name='unique_search_document')],
+            },
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2 on 2026-10-18 19:49
+
+from django.db import migrations, models
+
+
+def seed_counters(apps, schema_editor):
+    counters = {
+        f"{name}_count": apps.get_model("api", name.capitalize()).objects.filter(is_active=True).count()
+        for name in ("student", "instructor", "course", "registration")
+    }
+    apps.get_model("api", "DashboardCounters").objects.update_or_create(pk=1, defaults=counters)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0003_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DashboardCounters',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('student_count', models.IntegerField(default=0)),
+                ('instructor_count', models.IntegerField(default=0)),
+                ('course_count', models.IntegerField(default=0)),
+                ('registration_count', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.RunPython(seed_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2 on 2026-10-18 19:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_email_outbox'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='course',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['created_at', 'id'], name='course_active_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='instructor',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['created_at', 'id'], name='instr_active_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='registration',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['created_at', 'id'], name='reg_active_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='student',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['created_at', 'id'], name='student_active_created_idx'),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2 on 2026-10-18 19:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0006_keyset_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='course',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['end_date', 'start_date'], name='course_active_dates_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='course',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['instructor', 'end_date'], name='course_instr_end_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='instructor',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['name_last'], name='instr_active_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='registration',
+            index=models.Index(fields=['student', 'registration_status', 'course'], name='reg_student_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='registration',
+            index=models.Index(fields=['course', 'registration_status', 'student'], name='reg_course_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='registration',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['student', 'created_at'], name='reg_student_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='registration',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['course', 'created_at'], name='reg_course_created_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2 on 2026-10-18 20:25
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def seed_versions(apps, schema_editor):
+    TableVersion = apps.get_model("api", "TableVersion")
+    for name in ("Student", "Instructor", "Course", "Registration"):
+        TableVersion.objects.get_or_create(table=apps.get_model("api", name)._meta.db_table)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_hot_path_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TableVersion',
+            fields=[
+                ('table', models.CharField(max_length=64, primary_key=True, serialize=False)),
+                ('version', models.BigIntegerField(default=0)),
+                ('changed_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+        ),
+        migrations.RunPython(seed_versions, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,17 @@
 import uuid
-from django.db import models
+from django.db import models, transaction
+from django.utils import timezone
+
+
+class AtomicSaveModel(models.Model):
+    """Runs save() and its post_save hooks (search index, dashboard counters) in one transaction."""
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        with transaction.atomic(using=kwargs.get("using")):
+            super().save(*args, **kwargs)
 
 
 class Department(models.Model):
@@ -29,7 +41,7 @@ class Address(models.Model):
         return f"{self.street}, {self.city}, {self.state} {self.postal_code}, {self.country}"
 
 
-class Instructor(models.Model):
+class Instructor(AtomicSaveModel):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
 
     department = models.ForeignKey("Department", on_delete=models.SET_NULL, null=True, blank=True, related_name="instructors")
@@ -43,11 +55,19 @@ class Instructor(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # Keyset pagination: WHERE is_active ORDER BY created_at DESC, id DESC
+            models.Index(fields=["created_at", "id"], condition=models.Q(is_active=True), name="instr_active_created_idx"),
+            # Default list ordering (OrderingFilter on name_last)
+            models.Index(fields=["name_last"], condition=models.Q(is_active=True), name="instr_active_name_idx"),
+        ]
+
     def __str__(self):
         return f"{self.name_first} {self.name_last}"
 
 
-class Course(models.Model):
+class Course(AtomicSaveModel):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     course_code = models.CharField(max_length=20, unique=True)
     title = models.CharField(max_length=200)
@@ -63,11 +83,20 @@ class Course(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     prerequisites = models.JSONField(default=list, blank=True, help_text='List of course codes that must be completed before enrolling in this course.')
 
+    class Meta:
+        indexes = [
+            # Keyset pagination: WHERE is_active ORDER BY created_at DESC, id DESC
+            models.Index(fields=["created_at", "id"], condition=models.Q(is_active=True), name="course_active_created_idx"),
+            # active_courses filter: start_date <= today <= end_date
+            models.Index(fields=["end_date", "start_date"], condition=models.Q(is_active=True), name="course_active_dates_idx"),
+            # Instructor destroy check and instructor_id filter
+            models.Index(fields=["instructor", "end_date"], condition=models.Q(is_active=True), name="course_instr_end_idx"),
+        ]
 
     def __str__(self):
         return self.title
 
-class Student(models.Model):
+class Student(AtomicSaveModel):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
 
     name_first = models.CharField(max_length=100)
@@ -81,12 +110,18 @@ class Student(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # Keyset pagination: WHERE is_active ORDER BY created_at DESC, id DESC
+            models.Index(fields=["created_at", "id"], condition=models.Q(is_active=True), name="student_active_created_idx"),
+        ]
+
     def __str__(self):
         return f"{self.name_first} {self.name_last}"
 
 
  
-class Registration(models.Model):
+class Registration(AtomicSaveModel):
     PAYMENT_STATUS_CHOICES = [
         ("pending", "Pending"),
         ("completed", "Completed"),
@@ -111,8 +146,89 @@ class Registration(models.Model):
     registration_status = models.CharField(max_length=10, choices=REGISTRATION_STATUS_CHOICES, default="registered")
     payment_status = models.CharField(max_length=10, choices=PAYMENT_STATUS_CHOICES, default="pending")
 
+    class Meta:
+        indexes = [
+            # Keyset pagination: WHERE is_active ORDER BY created_at DESC, id DESC
+            models.Index(fields=["created_at", "id"], condition=models.Q(is_active=True), name="reg_active_created_idx"),
+            # Duplicate, prerequisite and student destroy checks: (student, status[, course])
+            models.Index(fields=["student", "registration_status", "course"], name="reg_student_status_idx"),
+            # Student course/instructor filters: (course, status) -> student
+            models.Index(fields=["course", "registration_status", "student"], name="reg_course_status_idx"),
+            # Registration lists filtered by student or course, newest first
+            models.Index(fields=["student", "created_at"], condition=models.Q(is_active=True), name="reg_student_created_idx"),
+            models.Index(fields=["course", "created_at"], condition=models.Q(is_active=True), name="reg_course_created_idx"),
+        ]
+
     def __str__(self):
         return f"{self.student} → {self.course} ({self.payment_status})"
     
 
-    
\ No newline at end of file
+    
+
+class SearchDocument(models.Model):
+    """Maps a row of the ``api_search_index`` FTS5 table (by rowid) back to the object it indexes."""
+    entity = models.CharField(max_length=20)
+    object_id = models.UUIDField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["entity", "object_id"], name="unique_search_document"),
+        ]
+
+    def __str__(self):
+        return f"{self.entity}:{self.object_id}"
+
+
+class DashboardCounters(models.Model):
+    """Single row of active-object counts, adjusted in the same transaction as each write."""
+    student_count = models.IntegerField(default=0)
+    instructor_count = models.IntegerField(default=0)
+    course_count = models.IntegerField(default=0)
+    registration_count = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return (
+            f"{self.student_count} students, {self.instructor_count} instructors, "
+            f"{self.course_count} courses, {self.registration_count} registrations"
+        )
+
+
+class OutboxEmail(models.Model):
+    """An email written in the sender's transaction and delivered after commit by OutboxDispatcher."""
+    STATUS_CHOICES = [
+        ("pending", "Pending"),
+        ("sending", "Sending"),
+        ("sent", "Sent"),
+        ("failed", "Failed"),
+    ]
+
+    recipient = models.EmailField()
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default="pending")
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    claimed_by = models.UUIDField(null=True, blank=True)
+    claimed_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "next_attempt_at"], name="outbox_due_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.recipient}: {self.subject} ({self.status})"
+
+
+class TableVersion(models.Model):
+    """Write counter for one table, bumped in the same transaction as each write; feeds ETag/Last-Modified."""
+    table = models.CharField(max_length=64, primary_key=True)
+    version = models.BigIntegerField(default=0)
+    changed_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return f"{self.table} v{self.version}"
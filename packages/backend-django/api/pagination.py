@@ -0,0 +1,228 @@
+import uuid
+from base64 import b64decode, b64encode
+from datetime import datetime
+from urllib import parse
+from django.conf import settings
+from django.core.paginator import Paginator as DjangoPaginator
+from django.db.models import Q
+from django.db.models.lookups import Exact
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import Cursor, CursorPagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+from .services.counters import COUNTED_MODELS
+from .signals import counter_service
+
+
+def capped_count(queryset, cap):
+    """Count rows up to ``cap + 1``; callers report ``cap`` as a lower bound beyond that.
+
+    Only the primary keys are selected, unordered, so the limited subquery carries no
+    annotations or joins from select_related and SQLite can stop at any index on the filters.
+    """
+    return queryset.order_by().values("pk")[:cap + 1].count()
+
+
+def lists_active_rows(queryset):
+    """Whether ``queryset`` selects exactly the rows DashboardCounters counts for its model.
+
+    True when the only conditions are ``is_active=True`` on the model's own table (joins from
+    select_related and annotations don't change the row count); any other filter makes it False.
+    """
+    query = queryset.query
+    if queryset.model not in COUNTED_MODELS or query.distinct or query.combinator or query.is_sliced:
+        return False
+    where = query.where
+    if where.connector != "AND" or where.negated or not where.children:
+        return False
+    return all(
+        isinstance(condition, Exact)
+        and getattr(condition.lhs, "alias", None) == query.base_table
+        and condition.lhs.target.name == "is_active"
+        and condition.rhs is True
+        for condition in where.children
+    )
+
+
+class CheapCountPaginator(DjangoPaginator):
+    """A Paginator whose count avoids ``COUNT(*)`` over the whole filtered queryset.
+
+    Unfiltered lists of active rows read the maintained DashboardCounters row. Filtered lists
+    count at most PAGINATION_COUNT_CAP rows, or up to the end of the requested page if that is
+    further, so the page and its ``next`` link are always right; ``count_is_exact`` is False when
+    more rows matched than were counted, and ``reported_count`` is then the number counted.
+    ``needs_exact_count`` (set for ``?page=last``) counts filtered lists in full.
+    """
+    count_is_exact = True
+    needs_exact_count = False
+    requested_page = 1
+
+    def page(self, number):
+        try:
+            self.requested_page = max(int(number), 1)
+        except (TypeError, ValueError):
+            pass
+        return super().page(number)
+
+    @cached_property
+    def count(self):
+        if lists_active_rows(self.object_list):
+            return counter_service.count_for(self.object_list.model)
+        if self.needs_exact_count:
+            return super().count
+        limit = max(settings.PAGINATION_COUNT_CAP, self.requested_page * self.per_page)
+        counted = capped_count(self.object_list, limit)
+        # One row past the limit is kept in the count so the page after it still exists
+        self.count_is_exact = counted <= limit
+        return counted
+
+    @property
+    def reported_count(self):
+        return self.count if self.count_is_exact else self.count - 1
+
+
+class KeysetCursorPagination(CursorPagination):
+    """Keyset pagination on (created_at, id), newest first.
+
+    DRF's CursorPagination positions on the first ordering field only and steps over rows sharing
+    it with an offset. Here the cursor holds both columns of the last (or, going back, first) row
+    seen, and a page is the rows strictly past it: ``created_at <= c AND (created_at < c OR id < i)``,
+    a range scan on the matching (created_at, id) index. Deep pages cost the same as the first
+    one, ties included. The ``ordering`` query parameter is ignored in this mode.
+    """
+    ordering = ("-created_at", "-id")
+    page_size = 25
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+    def get_ordering(self, request, queryset, view):
+        return self.ordering
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.base_url = request.build_absolute_uri()
+        self.cursor = self.decode_cursor(request)
+        reverse, position = (False, None) if self.cursor is None else (self.cursor.reverse, self.cursor.position)
+
+        if reverse:
+            queryset = queryset.order_by("created_at", "id")
+        else:
+            queryset = queryset.order_by(*self.ordering)
+        if position is not None:
+            created_at, pk = position
+            if reverse:
+                queryset = queryset.filter(Q(created_at__gt=created_at) | Q(id__gt=pk), created_at__gte=created_at)
+            else:
+                queryset = queryset.filter(Q(created_at__lt=created_at) | Q(id__lt=pk), created_at__lte=created_at)
+
+        # One extra row tells whether there is a page beyond this one
+        results = list(queryset[:self.page_size + 1])
+        self.page = results[:self.page_size]
+        has_more = len(results) > self.page_size
+        if reverse:
+            self.page.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, position is not None
+        # An empty page (its rows deleted since) keeps the cursor's own position both ways
+        self.next_position = self.position_of(self.page[-1]) if self.page else position
+        self.previous_position = self.position_of(self.page[0]) if self.page else position
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+        return self.page
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        return self.encode_cursor(Cursor(offset=0, reverse=False, position=self.next_position))
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        return self.encode_cursor(Cursor(offset=0, reverse=True, position=self.previous_position))
+
+    @staticmethod
+    def position_of(row):
+        # Fast list reads page values() dicts, the serializer path model instances
+        if isinstance(row, dict):
+            return row["created_at"], row["id"]
+        return row.created_at, row.pk
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+        try:
+            tokens = parse.parse_qs(b64decode(encoded.encode("ascii")).decode("ascii"), keep_blank_values=True)
+            reverse = bool(int(tokens.get("r", ["0"])[0]))
+            position = None
+            if "c" in tokens:
+                position = (datetime.fromisoformat(tokens["c"][0]), uuid.UUID(tokens["i"][0]))
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+        return Cursor(offset=0, reverse=reverse, position=position)
+
+    def encode_cursor(self, cursor):
+        tokens = {}
+        if cursor.reverse:
+            tokens["r"] = "1"
+        if cursor.position is not None:
+            created_at, pk = cursor.position
+            tokens["c"] = created_at.isoformat()
+            tokens["i"] = str(pk)
+        encoded = b64encode(parse.urlencode(tokens).encode("ascii")).decode("ascii")
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+
+class StandardResultsSetPagination(PageNumberPagination):
+    """Page-number pagination, or keyset cursor pagination when requested.
+
+    Pass ``?pagination=cursor`` to start a cursor walk; the ``next``/``previous`` links carry a
+    ``cursor`` parameter that keeps later pages in cursor mode.
+
+    Page-number responses carry ``count_is_exact`` next to ``count``. With FAST_PAGINATION_COUNTS
+    on, counts come from CheapCountPaginator: exact for unfiltered lists, capped for filtered ones.
+    """
+    page_size = 25
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+    cursor_paginator = None
+
+    @staticmethod
+    def wants_cursor(request):
+        return request.query_params.get("pagination") == "cursor" or "cursor" in request.query_params
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.wants_cursor(request):
+            self.cursor_paginator = KeysetCursorPagination()
+            return self.cursor_paginator.paginate_queryset(queryset, request, view)
+        self.cursor_paginator = None
+        self.django_paginator_class = CheapCountPaginator if settings.FAST_PAGINATION_COUNTS else DjangoPaginator
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_page_number(self, request, paginator):
+        if request.query_params.get(self.page_query_param) in self.last_page_strings:
+            # The last page is only known from a full count
+            paginator.needs_exact_count = True
+        return super().get_page_number(request, paginator)
+
+    def get_paginated_response(self, data):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_paginated_response(data)
+        paginator = self.page.paginator
+        return Response({
+            "count": getattr(paginator, "reported_count", paginator.count),
+            "count_is_exact": getattr(paginator, "count_is_exact", True),
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        schema = super().get_paginated_response_schema(schema)
+        schema["properties"]["count_is_exact"] = {"type": "boolean", "example": True}
+        return schema
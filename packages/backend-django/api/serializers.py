@@ -1,13 +1,57 @@
+from django.core.exceptions import ImproperlyConfigured
 from rest_framework import serializers
 from .models import Instructor, Course, Student, Registration
-
-class InstructorSerializer(serializers.ModelSerializer):
+from .timing import TimedRepresentationMixin
+
+def full_name(first, last):
+    return f"{first} {last}"
+
+
+class SparseFieldsMixin:
+    """Serializer mixin for ``?fields=`` and ``?expand=`` (see ``api.fieldsets.SparseFieldsetMixin``).
+
+    ``fields`` keeps only the named fields; ``expand`` adds each named relation from
+    ``Meta.expandable`` (name -> (serializer, select_related paths)) as a nested object.
+    ``Meta.field_columns`` names the columns a computed field reads, ``()`` for annotations.
+    """
+
+    def __init__(self, *args, fields=None, expand=(), **kwargs):
+        super().__init__(*args, **kwargs)
+        self.expand = list(expand)
+        for name in self.expand:
+            serializer_class, _ = self.Meta.expandable[name]
+            self.fields[name] = serializer_class(read_only=True)
+        if fields is not None:
+            for name in set(self.fields) - set(fields) - set(self.expand):
+                self.fields.pop(name)
+
+    def columns(self):
+        """The ``only()`` paths covering every kept field; expanded relations load whole rows."""
+        field_columns = getattr(self.Meta, "field_columns", {})
+        columns = set(self.expand)
+        for name, field in self.fields.items():
+            if name in self.expand:
+                continue
+            if name in field_columns:
+                columns.update(field_columns[name])
+            elif field.source_attrs:
+                columns.add("__".join(field.source_attrs))
+            else:
+                raise ImproperlyConfigured(f"{type(self).__name__}.Meta.field_columns has no entry for {name!r}")
+        # A partial path under an expanded relation would defer the nested object's other columns
+        return {
+            column for column in columns
+            if not any(column.startswith(f"{relation}__") for relation in self.expand)
+        }
+
+
+class InstructorSerializer(SparseFieldsMixin, TimedRepresentationMixin, serializers.ModelSerializer):
     class Meta:
         model = Instructor
         fields = '__all__'
 
 
-class CourseSerializer(serializers.ModelSerializer):
+class CourseSerializer(SparseFieldsMixin, TimedRepresentationMixin, serializers.ModelSerializer):
     instructor_id = serializers.UUIDField(source="instructor.id")
     prerequisites = serializers.ListField(child=serializers.CharField())
     
@@ -21,6 +65,7 @@ class CourseSerializer(serializers.ModelSerializer):
             "updated_at", "is_active"
         ]
         read_only_fields = ["id", "instructor", "created_at", "updated_at", "is_active"]
+        expandable = {"instructor": (InstructorSerializer, ["instructor"])}
 
     def create(self, validated_data):
         instructor_data = validated_data.pop("instructor", None)
@@ -45,7 +90,7 @@ class CourseSerializer(serializers.ModelSerializer):
 
         return instance
 
-class CourseListSerializer(serializers.ModelSerializer):
+class CourseListSerializer(SparseFieldsMixin, TimedRepresentationMixin, serializers.ModelSerializer):
     instructor_name = serializers.SerializerMethodField(read_only=True)
     enrollment_count = serializers.SerializerMethodField(read_only=True)
     instructor_id = serializers.UUIDField(source="instructor.id", read_only=True)
@@ -60,21 +105,34 @@ class CourseListSerializer(serializers.ModelSerializer):
             "created_at", "updated_at",
             "instructor_name", "enrollment_count", "course_code", "prerequisites"
         ]
+        expandable = {"instructor": (InstructorSerializer, ["instructor"])}
+        field_columns = {
+            "instructor_name": ["instructor__name_first", "instructor__name_last"],
+            "enrollment_count": [],
+        }
+        row_values = {
+            "instructor_name": (["instructor__name_first", "instructor__name_last"], full_name),
+            "enrollment_count": (["enrollment_count"], None),
+        }
 
     def get_instructor_name(self, obj):
-        return f"{obj.instructor.name_first} {obj.instructor.name_last}"
+        return full_name(obj.instructor.name_first, obj.instructor.name_last)
 
     def get_enrollment_count(self, obj):
+        # CourseViewSet.list annotates the count; fall back to a query otherwise
+        enrollment_count = getattr(obj, "enrollment_count", None)
+        if enrollment_count is not None:
+            return enrollment_count
         return Registration.objects.filter(course=obj).count()
     
 
     
-class StudentSerializer(serializers.ModelSerializer):
+class StudentSerializer(SparseFieldsMixin, TimedRepresentationMixin, serializers.ModelSerializer):
     class Meta:
         model = Student
         fields = '__all__'
 
-class RegistrationSerializer(serializers.ModelSerializer):
+class RegistrationSerializer(SparseFieldsMixin, TimedRepresentationMixin, serializers.ModelSerializer):
     student_id = serializers.UUIDField(source="student.id", read_only=True)
     course_id = serializers.UUIDField(source="course.id", read_only=True)
     student_name = serializers.SerializerMethodField(read_only=True)
@@ -86,9 +144,22 @@ class RegistrationSerializer(serializers.ModelSerializer):
             "id", "student_id", "student_name", "course_id", "course_name",
             "created_at", "updated_at", "registered_at", "registration_status", "payment_status"
         ]
+        expandable = {
+            "student": (StudentSerializer, ["student"]),
+            # CourseSerializer reads instructor.id, so join the instructor too
+            "course": (CourseSerializer, ["course__instructor"]),
+        }
+        field_columns = {
+            "student_name": ["student__name_first", "student__name_last"],
+            "course_name": ["course__title"],
+        }
+        row_values = {
+            "student_name": (["student__name_first", "student__name_last"], full_name),
+            "course_name": (["course__title"], None),
+        }
 
     def get_student_name(self, obj):
-        return f"{obj.student.name_first} {obj.student.name_last}"
+        return full_name(obj.student.name_first, obj.student.name_last)
 
     def get_course_name(self, obj):
         return obj.course.title
\ No newline at end of file
@@ -0,0 +1,69 @@
+from operator import attrgetter
+from django.db import connection
+from ..models import Instructor, Course, Student, Registration, SearchDocument
+from ..signals import search_index, counter_service, prerequisite_service, table_versions
+from .search_index import TABLE as SEARCH_INDEX_TABLE
+
+
+def clear_tables():
+    """Empty the student, instructor, course and registration tables with plain DELETEs.
+
+    QuerySet.delete() would load every row to send per-object delete signals. Call
+    ``refresh_derived_state`` once the tables hold their new contents.
+    """
+    with connection.cursor() as cursor:
+        for model in (Registration, Course, Student, Instructor, SearchDocument):
+            cursor.execute(f"DELETE FROM {model._meta.db_table}")
+        if search_index.is_available():
+            cursor.execute(f"DELETE FROM {SEARCH_INDEX_TABLE}")
+
+
+def refresh_derived_state():
+    """Rebuild what the save hooks maintain, after writes that bypassed them."""
+    if search_index.is_available():
+        search_index.rebuild()
+    counter_service.reconcile()
+    table_versions.bump(Instructor, Course, Student, Registration)
+    prerequisite_service.invalidate()
+
+
+class ChunkedInserter:
+    """Buffers rows for one table and writes them with ``executemany`` every ``batch_size`` rows.
+
+    This skips model instances and per-value field preparation entirely, so rows must already
+    hold database values in ``field_names`` order (e.g. UUIDs through ``uuid_adapter``).
+    """
+
+    def __init__(self, model, field_names, batch_size=10000):
+        quote = connection.ops.quote_name
+        columns = [model._meta.get_field(name).column for name in field_names]
+        self.sql = "INSERT INTO {} ({}) VALUES ({})".format(
+            quote(model._meta.db_table),
+            ", ".join(quote(column) for column in columns),
+            ", ".join(["%s"] * len(columns)),
+        )
+        self.batch_size = batch_size
+        self.rows = []
+        self.count = 0
+
+    def add(self, row):
+        self.rows.append(row)
+        if len(self.rows) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if self.rows:
+            with connection.cursor() as cursor:
+                cursor.executemany(self.sql, self.rows)
+            self.count += len(self.rows)
+            self.rows = []
+
+
+def uuid_adapter():
+    """Return a function giving a UUID as the database stores a UUIDField (hex text without a native type).
+
+    Resolve it once per load: looking the connection up for every row costs more than the insert.
+    """
+    if connection.features.has_native_uuid_field:
+        return lambda value: value
+    return attrgetter("hex")
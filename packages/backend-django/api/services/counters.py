@@ -0,0 +1,72 @@
+from asgiref.sync import sync_to_async
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+from ..models import Instructor, Course, Student, Registration, DashboardCounters
+
+COUNTER_ROW_ID = 1
+
+# model -> DashboardCounters field holding its number of active rows
+COUNTED_MODELS = {
+    Student: "student_count",
+    Instructor: "instructor_count",
+    Course: "course_count",
+    Registration: "registration_count",
+}
+
+
+class CounterService:
+    """Maintains the single DashboardCounters row of active Student, Instructor, Course and Registration counts."""
+
+    def adjust(self, model, delta):
+        """Add ``delta`` to ``model``'s counter; called from write hooks inside the write's transaction."""
+        if not delta:
+            return
+        field = COUNTED_MODELS[model]
+        updated = DashboardCounters.objects.filter(pk=COUNTER_ROW_ID).update(
+            updated_at=timezone.now(), **{field: F(field) + delta}
+        )
+        if not updated:
+            # The row is missing (e.g. after a flush); a recount already includes this write
+            self.reconcile()
+
+    def read(self):
+        counters = DashboardCounters.objects.filter(pk=COUNTER_ROW_ID).first()
+        if counters is None:
+            counters, _ = self.reconcile()
+        return counters
+
+    async def aread(self):
+        """``read`` for async views: the row through the async ORM, reconciling in a thread if it is missing."""
+        counters = await DashboardCounters.objects.filter(pk=COUNTER_ROW_ID).afirst()
+        if counters is None:
+            counters, _ = await sync_to_async(self.reconcile)()
+        return counters
+
+    def count_for(self, model):
+        """The maintained number of active rows for ``model``."""
+        return getattr(self.read(), COUNTED_MODELS[model])
+
+    def recount(self):
+        return {
+            field: model.objects.filter(is_active=True).count()
+            for model, field in COUNTED_MODELS.items()
+        }
+
+    @transaction.atomic
+    def reconcile(self, dry_run=False):
+        """Recompute every counter from the tables and return the row and the drift that was found."""
+        actual = self.recount()
+        counters = DashboardCounters.objects.select_for_update().filter(pk=COUNTER_ROW_ID).first()
+        if counters is None:
+            counters = DashboardCounters(pk=COUNTER_ROW_ID)
+        drift = {
+            field: getattr(counters, field) - count
+            for field, count in actual.items()
+            if getattr(counters, field) != count
+        }
+        if not dry_run:
+            for field, count in actual.items():
+                setattr(counters, field, count)
+            counters.save()
+        return counters, drift
@@ -0,0 +1,245 @@
+import random
+import uuid
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from django.db import connection
+from ..models import Instructor, Course, Student, Registration
+from .bulk_load import ChunkedInserter, uuid_adapter
+
+FIRST_NAMES = [
+    "Elowen", "Luna", "Orrin", "Thistle", "Caspian", "Wren", "Isolde", "Fenwick", "Marigold", "Ambrose",
+    "Seraphine", "Tobias", "Juniper", "Alaric", "Briony", "Cedric", "Ottilie", "Percival", "Rowan", "Sabine",
+]
+LAST_NAMES = [
+    "Thatch", "Stargazer", "Hollowell", "Quill", "Ashdown", "Brambleby", "Cinderfell", "Dunmore", "Evergreen",
+    "Fairweather", "Glimmer", "Hawthorne", "Ironwood", "Larkspur", "Moonwhistle", "Nettlefield", "Oakhart",
+]
+SUBJECTS = [
+    "UNICORN", "DRAGON", "POTION", "RUNE", "ASTRO", "GOLEM", "HERB", "CHRONO", "GRIFFIN", "ILLUSION",
+    "WARD", "ALCHEMY", "SCRY", "FAE", "STORM", "CRYSTAL",
+]
+LEVEL_TITLES = {1: "Foundations of", 2: "Applied", 3: "Advanced", 4: "Mastery of"}
+COMPANIES = [None, "The Ætheric Forge", "Moonlit Apothecary", "Guild of Wandwrights", "Dragonback Couriers"]
+# (value, cumulative weight) for random.choices
+REGISTRATION_STATUSES = (["registered", "waitlisted", "cancelled"], [92, 96, 100])
+PAYMENT_STATUSES = (["completed", "pending", "failed"], [80, 95, 100])
+COURSES_PER_SUBJECT = 24
+LEVELS = 4
+HISTORY_DAYS = 730
+# Course dates and timestamps are laid out around this day unless told otherwise, so a seed gives
+# the same rows whatever day it runs (benchmark baselines from different days compare equal data)
+DEFAULT_TODAY = date(2025, 1, 1)
+
+
+class DatasetGenerator:
+    """Writes a deterministic synthetic dataset straight into the tables.
+
+    The same ``seed``, counts and ``today`` (default DEFAULT_TODAY) always give the same rows, ids
+    and dates included. Courses are grouped into subjects with four levels; a course above level 1
+    requires one or two lower-level courses of its subject (occasionally of another subject), so
+    prerequisites always form a DAG. Students
+    only register for a course once they hold a "registered" registration for each of its
+    prerequisites, and never twice for the same course.
+
+    Rows go through ``ChunkedInserter``: no save hooks run, so callers clear the tables first and
+    call ``refresh_derived_state`` afterwards (see ``manage.py generate_dataset``).
+    """
+
+    def __init__(self, seed=0, today=None, batch_size=10000):
+        self.rng = random.Random(seed)
+        self.today = today or DEFAULT_TODAY
+        self.batch_size = batch_size
+        anchor = datetime.combine(self.today, time(), tzinfo=dt_timezone.utc)
+        self.history_start = anchor - timedelta(days=HISTORY_DAYS)
+        self.ops = connection.ops
+        self.db_uuid = uuid_adapter()
+
+    def generate(self, instructors, courses, students, registrations):
+        """Insert the rows and return the number written per model."""
+        instructor_ids = self.generate_instructors(instructors)
+        course_ids, course_prerequisites = self.generate_courses(courses, instructor_ids)
+        student_ids = self.generate_students(students)
+        registration_count = self.generate_registrations(registrations, student_ids, course_ids, course_prerequisites)
+        return {
+            "instructors": len(instructor_ids),
+            "courses": len(course_ids),
+            "students": len(student_ids),
+            "registrations": registration_count,
+        }
+
+    def new_id(self):
+        return self.db_uuid(uuid.UUID(int=self.rng.getrandbits(128), version=4))
+
+    def timestamp(self, index, count):
+        """Creation time of row ``index`` of ``count``, spread evenly over the history window."""
+        offset = timedelta(days=HISTORY_DAYS) * (index / max(count, 1))
+        return self.history_start + offset
+
+    def db_datetime(self, value):
+        return self.ops.adapt_datetimefield_value(value)
+
+    def person(self, index):
+        first = self.rng.choice(FIRST_NAMES)
+        last = self.rng.choice(LAST_NAMES)
+        return first, last, f"{first}.{last}.{index}".lower()
+
+    def generate_instructors(self, count):
+        inserter = ChunkedInserter(
+            Instructor,
+            ["id", "name_first", "name_last", "email", "bio", "is_active", "created_at", "updated_at"],
+            self.batch_size,
+        )
+        ids = []
+        for i in range(count):
+            instructor_id = self.new_id()
+            first, last, handle = self.person(i)
+            created = self.db_datetime(self.timestamp(i, count))
+            inserter.add((
+                instructor_id, first, last, f"{handle}@faculty.example.edu",
+                f"Teaches {self.rng.choice(SUBJECTS).lower()} studies.", True, created, created,
+            ))
+            ids.append(instructor_id)
+        inserter.flush()
+        return ids
+
+    def course_code(self, index):
+        """Course ``index`` as (code, subject number, level); codes look like "DRAGON-204"."""
+        subject, position = divmod(index, COURSES_PER_SUBJECT)
+        name = SUBJECTS[subject % len(SUBJECTS)]
+        if subject >= len(SUBJECTS):
+            name += str(subject // len(SUBJECTS))
+        level = 1 + position * LEVELS // COURSES_PER_SUBJECT
+        return f"{name}-{level}{position:02}", subject, level
+
+    def generate_courses(self, count, instructor_ids):
+        """Insert ``count`` courses; return their ids and, per course index, its prerequisite indexes."""
+        if count and not instructor_ids:
+            raise ValueError("Courses need at least one instructor")
+        prerequisites_field = Course._meta.get_field("prerequisites")
+        inserter = ChunkedInserter(
+            Course,
+            [
+                "id", "course_code", "title", "description", "description_full", "instructor", "start_date",
+                "end_date", "course_fee", "syllabus_url", "is_active", "created_at", "updated_at", "prerequisites",
+            ],
+            self.batch_size,
+        )
+        ops = self.ops
+        codes = [self.course_code(i) for i in range(count)]
+        by_subject_level = {}
+        for i, (_, subject, level) in enumerate(codes):
+            by_subject_level.setdefault((subject, level), []).append(i)
+        lower_levels = {}
+        ids = []
+        prerequisites = []
+        for i, (code, subject, level) in enumerate(codes):
+            required = self.pick_prerequisites(subject, level, by_subject_level, lower_levels)
+            prerequisites.append(required)
+            course_id = self.new_id()
+            name = SUBJECTS[subject % len(SUBJECTS)].title()
+            title = f"{LEVEL_TITLES[level]} {name} {i % COURSES_PER_SUBJECT + 1}"
+            start = self.today + timedelta(days=self.rng.randrange(-HISTORY_DAYS, 180))
+            end = start + timedelta(days=self.rng.choice([30, 60, 90, 120]))
+            fee = Decimal(self.rng.randrange(50, 2000, 25))
+            created = self.db_datetime(self.timestamp(i, count))
+            inserter.add((
+                course_id, code, title, f"{title}.", f"A level {level} course on {name.lower()} craft.",
+                self.rng.choice(instructor_ids), ops.adapt_datefield_value(start), ops.adapt_datefield_value(end),
+                ops.adapt_decimalfield_value(fee, 8, 2), None, True, created, created,
+                prerequisites_field.get_db_prep_save([codes[r][0] for r in required], connection),
+            ))
+            ids.append(course_id)
+        inserter.flush()
+        return ids, prerequisites
+
+    def pick_prerequisites(self, subject, level, by_subject_level, lower_levels):
+        if level == 1:
+            return []
+        same_subject = [i for lower in range(1, level) for i in by_subject_level.get((subject, lower), [])]
+        if not same_subject:
+            return []
+        required = set(self.rng.sample(same_subject, min(len(same_subject), self.rng.choice([1, 1, 2]))))
+        if self.rng.random() < 0.1:
+            # Occasional cross-subject requirement, always from a lower level
+            if level not in lower_levels:
+                lower_levels[level] = [
+                    i for (_, lower), members in by_subject_level.items() if lower < level for i in members
+                ]
+            other = self.rng.choice(lower_levels[level])
+            if self.course_code(other)[1] != subject:
+                required.add(other)
+        return sorted(required)
+
+    def generate_students(self, count):
+        inserter = ChunkedInserter(
+            Student,
+            ["id", "name_first", "name_last", "email", "phone", "company", "notes", "is_active", "created_at", "updated_at"],
+            self.batch_size,
+        )
+        rng = self.rng
+        ids = []
+        for i in range(count):
+            student_id = self.new_id()
+            first, last, handle = self.person(i)
+            created = self.db_datetime(self.timestamp(i, count))
+            phone = f"{rng.randrange(200, 1000)}-{rng.randrange(200, 1000)}-{rng.randrange(10000):04}"
+            inserter.add((
+                student_id, first, last, f"{handle}@students.example.edu", phone,
+                rng.choice(COMPANIES), None, True, created, created,
+            ))
+            ids.append(student_id)
+        inserter.flush()
+        return ids
+
+    def generate_registrations(self, count, student_ids, course_ids, course_prerequisites):
+        """Spread ``count`` registrations over the students, following each course's prerequisites.
+
+        A student with no eligible course left stops early, so fewer rows than ``count`` can be
+        written when there are few courses per student.
+        """
+        if not count or not student_ids or not course_ids:
+            return 0
+        inserter = ChunkedInserter(
+            Registration,
+            ["id", "student", "course", "is_active", "created_at", "updated_at", "registered_at",
+             "registration_status", "payment_status"],
+            self.batch_size,
+        )
+        rng = self.rng
+        choices = rng.choices
+        dependents = [[] for _ in course_ids]
+        for course, required in enumerate(course_prerequisites):
+            for prerequisite in required:
+                dependents[prerequisite].append(course)
+        roots = [course for course, required in enumerate(course_prerequisites) if not required]
+        statuses, status_weights = REGISTRATION_STATUSES
+        payments, payment_weights = PAYMENT_STATUSES
+        per_student, extra = divmod(count, len(student_ids))
+        window = HISTORY_DAYS * 86400
+
+        for index, student_id in enumerate(student_ids):
+            wanted = per_student + (index < extra)
+            eligible = list(roots)
+            taken = set()
+            passed = set()
+            for _ in range(wanted):
+                if not eligible:
+                    break
+                pick = rng.randrange(len(eligible))
+                course = eligible[pick]
+                eligible[pick] = eligible[-1]
+                eligible.pop()
+                taken.add(course)
+                status = choices(statuses, cum_weights=status_weights)[0]
+                if status == "registered":
+                    passed.add(course)
+                    for dependent in dependents[course]:
+                        if dependent not in taken and all(r in passed for r in course_prerequisites[dependent]):
+                            eligible.append(dependent)
+                created = self.db_datetime(self.history_start + timedelta(seconds=rng.randrange(window)))
+                inserter.add((
+                    self.new_id(), student_id, course_ids[course], True,
+                    created, created, created, status, choices(payments, cum_weights=payment_weights)[0],
+                ))
+        inserter.flush()
+        return inserter.count
@@ -0,0 +1,124 @@
+import logging
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import connections, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from ..models import OutboxEmail
+
+logger = logging.getLogger(__name__)
+
+# A row left in "sending" this long (e.g. its worker died) is claimed again
+CLAIM_TIMEOUT = timedelta(minutes=5)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.EMAIL_OUTBOX_WORKERS,
+                thread_name_prefix="email-outbox",
+            )
+        return _executor
+
+
+class OutboxDispatcher:
+    """Delivers OutboxEmail rows through Django's EMAIL_BACKEND in batches, retrying with backoff.
+
+    ``wake`` is registered with ``transaction.on_commit`` by EmailService and hands the work to a
+    small thread pool (or runs inline when EMAIL_OUTBOX_WORKERS is 0). Retries that are not yet
+    due are picked up by the next wake or by ``manage.py process_email_outbox``.
+    """
+
+    def __init__(self, batch_size=None, max_attempts=None, backoff_seconds=None):
+        self.batch_size = batch_size or settings.EMAIL_OUTBOX_BATCH_SIZE
+        self.max_attempts = max_attempts or settings.EMAIL_OUTBOX_MAX_ATTEMPTS
+        self.backoff_seconds = backoff_seconds or settings.EMAIL_OUTBOX_BACKOFF_SECONDS
+
+    def wake(self):
+        if settings.EMAIL_OUTBOX_WORKERS <= 0:
+            self.dispatch_pending()
+            return
+        get_executor().submit(self._dispatch_in_worker)
+
+    def _dispatch_in_worker(self):
+        try:
+            self.dispatch_pending()
+        except Exception:
+            logger.exception("Email outbox dispatch failed")
+        finally:
+            # Worker threads own their connections; don't leave them open between jobs
+            connections.close_all()
+
+    def due(self, now):
+        return OutboxEmail.objects.filter(
+            Q(status="pending", next_attempt_at__lte=now) |
+            Q(status="sending", claimed_at__lt=now - CLAIM_TIMEOUT)
+        )
+
+    def claim_batch(self):
+        """Atomically mark up to ``batch_size`` due rows as ours and return them."""
+        now = timezone.now()
+        token = uuid.uuid4()
+        with transaction.atomic():
+            ids = list(self.due(now).order_by("next_attempt_at").values_list("id", flat=True)[:self.batch_size])
+            if not ids:
+                return []
+            # Re-check due-ness in the UPDATE so a concurrent worker can't claim the same rows
+            self.due(now).filter(id__in=ids).update(status="sending", claimed_by=token, claimed_at=now)
+        return list(OutboxEmail.objects.filter(claimed_by=token, status="sending"))
+
+    def dispatch_pending(self):
+        """Send every due email, one batch per backend connection; return (sent, failed) counts."""
+        sent = failed = 0
+        while True:
+            batch = self.claim_batch()
+            if not batch:
+                return sent, failed
+            batch_sent, batch_failed = self.send_batch(batch)
+            sent += batch_sent
+            failed += batch_failed
+
+    def send_batch(self, batch):
+        sent_ids = []
+        failures = []
+        try:
+            with get_connection(fail_silently=False) as backend:
+                for email in batch:
+                    message = EmailMessage(email.subject, email.body, settings.DEFAULT_FROM_EMAIL, [email.recipient])
+                    try:
+                        backend.send_messages([message])
+                        sent_ids.append(email.id)
+                    except Exception as e:
+                        failures.append((email, e))
+        except Exception as e:
+            # Opening the backend failed; everything not yet sent is retried
+            done = set(sent_ids) | {email.id for email, _ in failures}
+            failures += [(email, e) for email in batch if email.id not in done]
+
+        OutboxEmail.objects.filter(id__in=sent_ids).update(
+            status="sent", sent_at=timezone.now(), attempts=F("attempts") + 1, claimed_by=None
+        )
+        for email, error in failures:
+            self.schedule_retry(email, error)
+        return len(sent_ids), len(failures)
+
+    def schedule_retry(self, email, error):
+        email.attempts += 1
+        email.last_error = f"{type(error).__name__}: {error}"
+        email.claimed_by = None
+        if email.attempts >= self.max_attempts:
+            email.status = "failed"
+            logger.error("Giving up on outbox email %s after %s attempts: %s", email.id, email.attempts, error)
+        else:
+            email.status = "pending"
+            email.next_attempt_at = timezone.now() + timedelta(seconds=self.backoff_seconds * 2 ** (email.attempts - 1))
+        email.save(update_fields=["attempts", "last_error", "claimed_by", "status", "next_attempt_at"])
@@ -1,6 +1,39 @@
+from django.db import transaction
+from ..models import OutboxEmail
+from .email_outbox import OutboxDispatcher
+
+
 class EmailService:
+    """Queues emails in the outbox inside the caller's transaction; delivery happens after commit."""
+
+    def __init__(self, dispatcher=None):
+        self.dispatcher = dispatcher or OutboxDispatcher()
+
     def send_registration_email(self, student, course):
-        print(f"[Email Stub] Sent registration email to {student.email} for course {course.title}")
+        self.queue([self.registration_email(student, course)])
+
+    def send_registration_emails(self, pairs):
+        """Queue registration emails for many (student, course) pairs with one insert."""
+        self.queue([self.registration_email(student, course) for student, course in pairs])
 
     def send_unregistration_email(self, student, course):
-        print(f"[Email Stub] Sent unregistration email to {student.email} for course {course.title}")
\ No newline at end of file
+        self.queue([OutboxEmail(
+            recipient=student.email,
+            subject=f"Unregistered from {course.title}",
+            body=f"Hi {student.name_first},\n\nYou have been unregistered from {course.title} ({course.course_code}).",
+        )])
+
+    @staticmethod
+    def registration_email(student, course):
+        return OutboxEmail(
+            recipient=student.email,
+            subject=f"Registered for {course.title}",
+            body=f"Hi {student.name_first},\n\nYou are registered for {course.title} ({course.course_code}), "
+                 f"starting {course.start_date}.",
+        )
+
+    def queue(self, emails):
+        if not emails:
+            return
+        OutboxEmail.objects.bulk_create(emails)
+        transaction.on_commit(self.dispatcher.wake)
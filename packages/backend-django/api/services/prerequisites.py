@@ -0,0 +1,60 @@
+from django.core.cache import cache
+from django.db import transaction
+from ..models import Course, Registration
+from .table_versions import TableVersionService
+
+GRAPH_CACHE_KEY = "api:prerequisite-graph"
+
+
+class PrerequisiteService:
+    """Checks course prerequisites against a cached graph keyed by course code.
+
+    The graph maps every course code to its course id and prerequisite codes. It is built with
+    one query and cached with the Course table's version stamp; a read whose stamp differs
+    rebuilds it, so a Course write in any process reaches every process's cache. Writes in this
+    process also drop it right away (see ``api.signals``).
+    """
+    table_versions = TableVersionService()
+
+    def graph(self):
+        # Read the stamp before the rows: a write in between leaves an older stamp, never an older graph
+        stamp = self.table_versions.stamp(Course)
+        cached = cache.get(GRAPH_CACHE_KEY)
+        if cached is not None and cached["stamp"] == stamp:
+            return cached["graph"]
+        graph = {
+            code: {"id": course_id, "prerequisites": list(prerequisites or [])}
+            for course_id, code, prerequisites in Course.objects.values_list("id", "course_code", "prerequisites")
+        }
+        cache.set(GRAPH_CACHE_KEY, {"stamp": stamp, "graph": graph}, None)
+        return graph
+
+    def invalidate(self):
+        cache.delete(GRAPH_CACHE_KEY)
+        # A graph rebuilt later in the same transaction could still see uncommitted rows
+        transaction.on_commit(lambda: cache.delete(GRAPH_CACHE_KEY))
+
+    def completed_course_ids(self, student_ids, course_ids):
+        """Map each student id to the subset of ``course_ids`` they hold an active registration for."""
+        completed = {}
+        rows = Registration.objects.filter(
+            student_id__in=student_ids,
+            course_id__in=course_ids,
+            registration_status="registered",
+            is_active=True,
+        ).values_list("student_id", "course_id")
+        for student_id, course_id in rows:
+            completed.setdefault(student_id, set()).add(course_id)
+        return completed
+
+    def missing_prerequisites(self, student, course):
+        """Return the prerequisite codes of ``course`` the student has not registered for, in one query."""
+        if not course.prerequisites:
+            return []
+        graph = self.graph()
+        required = {code: graph[code]["id"] for code in course.prerequisites if code in graph}
+        completed = self.completed_course_ids([student.pk], required.values()).get(student.pk, set())
+        return [
+            code for code in course.prerequisites
+            if code not in required or required[code] not in completed
+        ]
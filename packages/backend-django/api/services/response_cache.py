@@ -0,0 +1,36 @@
+import hashlib
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpResponse
+
+CACHE_ALIAS = "responses"
+
+
+class ResponseCache:
+    """Rendered GET responses keyed by path, query params and the response's validator (ETag).
+
+    The ETag is built from the per-table generation stamps the response depends on, so any save
+    or soft delete of those tables moves readers to a new key and a stale page is never served;
+    superseded entries simply age out of the ``responses`` cache (LRU for the local-memory
+    backend). Bodies over RESPONSE_CACHE_MAX_ENTRY_BYTES are not stored.
+    """
+
+    def key(self, request, etag):
+        params = sorted(request.GET.lists())
+        digest = hashlib.md5(f"{request.path}|{params}|{etag}".encode(), usedforsecurity=False).hexdigest()
+        return f"api:response:{digest}"
+
+    def get(self, key):
+        entry = caches[CACHE_ALIAS].get(key)
+        if entry is None:
+            return None
+        content_type, content = entry
+        return HttpResponse(content, content_type=content_type)
+
+    def store(self, key, response):
+        """Post-render callback: keep the rendered body of ``response`` under ``key``."""
+        if len(response.content) <= settings.RESPONSE_CACHE_MAX_ENTRY_BYTES:
+            caches[CACHE_ALIAS].set(key, (response["Content-Type"], response.content))
+
+    def clear(self):
+        caches[CACHE_ALIAS].clear()
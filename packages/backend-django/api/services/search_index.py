@@ -0,0 +1,154 @@
+import re
+from django.db import connection, transaction
+from ..models import Instructor, Course, Student, SearchDocument
+
+TABLE = "api_search_index"
+
+# entity name -> (model, SQL expressions for the name, email, title and description columns)
+ENTITIES = {
+    "student": (Student, "name_first || ' ' || name_last", "email", "''", "''"),
+    "instructor": (Instructor, "name_first || ' ' || name_last", "email", "''", "''"),
+    "course": (Course, "''", "''", "title", "description"),
+}
+
+
+class SearchIndex:
+    """SQLite FTS5 index over student and instructor names and emails, and course titles and descriptions.
+
+    Rows are kept in sync by the signal handlers in ``api.signals``; ``rebuild`` repopulates the
+    index from scratch after bulk loads that bypass signals.
+    """
+
+    def __init__(self):
+        self._available_databases = set()
+
+    def is_available(self):
+        if connection.vendor != "sqlite":
+            return False
+        # Only a positive answer is cached, so migrating a database later is picked up
+        database = connection.settings_dict["NAME"]
+        if database in self._available_databases:
+            return True
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s", [TABLE])
+            if cursor.fetchone() is None:
+                return False
+        self._available_databases.add(database)
+        return True
+
+    @staticmethod
+    def entity_for(model):
+        for entity, (entity_model, *_) in ENTITIES.items():
+            if entity_model is model:
+                return entity
+        raise ValueError(f"{model.__name__} is not indexed for search")
+
+    @staticmethod
+    def columns_for(instance):
+        if isinstance(instance, Course):
+            return ["", "", instance.title, instance.description]
+        return [f"{instance.name_first} {instance.name_last}", instance.email, "", ""]
+
+    @staticmethod
+    def build_match(query):
+        """Turn free text into an FTS5 expression where every word must match as a prefix.
+
+        Punctuated words such as emails become a phrase whose last token is the prefix, so
+        ``ash@pallet.com`` matches ``"ash pallet com"*`` rather than three broad prefix scans.
+        """
+        phrases = []
+        for word in query.lower().split():
+            tokens = re.findall(r"\w+", word)
+            if tokens:
+                phrases.append('"' + " ".join(tokens) + '"*')
+        return " ".join(phrases)
+
+    def index(self, instance):
+        if not instance.is_active:
+            self.remove(instance)
+            return
+        document, _ = SearchDocument.objects.get_or_create(
+            entity=self.entity_for(type(instance)),
+            object_id=instance.pk,
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {TABLE} WHERE rowid = %s", [document.pk])
+            cursor.execute(
+                f"INSERT INTO {TABLE}(rowid, name, email, title, description) VALUES (%s, %s, %s, %s, %s)",
+                [document.pk, *self.columns_for(instance)],
+            )
+
+    def remove(self, instance):
+        document = SearchDocument.objects.filter(
+            entity=self.entity_for(type(instance)),
+            object_id=instance.pk,
+        ).first()
+        if document is None:
+            return
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {TABLE} WHERE rowid = %s", [document.pk])
+        document.delete()
+
+    def _match_sql(self, columns):
+        return (
+            f"SELECT {columns} FROM {TABLE} f "
+            f"JOIN {SearchDocument._meta.db_table} d ON d.id = f.rowid "
+            f"WHERE {TABLE} MATCH %s AND d.entity = %s"
+        )
+
+    def search_ids(self, model, query, limit=None, offset=0):
+        """Return the ids of ``model`` rows matching ``query``, best bm25 rank first."""
+        match = self.build_match(query)
+        if not match:
+            return []
+        sql = self._match_sql("d.object_id") + " ORDER BY f.rank"
+        params = [match, self.entity_for(model)]
+        if limit is not None:
+            sql += " LIMIT %s OFFSET %s"
+            params += [limit, offset]
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return [model._meta.pk.to_python(row[0]) for row in cursor.fetchall()]
+
+    def search(self, queryset, query, limit=None, offset=0):
+        """Return the active objects of ``queryset`` that match ``query``, in rank order."""
+        ids = self.search_ids(queryset.model, query, limit, offset)
+        objects = queryset.filter(is_active=True).in_bulk(ids)
+        return [objects[object_id] for object_id in ids if object_id in objects]
+
+    def count(self, model, query, cap):
+        """Count matches of ``query``, stopping at ``cap + 1`` so broad queries stay cheap."""
+        match = self.build_match(query)
+        if not match:
+            return 0
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT COUNT(*) FROM ({self._match_sql('1')} LIMIT %s)",
+                [match, self.entity_for(model), cap + 1],
+            )
+            return cursor.fetchone()[0]
+
+    @transaction.atomic
+    def rebuild(self):
+        """Repopulate the index from the model tables with set-based SQL and return row counts."""
+        document_table = SearchDocument._meta.db_table
+        counts = {}
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {TABLE}")
+            cursor.execute(f"DELETE FROM {document_table}")
+            for entity, (model, name, email, title, description) in ENTITIES.items():
+                source_table = model._meta.db_table
+                cursor.execute(
+                    f"INSERT INTO {document_table}(entity, object_id) "
+                    f"SELECT %s, id FROM {source_table} WHERE is_active",
+                    [entity],
+                )
+                cursor.execute(
+                    f"INSERT INTO {TABLE}(rowid, name, email, title, description) "
+                    f"SELECT d.id, {name}, {email}, {title}, {description} FROM {document_table} d "
+                    f"JOIN {source_table} s ON s.id = d.object_id WHERE d.entity = %s",
+                    [entity],
+                )
+                counts[entity] = cursor.rowcount
+            cursor.execute(f"INSERT INTO {TABLE}({TABLE}) VALUES ('optimize')")
+        return counts
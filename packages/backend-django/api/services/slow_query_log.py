@@ -0,0 +1,152 @@
+import hashlib
+import json
+import logging
+import os
+import re
+from django.core.signals import setting_changed
+from django.db import DatabaseError, connection, transaction
+from django.dispatch import receiver
+from django.utils.timezone import now
+
+logger = logging.getLogger("api.slow_queries")
+
+# Longer parameter lists (e.g. id__in over a page) are cut down to this many in the log
+MAX_LOGGED_PARAMS = 50
+
+PLACEHOLDER_LISTS = re.compile(r"\(\s*%s(?:\s*,\s*%s)*\s*\)")
+STRING_LITERALS = re.compile(r"'(?:[^']|'')*'")
+NUMBERS = re.compile(r"(?<![\w\"])-?\d+(?:\.\d+)?\b")
+WHITESPACE = re.compile(r"\s+")
+# Only plain DML is explained; SAVEPOINT, DDL, PRAGMA and the like are logged without a plan
+EXPLAINABLE = re.compile(r"\s*(SELECT|INSERT|UPDATE|DELETE)\b", re.IGNORECASE)
+
+
+def normalize(sql):
+    """``sql`` with literals, numbers and IN lists replaced, so statements differing only in values match."""
+    sql = PLACEHOLDER_LISTS.sub("(...)", sql)
+    sql = STRING_LITERALS.sub("?", sql)
+    sql = NUMBERS.sub("?", sql)
+    sql = sql.replace("%s", "?")
+    return WHITESPACE.sub(" ", sql).strip()
+
+
+def fingerprint(sql):
+    return hashlib.md5(normalize(sql).encode()).hexdigest()[:12]
+
+
+class SlowQueryLog:
+    """Writes statements slower than SLOW_QUERY_MS to the ``api.slow_queries`` logger, one JSON object per line.
+
+    Entries carry the parameters, the request's method, path, route and view, a fingerprint of the
+    normalized SQL and the database's query plan. ``settings.LOGGING`` sends the logger to a
+    rotating file, which ``manage.py slow_queries`` summarizes.
+    """
+
+    def record(self, sql, params, many, duration, request=None):
+        entry = {
+            "time": now().isoformat(),
+            "duration_ms": round(duration * 1000, 3),
+            "fingerprint": fingerprint(sql),
+            "sql": sql,
+            "params": self.loggable_params(params, many),
+            "many": many,
+            **self.origin(request),
+            # executemany has no single statement to explain
+            "plan": None if many else self.explain(sql, params),
+        }
+        logger.warning(json.dumps(entry, default=str))
+
+    def loggable_params(self, params, many):
+        if params is None:
+            return None
+        params = list(params)
+        if many:
+            return {"rows": len(params), "first": list(params[0]) if params else None}
+        if len(params) > MAX_LOGGED_PARAMS:
+            return params[:MAX_LOGGED_PARAMS] + [f"... {len(params) - MAX_LOGGED_PARAMS} more"]
+        return params
+
+    def origin(self, request):
+        if request is None:
+            return {"method": None, "path": None, "route": None, "view": None}
+        match = request.resolver_match
+        return {
+            "method": request.method,
+            "path": request.path,
+            "route": match.route if match else None,
+            "view": match.view_name if match else None,
+        }
+
+    def explain(self, sql, params):
+        """The plan rows for ``sql``, or None when it is not DML or the backend cannot explain it.
+
+        The EXPLAIN runs in a savepoint on the request's connection, so a failure rolls back only
+        the savepoint and leaves the request's transaction usable (PostgreSQL aborts it otherwise).
+        """
+        if not EXPLAINABLE.match(sql):
+            return None
+        try:
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute(f"{connection.ops.explain_query_prefix()} {sql}", params)
+                # SQLite rows are (id, parent, notused, detail); PostgreSQL returns one text column
+                return [str(row[-1]) for row in cursor.fetchall()]
+        except (DatabaseError, NotImplementedError):
+            return None
+
+
+@receiver(setting_changed)
+def reopen_log_file(setting, value, **kwargs):
+    """Point the log's file handlers at a changed SLOW_QUERY_LOG_FILE (override_settings in tests)."""
+    if setting != "SLOW_QUERY_LOG_FILE":
+        return
+    for handler in logger.handlers:
+        if isinstance(handler, logging.FileHandler):
+            handler.close()
+            # The handler reopens baseFilename on its next record
+            handler.baseFilename = os.path.abspath(value)
+
+
+def read_entries(paths):
+    """Parse slow-query log files, skipping lines that are not entries (e.g. truncated on rotation)."""
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(entry, dict) and "fingerprint" in entry:
+                    yield entry
+
+
+def group_by_fingerprint(entries):
+    """Summarize entries per fingerprint, keeping the slowest occurrence's parameters and plan."""
+    groups = {}
+    for entry in entries:
+        group = groups.get(entry["fingerprint"])
+        if group is None:
+            group = groups[entry["fingerprint"]] = {
+                "fingerprint": entry["fingerprint"],
+                "sql": normalize(entry["sql"]),
+                "count": 0,
+                "total_ms": 0.0,
+                "max_ms": 0.0,
+                "routes": {},
+                "first_seen": entry["time"],
+                "last_seen": entry["time"],
+                "slowest": entry,
+            }
+        duration = entry["duration_ms"]
+        group["count"] += 1
+        group["total_ms"] += duration
+        if duration >= group["max_ms"]:
+            group["max_ms"] = duration
+            group["slowest"] = entry
+        route = " ".join(part for part in (entry.get("method"), entry.get("view")) if part) or "(no request)"
+        group["routes"][route] = group["routes"].get(route, 0) + 1
+        group["first_seen"] = min(group["first_seen"], entry["time"])
+        group["last_seen"] = max(group["last_seen"], entry["time"])
+    for group in groups.values():
+        group["total_ms"] = round(group["total_ms"], 3)
+        group["mean_ms"] = round(group["total_ms"] / group["count"], 3)
+    return list(groups.values())
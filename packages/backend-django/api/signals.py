@@ -0,0 +1,83 @@
+from django.db.models.signals import post_init, post_save, post_delete
+from django.dispatch import receiver
+from .models import Instructor, Course, Student, Registration
+from .services.counters import CounterService
+from .services.prerequisites import PrerequisiteService
+from .services.search_index import SearchIndex
+from .services.table_versions import TableVersionService
+
+search_index = SearchIndex()
+counter_service = CounterService()
+prerequisite_service = PrerequisiteService()
+table_versions = TableVersionService()
+
+
+@receiver(post_save, sender=Student)
+@receiver(post_save, sender=Instructor)
+@receiver(post_save, sender=Course)
+def update_search_index(sender, instance, **kwargs):
+    # Soft-deleted rows (is_active=False) are dropped from the index by SearchIndex.index
+    if search_index.is_available():
+        search_index.index(instance)
+
+
+@receiver(post_delete, sender=Student)
+@receiver(post_delete, sender=Instructor)
+@receiver(post_delete, sender=Course)
+def remove_from_search_index(sender, instance, **kwargs):
+    if search_index.is_available():
+        search_index.remove(instance)
+
+
+@receiver(post_init, sender=Student)
+@receiver(post_init, sender=Instructor)
+@receiver(post_init, sender=Course)
+@receiver(post_init, sender=Registration)
+def remember_counted_state(sender, instance, **kwargs):
+    # Read from __dict__ so a deferred is_active is not loaded just to track it
+    instance._counted_active = instance.__dict__.get("is_active")
+
+
+@receiver(post_save, sender=Student)
+@receiver(post_save, sender=Instructor)
+@receiver(post_save, sender=Course)
+@receiver(post_save, sender=Registration)
+def update_counters_on_save(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    if created:
+        delta = 1 if instance.is_active else 0
+    elif instance._counted_active is None:
+        # is_active was deferred when loaded, so the transition is unknown; reconcile_counters repairs it
+        delta = 0
+    else:
+        delta = int(instance.is_active) - int(instance._counted_active)
+    counter_service.adjust(sender, delta)
+    instance._counted_active = instance.is_active
+
+
+@receiver(post_delete, sender=Student)
+@receiver(post_delete, sender=Instructor)
+@receiver(post_delete, sender=Course)
+@receiver(post_delete, sender=Registration)
+def update_counters_on_delete(sender, instance, **kwargs):
+    if instance._counted_active:
+        counter_service.adjust(sender, -1)
+
+
+@receiver(post_save, sender=Course)
+@receiver(post_delete, sender=Course)
+def invalidate_prerequisite_graph(sender, **kwargs):
+    prerequisite_service.invalidate()
+
+
+@receiver(post_save, sender=Student)
+@receiver(post_save, sender=Instructor)
+@receiver(post_save, sender=Course)
+@receiver(post_save, sender=Registration)
+@receiver(post_delete, sender=Student)
+@receiver(post_delete, sender=Instructor)
+@receiver(post_delete, sender=Course)
+@receiver(post_delete, sender=Registration)
+def bump_table_version(sender, **kwargs):
+    table_versions.bump(sender)
@@ -0,0 +1,102 @@
+import threading
+from unittest import mock
+from django.db import connections
+from django.test import TransactionTestCase
+from api import views
+from api.async_views import gather_queries
+from api.models import Instructor, Course, Student, Registration
+from api.signals import search_index
+
+
+ # ----------------- Async View Tests -----------------
+class AsyncViewTests(TransactionTestCase):
+    # The async sections query from other threads on their own connections, which only see
+    # committed rows, so this cannot run inside TestCase's per-test transaction
+    def setUp(self):
+        search_index.rebuild()
+        self.instructor = Instructor.objects.create(name_first="Blaine", name_last="Cinnabar", email="blaine@cinnabar.com")
+        self.course = Course.objects.create(
+            course_code="FIRE-101",
+            title="Fire Types",
+            description="Burning questions",
+            description_full="All about fire types",
+            instructor=self.instructor,
+            start_date="2025-01-01",
+            end_date="2025-06-01",
+            course_fee=100.00
+        )
+        self.students = [
+            Student.objects.create(name_first=f"Vulpix{i}", name_last="Cinnabar", email=f"vulpix{i}@cinnabar.com")
+            for i in range(3)
+        ]
+        Registration.objects.create(student=self.students[0], course=self.course, registration_status="registered")
+
+    async def test_search_matches_sync_view(self):
+        for query in ["q=cinnabar", "q=fire", "q=registered", "q=cinnabar&section=students&limit=2"]:
+            sync_response = await self.async_client.get(f"/api/search/?{query}", headers={"Accept": "application/json"})
+            async_response = await self.async_client.get(f"/api/search/async/?{query}")
+            self.assertEqual(async_response.status_code, 200)
+            self.assertEqual(async_response.content, sync_response.content, query)
+
+    async def test_search_sections_run_concurrently(self):
+        threads = set()
+        arrived = threading.Barrier(4, timeout=5)
+        search_section = views.search_section
+
+        def record_thread(*args):
+            threads.add(threading.get_ident())
+            # Every section must be in flight at once for the barrier to open
+            arrived.wait()
+            return search_section(*args)
+
+        with mock.patch("api.async_views.search_section", record_thread):
+            response = await self.async_client.get("/api/search/async/?q=cinnabar")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(threads), 4)
+        self.assertEqual(len(response.json()["students"]), 3)
+
+    async def test_executor_connections_closed_after_each_call(self):
+        used = []
+
+        def query():
+            # The executor thread's own wrapper; ``connection`` is a proxy resolved per thread
+            used.append(connections["default"])
+            return Student.objects.count()
+
+        # close() is a no-op on the in-memory test database, so check it is called whatever CONN_MAX_AGE is
+        wrapper_class = type(connections["default"])
+        with mock.patch.object(wrapper_class, "close", autospec=True, side_effect=wrapper_class.close) as close:
+            self.assertEqual(await gather_queries(query, query), [3, 3])
+        closed = [call.args[0] for call in close.call_args_list]
+        self.assertEqual(len(used), 2)
+        self.assertTrue(all(any(wrapper is other for other in closed) for wrapper in used))
+
+    async def test_search_errors(self):
+        for query, error in [
+            ("", "Missing search query parameter 'q'"),
+            ("q=x&limit=ten", "'limit' must be an integer"),
+            ("q=x&cursor=abc", "'cursor' requires 'section'"),
+            ("q=x&section=students&cursor=!!!", "Invalid cursor."),
+        ]:
+            response = await self.async_client.get(f"/api/search/async/?{query}")
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(response.json(), {"error": error})
+        self.assertEqual((await self.async_client.post("/api/search/async/?q=x")).status_code, 405)
+
+    async def test_dashboard_matches_sync_view(self):
+        sync_response = await self.async_client.get("/api/dashboard-summary/", headers={"Accept": "application/json"})
+        response = await self.async_client.get("/api/dashboard-summary/async/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {
+            "studentCount": 3, "instructorCount": 1, "courseCount": 1, "registrationCount": 1,
+        })
+        self.assertEqual(response.content, sync_response.content)
+        self.assertEqual(response["ETag"], sync_response["ETag"])
+        revalidated = await self.async_client.get("/api/dashboard-summary/async/", headers={"If-None-Match": response["ETag"]})
+        self.assertEqual(revalidated.status_code, 304)
+
+    async def test_server_timing_counts_queries_from_every_thread(self):
+        response = await self.async_client.get("/api/search/async/?q=cinnabar")
+        queries = int(response["Server-Timing"].split('desc="')[1].split(" ")[0])
+        # Every section issues at least its page and count queries
+        self.assertGreaterEqual(queries, 8)
@@ -0,0 +1,111 @@
+import gzip
+import uuid
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from unittest import mock, skipUnless
+from django.test import SimpleTestCase, override_settings
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+from api import compression, renderers
+from api.compression import choose_encoding
+from api.models import Instructor, Student
+from api.renderers import FastJSONRenderer
+
+
+ # ----------------- Renderer Tests -----------------
+class FastJSONRendererTests(SimpleTestCase):
+    def test_matches_drf_renderer(self):
+        data = {
+            "id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+            "created_at": datetime(2025, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc),
+            "start_date": date(2025, 1, 2),
+            "fee": Decimal("12.50"),
+            "fee_string": "12.50",
+            "name": "Poké Ball",
+            "nested": [{"count": 3, "ok": True, "missing": None}],
+        }
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+
+    @skipUnless(renderers.orjson, "orjson is not installed")
+    def test_decimal_datetime_and_uuid_render_through_orjson(self):
+        data = {
+            "id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+            "created_at": datetime(2025, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc),
+            "fee": Decimal("12.50"),
+            "rows": [{"id": uuid.uuid4(), "fee": Decimal("0.10"), "updated_at": datetime(2025, 6, 1, tzinfo=timezone.utc)}],
+        }
+        expected = JSONRenderer().render(data)
+        # The fast path must not fall back to DRF's renderer for these types
+        with mock.patch.object(JSONRenderer, "render", side_effect=AssertionError("fell back to JSONRenderer")):
+            self.assertEqual(FastJSONRenderer().render(data), expected)
+
+    def test_indented_output_uses_drf_renderer(self):
+        data = {"a": [1, 2]}
+        self.assertEqual(
+            FastJSONRenderer().render(data, "application/json; indent=4"),
+            JSONRenderer().render(data, "application/json; indent=4"),
+        )
+
+
+ # ----------------- Compression Tests -----------------
+class ChooseEncodingTests(SimpleTestCase):
+    def test_negotiation(self):
+        with mock.patch.object(compression, "brotli", None):
+            self.assertEqual(choose_encoding("gzip, deflate, br"), "gzip")
+        self.assertIsNone(choose_encoding(""))
+        self.assertIsNone(choose_encoding("identity"))
+        self.assertIsNone(choose_encoding("gzip;q=0"))
+        self.assertEqual(choose_encoding("*"), "br" if compression.brotli else "gzip")
+        self.assertEqual(choose_encoding("br;q=0, *;q=0.5"), "gzip")
+
+    @skipUnless(compression.brotli, "brotli is not installed")
+    def test_prefers_brotli(self):
+        self.assertEqual(choose_encoding("gzip, deflate, br"), "br")
+        self.assertEqual(choose_encoding("gzip, br;q=0.5"), "gzip")
+
+
+@override_settings(COMPRESSION_MIN_BYTES=1024)
+class CompressionMiddlewareTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Instructor.objects.create(name_first="Lorelei", name_last="Ice", email="lorelei@elite.com")
+        for i in range(40):
+            Student.objects.create(name_first=f"Jynx{i}", name_last="Trainer", email=f"jynx{i}@elite.com")
+
+    def test_gzip(self):
+        plain = self.client.get("/api/students/")
+        response = self.client.get("/api/students/", HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", response["Vary"])
+        self.assertLess(len(response.content), len(plain.content))
+        self.assertEqual(int(response["Content-Length"]), len(response.content))
+        self.assertEqual(gzip.decompress(response.content), plain.content)
+
+    @skipUnless(compression.brotli, "brotli is not installed")
+    def test_brotli(self):
+        plain = self.client.get("/api/students/")
+        response = self.client.get("/api/students/", HTTP_ACCEPT_ENCODING="gzip, br")
+        self.assertEqual(response["Content-Encoding"], "br")
+        self.assertEqual(compression.brotli.decompress(response.content), plain.content)
+
+    def test_small_and_unaccepted_bodies_are_sent_as_is(self):
+        self.assertNotIn("Content-Encoding", self.client.get("/api/instructors/", HTTP_ACCEPT_ENCODING="gzip"))
+        response = self.client.get("/api/students/")
+        self.assertNotIn("Content-Encoding", response)
+        self.assertIn("Accept-Encoding", response["Vary"])
+
+    def test_streaming_export(self):
+        plain = b"".join(self.client.get("/api/students/export/").streaming_content)
+        response = self.client.get("/api/students/export/", HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(gzip.decompress(b"".join(response.streaming_content)), plain)
+
+    def test_weak_etag_still_revalidates(self):
+        response = self.client.get("/api/students/", HTTP_ACCEPT_ENCODING="gzip")
+        self.assertTrue(response["ETag"].startswith('W/"'))
+        revalidated = self.client.get("/api/students/", HTTP_ACCEPT_ENCODING="gzip", HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(revalidated.status_code, 304)
+
+    @override_settings(COMPRESSION_MIN_BYTES=None)
+    def test_disabled(self):
+        self.assertNotIn("Content-Encoding", self.client.get("/api/students/", HTTP_ACCEPT_ENCODING="gzip"))
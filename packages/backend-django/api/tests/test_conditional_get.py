@@ -0,0 +1,106 @@
+from unittest import mock
+from rest_framework.test import APITestCase
+from api.models import Instructor, Course, Student, Registration
+from api.fast_read import RowEncoder
+from api.serializers import CourseListSerializer
+
+
+ # ----------------- Conditional GET Tests -----------------
+class ConditionalGetTests(APITestCase):
+    def setUp(self):
+        self.instructor = Instructor.objects.create(
+            name_first="Koga",
+            name_last="Fuchsia",
+            email="koga@fuchsia.com"
+        )
+        self.course = Course.objects.create(
+            course_code="POISON-101",
+            title="Poison Types",
+            description="Toxic",
+            description_full="All about poison types",
+            instructor=self.instructor,
+            start_date="2025-01-01",
+            end_date="2025-06-01",
+            course_fee=100.00
+        )
+        self.student = Student.objects.create(
+            name_first="Grimer",
+            name_last="Trainer",
+            email="grimer@fuchsia.com"
+        )
+
+    def revalidate(self, url, response):
+        return self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+
+    def test_list_and_detail_send_validators(self):
+        for url in [
+            "/api/students/",
+            f"/api/students/{self.student.id}/",
+            "/api/courses/",
+            "/api/instructors/",
+            "/api/registrations/",
+            "/api/dashboard-summary/",
+        ]:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertIn("ETag", response)
+            self.assertIn("Last-Modified", response)
+            self.assertIn("no-cache", response["Cache-Control"])
+
+    def test_unchanged_list_returns_304_without_serializing(self):
+        first = self.client.get("/api/students/")
+        with mock.patch.object(RowEncoder, "encode", return_value=[]) as encode:
+            with self.assertNumQueries(1):
+                response = self.revalidate("/api/students/", first)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], first["ETag"])
+        encode.assert_not_called()
+
+    def test_if_modified_since(self):
+        first = self.client.get("/api/instructors/")
+        response = self.client.get("/api/instructors/", HTTP_IF_MODIFIED_SINCE=first["Last-Modified"])
+        self.assertEqual(response.status_code, 304)
+
+    def test_write_changes_etag(self):
+        first = self.client.get("/api/students/")
+        Student.objects.create(name_first="Muk", name_last="Trainer", email="muk@fuchsia.com")
+        response = self.revalidate("/api/students/", first)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], first["ETag"])
+        self.assertEqual(response.data["count"], 2)
+
+    def test_related_write_changes_dependent_etags(self):
+        courses = self.client.get("/api/courses/")
+        dashboard = self.client.get("/api/dashboard-summary/")
+        instructors = self.client.get("/api/instructors/")
+        Registration.objects.create(student=self.student, course=self.course)
+
+        with mock.patch.object(CourseListSerializer, "get_enrollment_count", return_value=1):
+            self.assertEqual(self.revalidate("/api/courses/", courses).status_code, 200)
+        self.assertEqual(self.revalidate("/api/dashboard-summary/", dashboard).data["registrationCount"], 1)
+        self.assertEqual(self.revalidate("/api/instructors/", instructors).status_code, 304)
+
+    def test_bulk_registration_changes_etag(self):
+        first = self.client.get("/api/registrations/")
+        response = self.client.post(
+            "/api/registrations/register-bulk/",
+            {"registrations": [{"student_id": str(self.student.id), "course_id": str(self.course.id)}]},
+            format="json"
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.revalidate("/api/registrations/", first).status_code, 200)
+
+    def test_missing_object_has_no_validators(self):
+        response = self.client.get("/api/students/00000000-0000-0000-0000-000000000000/")
+        self.assertEqual(response.status_code, 404)
+        self.assertNotIn("ETag", response)
+
+    def test_etag_of_another_object_does_not_match(self):
+        other = Student.objects.create(name_first="Muk", name_last="Trainer", email="muk@fuchsia.com")
+        first = self.client.get(f"/api/students/{self.student.id}/")
+        self.assertEqual(self.revalidate(f"/api/students/{self.student.id}/", first).status_code, 304)
+        self.assertEqual(self.revalidate(f"/api/students/{other.id}/", first).status_code, 200)
+
+        missing = "/api/students/00000000-0000-0000-0000-000000000000/"
+        self.assertEqual(self.revalidate(missing, first).status_code, 404)
+        self.assertEqual(self.client.get(missing, HTTP_IF_MODIFIED_SINCE=first["Last-Modified"]).status_code, 404)
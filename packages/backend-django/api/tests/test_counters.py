@@ -0,0 +1,100 @@
+from io import StringIO
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from api.models import Instructor, Course, Student, Registration, DashboardCounters
+from api.signals import counter_service
+
+
+ # ----------------- Dashboard Counter Tests -----------------
+class DashboardCounterTests(APITestCase):
+    def setUp(self):
+        self.instructor = Instructor.objects.create(
+            name_first="Lt.",
+            name_last="Surge",
+            email="surge@vermilion.com"
+        )
+        self.course = Course.objects.create(
+            course_code="ELEC-101",
+            title="Electric Types",
+            description="Shocking",
+            description_full="All about electric types",
+            instructor=self.instructor,
+            start_date="2025-01-01",
+            end_date="2025-06-01",
+            course_fee=300.00
+        )
+        self.student = Student.objects.create(
+            name_first="Red",
+            name_last="Trainer",
+            email="red@indigo.com"
+        )
+        self.registration = Registration.objects.create(student=self.student, course=self.course)
+
+    def counters(self):
+        return DashboardCounters.objects.get(pk=1)
+
+    def test_creates_increment_counters(self):
+        counters = self.counters()
+        self.assertEqual(counters.student_count, 1)
+        self.assertEqual(counters.instructor_count, 1)
+        self.assertEqual(counters.course_count, 1)
+        self.assertEqual(counters.registration_count, 1)
+
+    def test_soft_delete_and_reactivate(self):
+        self.student.is_active = False
+        self.student.save()
+        self.student.save()
+        self.assertEqual(self.counters().student_count, 0)
+
+        student = Student.objects.get(pk=self.student.pk)
+        student.is_active = True
+        student.save()
+        self.assertEqual(self.counters().student_count, 1)
+
+    def test_soft_delete_through_api(self):
+        response = self.client.delete(f"/api/registrations/{self.registration.id}/")
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(self.counters().registration_count, 0)
+
+    def test_inactive_create_not_counted(self):
+        Student.objects.create(name_first="Gone", name_last="Away", email="gone@away.com", is_active=False)
+        self.assertEqual(self.counters().student_count, 1)
+
+    def test_hard_delete_cascades(self):
+        self.instructor.delete()
+        counters = self.counters()
+        self.assertEqual(counters.instructor_count, 0)
+        self.assertEqual(counters.course_count, 0)
+        self.assertEqual(counters.registration_count, 0)
+        self.assertEqual(counters.student_count, 1)
+
+    def test_dashboard_reads_single_row(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse("dashboard-summary"))
+        self.assertEqual(response.data["registrationCount"], 1)
+
+    def test_missing_row_is_rebuilt(self):
+        DashboardCounters.objects.all().delete()
+        Student.objects.create(name_first="New", name_last="Student", email="new@student.com")
+        self.assertEqual(self.counters().student_count, 2)
+        DashboardCounters.objects.all().delete()
+        self.assertEqual(counter_service.read().course_count, 1)
+
+    def test_reconcile_repairs_drift(self):
+        Student.objects.bulk_create([
+            Student(name_first="Bulk", name_last="Loaded", email="bulk@loaded.com")
+        ])
+        out = StringIO()
+        call_command("reconcile_counters", "--dry-run", stdout=out)
+        self.assertIn("student_count: off by -1", out.getvalue())
+        self.assertEqual(self.counters().student_count, 1)
+
+        out = StringIO()
+        call_command("reconcile_counters", stdout=out)
+        self.assertIn("Counters repaired", out.getvalue())
+        self.assertEqual(self.counters().student_count, 2)
+
+        out = StringIO()
+        call_command("reconcile_counters", stdout=out)
+        self.assertIn("in sync", out.getvalue())
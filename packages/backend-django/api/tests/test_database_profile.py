@@ -0,0 +1,62 @@
+from unittest import skipUnless
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from core.database import database_config
+
+
+ # ----------------- Database Profile Tests -----------------
+class DatabaseProfileTests(SimpleTestCase):
+    def test_sqlite_profile_tunes_every_connection(self):
+        config = database_config("sqlite", "/tmp/db.sqlite3", {})
+        pragmas = config["OPTIONS"]["init_command"].split(";")
+        self.assertEqual(pragmas, [
+            "PRAGMA journal_mode=WAL",
+            "PRAGMA synchronous=NORMAL",
+            "PRAGMA busy_timeout=5000",
+            "PRAGMA cache_size=-65536",
+            "PRAGMA mmap_size=268435456",
+        ])
+        self.assertEqual(config["OPTIONS"]["transaction_mode"], "IMMEDIATE")
+        self.assertEqual(config["CONN_MAX_AGE"], 600)
+        self.assertTrue(config["CONN_HEALTH_CHECKS"])
+
+    def test_sqlite_profile_reads_environment(self):
+        config = database_config("sqlite", "/tmp/db.sqlite3", {
+            "SQLITE_BUSY_TIMEOUT_MS": "250", "SQLITE_MMAP_SIZE": "0", "DB_CONN_MAX_AGE": "0",
+        })
+        self.assertIn("PRAGMA busy_timeout=250", config["OPTIONS"]["init_command"])
+        self.assertIn("PRAGMA mmap_size=0", config["OPTIONS"]["init_command"])
+        self.assertEqual(config["CONN_MAX_AGE"], 0)
+
+    def test_sqlite_basic_profile_is_untuned(self):
+        self.assertEqual(
+            database_config("sqlite-basic", "/tmp/db.sqlite3", {}),
+            {"ENGINE": "django.db.backends.sqlite3", "NAME": "/tmp/db.sqlite3"},
+        )
+
+    def test_postgres_profile_pools_connections(self):
+        config = database_config("postgres", "/tmp/db.sqlite3", {"POSTGRES_HOST": "db", "POSTGRES_POOL_MAX_SIZE": "20"})
+        self.assertEqual(config["ENGINE"], "django.db.backends.postgresql")
+        self.assertEqual(config["HOST"], "db")
+        self.assertEqual(config["OPTIONS"]["pool"], {"min_size": 2, "max_size": 20, "timeout": 10})
+        self.assertEqual(config["CONN_MAX_AGE"], 0)
+
+    def test_postgres_profile_without_pool_persists_connections(self):
+        config = database_config("postgres", "/tmp/db.sqlite3", {"POSTGRES_POOL": "False"})
+        self.assertNotIn("pool", config["OPTIONS"])
+        self.assertEqual(config["CONN_MAX_AGE"], 600)
+
+    def test_unknown_profile(self):
+        with self.assertRaises(ImproperlyConfigured):
+            database_config("mysql", "/tmp/db.sqlite3", {})
+
+
+@skipUnless(settings.DB_PROFILE == "sqlite", "runs against the tuned SQLite profile")
+class SqliteConnectionTests(TestCase):
+    def test_pragmas_applied_on_connect(self):
+        with connection.cursor() as cursor:
+            for pragma, expected in [("synchronous", 1), ("busy_timeout", 5000), ("cache_size", -65536)]:
+                cursor.execute(f"PRAGMA {pragma}")
+                self.assertEqual(cursor.fetchone()[0], expected, pragma)
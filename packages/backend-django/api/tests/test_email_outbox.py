@@ -0,0 +1,147 @@
+from io import StringIO
+from datetime import timedelta
+from django.core import mail
+from django.core.mail.backends.base import BaseEmailBackend
+from django.core.management import call_command
+from django.test import override_settings
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from api.models import Instructor, Course, Student, OutboxEmail
+from api.services.email_outbox import OutboxDispatcher, CLAIM_TIMEOUT
+
+
+class FailingEmailBackend(BaseEmailBackend):
+    def send_messages(self, email_messages):
+        raise ConnectionError("mail server unavailable")
+
+
+ # ----------------- Email Outbox Tests -----------------
+@override_settings(EMAIL_OUTBOX_WORKERS=0)
+class EmailOutboxTests(APITestCase):
+    def setUp(self):
+        self.instructor = Instructor.objects.create(
+            name_first="Koga",
+            name_last="Fuchsia",
+            email="koga@fuchsia.com"
+        )
+        self.course = Course.objects.create(
+            course_code="POISON-101",
+            title="Poison Types",
+            description="Toxic",
+            description_full="Handling poison types",
+            instructor=self.instructor,
+            start_date="2025-01-01",
+            end_date="2025-06-01",
+            course_fee=100.00
+        )
+        self.student = Student.objects.create(
+            name_first="Janine",
+            name_last="Fuchsia",
+            email="janine@fuchsia.com"
+        )
+
+    def register(self):
+        return self.client.post(
+            "/api/registrations/register/",
+            {"student_id": str(self.student.id), "course_id": str(self.course.id)},
+            format="json"
+        )
+
+    def test_registration_queues_email_until_commit(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = self.register()
+        self.assertEqual(response.status_code, 200)
+        email = OutboxEmail.objects.get()
+        self.assertEqual(email.status, "pending")
+        self.assertEqual(email.recipient, "janine@fuchsia.com")
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(len(callbacks), 1)
+
+    def test_email_dispatched_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.register()
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertIn("Poison Types", mail.outbox[0].subject)
+        email = OutboxEmail.objects.get()
+        self.assertEqual(email.status, "sent")
+        self.assertEqual(email.attempts, 1)
+        self.assertIsNotNone(email.sent_at)
+
+    def test_unregistration_email(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.register()
+            self.client.post(
+                "/api/registrations/unregister/",
+                {"student_id": str(self.student.id), "course_id": str(self.course.id)},
+                format="json"
+            )
+        self.assertEqual([message.subject for message in mail.outbox], [
+            "Registered for Poison Types", "Unregistered from Poison Types"
+        ])
+
+    def test_rejected_registration_queues_no_email(self):
+        self.course.prerequisites = ["MISSING-1"]
+        self.course.save()
+        response = self.register()
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(OutboxEmail.objects.exists())
+
+    def test_batches_share_one_pass(self):
+        for i in range(5):
+            OutboxEmail.objects.create(recipient=f"batch{i}@example.com", subject="Batch", body="Body")
+        sent, failed = OutboxDispatcher(batch_size=2).dispatch_pending()
+        self.assertEqual((sent, failed), (5, 0))
+        self.assertEqual(len(mail.outbox), 5)
+        self.assertFalse(OutboxEmail.objects.exclude(status="sent").exists())
+
+    @override_settings(EMAIL_BACKEND="api.tests.test_email_outbox.FailingEmailBackend")
+    def test_failure_retried_with_backoff(self):
+        email = OutboxEmail.objects.create(recipient="retry@example.com", subject="Retry", body="Body")
+        dispatcher = OutboxDispatcher(max_attempts=3, backoff_seconds=10)
+
+        self.assertEqual(dispatcher.dispatch_pending(), (0, 1))
+        email.refresh_from_db()
+        self.assertEqual(email.status, "pending")
+        self.assertEqual(email.attempts, 1)
+        self.assertIn("mail server unavailable", email.last_error)
+        self.assertGreater(email.next_attempt_at, timezone.now() + timedelta(seconds=5))
+
+        # Not due yet, so nothing is attempted
+        self.assertEqual(dispatcher.dispatch_pending(), (0, 0))
+
+        OutboxEmail.objects.filter(pk=email.pk).update(next_attempt_at=timezone.now())
+        dispatcher.dispatch_pending()
+        email.refresh_from_db()
+        self.assertEqual(email.attempts, 2)
+        self.assertGreater(email.next_attempt_at, timezone.now() + timedelta(seconds=15))
+
+        OutboxEmail.objects.filter(pk=email.pk).update(next_attempt_at=timezone.now())
+        dispatcher.dispatch_pending()
+        email.refresh_from_db()
+        self.assertEqual(email.status, "failed")
+        self.assertEqual(email.attempts, 3)
+
+    def test_stale_claim_is_reclaimed(self):
+        email = OutboxEmail.objects.create(recipient="stale@example.com", subject="Stale", body="Body")
+        OutboxEmail.objects.filter(pk=email.pk).update(status="sending", claimed_at=timezone.now() - timedelta(minutes=1))
+        self.assertEqual(OutboxDispatcher().dispatch_pending(), (0, 0))
+
+        OutboxEmail.objects.filter(pk=email.pk).update(claimed_at=timezone.now() - CLAIM_TIMEOUT * 2)
+        self.assertEqual(OutboxDispatcher().dispatch_pending(), (1, 0))
+
+    def test_process_email_outbox_command(self):
+        OutboxEmail.objects.create(recipient="command@example.com", subject="Command", body="Body")
+        out = StringIO()
+        call_command("process_email_outbox", "--once", stdout=out)
+        self.assertIn("Sent 1 emails", out.getvalue())
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_bulk_registration_queues_one_insert(self):
+        other = Student.objects.create(name_first="Other", name_last="Ninja", email="other@fuchsia.com")
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            self.client.post("/api/registrations/register-bulk/", {"registrations": [
+                {"student_id": str(self.student.id), "course_id": str(self.course.id)},
+                {"student_id": str(other.id), "course_id": str(self.course.id)},
+            ]}, format="json")
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(sorted(message.to[0] for message in mail.outbox), ["janine@fuchsia.com", "other@fuchsia.com"])
@@ -36,7 +36,7 @@ class CRMTests(TestCase):
         """Test that the instructors list is empty initially (no instructors in database)."""
         response = self.client.get("/api/instructors/")
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(response.json(),  {'count': 0, 'next': None, 'previous': None, 'results': []})
+        self.assertEqual(response.json(),  {'count': 0, 'count_is_exact': True, 'next': None, 'previous': None, 'results': []})
 
     def test_create_instructor(self):
         """Test creating a new instructor via POST request."""
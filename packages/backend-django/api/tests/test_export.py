@@ -0,0 +1,95 @@
+import csv
+import io
+import json
+from rest_framework.test import APITestCase
+from api.models import Instructor, Course, Student, Registration
+from api.views import RegistrationViewSet
+
+
+ # ----------------- Export Tests -----------------
+class ExportTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.instructor = Instructor.objects.create(
+            name_first="Blaine",
+            name_last="Cinnabar",
+            email="blaine@cinnabar.com"
+        )
+        cls.courses = [
+            Course.objects.create(
+                course_code=f"FIRE-10{i}",
+                title=f"Fire Types {i}",
+                description="Hot",
+                description_full="All about fire types",
+                instructor=cls.instructor,
+                start_date="2025-01-01",
+                end_date="2025-06-01",
+                course_fee=100.00,
+                prerequisites=["FIRE-100"] if i else []
+            )
+            for i in range(2)
+        ]
+        cls.students = [
+            Student.objects.create(
+                name_first=f"Ponyta{i}",
+                name_last="Trainer",
+                email=f"ponyta{i}@cinnabar.com"
+            )
+            for i in range(5)
+        ]
+        for student in cls.students:
+            Registration.objects.create(student=student, course=cls.courses[0])
+        Registration.objects.create(student=cls.students[0], course=cls.courses[1])
+
+    def export(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        return b"".join(response.streaming_content).decode()
+
+    def test_csv_export_matches_list_representation(self):
+        content = self.export("/api/students/export/?export_format=csv")
+        rows = list(csv.DictReader(io.StringIO(content)))
+        listed = self.client.get("/api/students/?page_size=100").data["results"]
+        self.assertEqual([row["id"] for row in rows], [student["id"] for student in listed])
+        self.assertEqual(rows[0]["email"], listed[0]["email"])
+
+    def test_ndjson_export(self):
+        content = self.export("/api/registrations/export/?export_format=ndjson")
+        rows = [json.loads(line) for line in content.splitlines()]
+        self.assertEqual(len(rows), 6)
+        self.assertIn("student_name", rows[0])
+
+    def test_course_export_uses_list_serializer(self):
+        rows = [json.loads(line) for line in self.export("/api/courses/export/?export_format=ndjson").splitlines()]
+        counts = {row["course_code"]: row["enrollment_count"] for row in rows}
+        self.assertEqual(counts, {"FIRE-100": 5, "FIRE-101": 1})
+        content = self.export("/api/courses/export/")
+        row = next(row for row in csv.DictReader(io.StringIO(content)) if row["course_code"] == "FIRE-101")
+        self.assertEqual(json.loads(row["prerequisites"]), ["FIRE-100"])
+
+    def test_export_honours_filters(self):
+        content = self.export(f"/api/registrations/export/?export_format=ndjson&course_id={self.courses[1].id}")
+        self.assertEqual(len(content.splitlines()), 1)
+        content = self.export(f"/api/students/export/?export_format=ndjson&course_id={self.courses[1].id}&eligible_for_course=true")
+        self.assertEqual(len(content.splitlines()), 4)
+
+    def test_rows_streamed_in_chunks(self):
+        original = RegistrationViewSet.export_chunk_size
+        RegistrationViewSet.export_chunk_size = 2
+        try:
+            response = self.client.get("/api/registrations/export/?export_format=csv")
+            chunks = list(response.streaming_content)
+        finally:
+            RegistrationViewSet.export_chunk_size = original
+        # header + 3 chunks of at most 2 rows
+        self.assertEqual(len(chunks), 4)
+        self.assertEqual(sum(chunk.count(b"\n") for chunk in chunks), 7)
+
+    def test_filename_and_content_type(self):
+        response = self.client.get("/api/registrations/export/?export_format=ndjson")
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        self.assertIn('filename="registrations.ndjson"', response["Content-Disposition"])
+
+    def test_unknown_format_rejected(self):
+        self.assertEqual(self.client.get("/api/students/export/?export_format=xml").status_code, 400)
@@ -0,0 +1,84 @@
+from unittest import mock
+from django.test import override_settings
+from rest_framework.test import APITestCase
+from api.conditional import response_cache
+from api.fast_read import RowEncoder
+from api.models import Address, Department, Instructor, Course, Student, Registration
+from api.serializers import RegistrationSerializer, StudentSerializer
+
+
+ # ----------------- Fast Read Path Tests -----------------
+class FastReadTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        address = Address.objects.create(street="1 Route 1", city="Viridian", state="Kanto", postal_code="00001", country="JP")
+        department = Department.objects.create(name="Ground")
+        cls.instructor = Instructor.objects.create(
+            name_first="Giovanni", name_last="Viridian", email="giovanni@viridian.com",
+            department=department, address=address, bio="Gym leader"
+        )
+        Instructor.objects.create(name_first="Koga", name_last="Fuchsia", email="koga@fuchsia.com")
+        cls.course = Course.objects.create(
+            course_code="GROUND-101",
+            title="Ground Types",
+            description="Earthy",
+            description_full="All about ground types",
+            instructor=cls.instructor,
+            start_date="2025-01-01",
+            end_date="2025-06-01",
+            course_fee=123.4,
+            prerequisites=["ROCK-101", "NORMAL-101"]
+        )
+        cls.students = [
+            Student.objects.create(name_first="Diglett", name_last="Trainer", email="diglett@viridian.com", address=address),
+            Student.objects.create(name_first="Sandshrew", name_last="Trainer", email="sandshrew@viridian.com", phone="555-0100"),
+        ]
+        for student in cls.students:
+            Registration.objects.create(student=student, course=cls.course, payment_status="paid")
+
+    def get(self, url):
+        response_cache.clear()
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, url)
+        return response.content
+
+    def test_body_matches_serializers(self):
+        for url in [
+            "/api/students/",
+            "/api/instructors/",
+            "/api/courses/",
+            "/api/registrations/",
+            f"/api/registrations/?course_id={self.course.id}&page_size=1&page=2",
+            "/api/students/?pagination=cursor&page_size=1",
+            "/api/courses/?fields=id,instructor_name,course_fee,prerequisites",
+            "/api/registrations/?fields=student_name,registered_at",
+        ]:
+            fast = self.get(url)
+            with override_settings(FAST_LIST_READS=False):
+                self.assertEqual(fast, self.get(url), url)
+
+    def test_cursor_links_walk_every_row(self):
+        url = "/api/registrations/?pagination=cursor&page_size=1"
+        ids = []
+        while url:
+            response = self.client.get(url)
+            ids += [row["id"] for row in response.data["results"]]
+            url = response.data["next"]
+        self.assertEqual(len(set(ids)), 2)
+
+    def test_list_skips_serializers(self):
+        with mock.patch.object(StudentSerializer, "to_representation") as to_representation:
+            self.get("/api/students/")
+        to_representation.assert_not_called()
+
+    def test_expand_takes_serializer_path(self):
+        with mock.patch.object(RowEncoder, "encode") as encode:
+            response = self.client.get("/api/registrations/?expand=student")
+        encode.assert_not_called()
+        self.assertEqual(response.data["results"][0]["student"]["name_last"], "Trainer")
+
+    def test_encoder_reads_one_row_of_values(self):
+        encoder = RowEncoder(RegistrationSerializer())
+        self.assertLessEqual({"student__name_first", "student__name_last", "course__title"}, encoder.paths)
+        row = Registration.objects.filter(student=self.students[0]).values(*encoder.paths).get()
+        self.assertEqual(encoder.encode([row]), [dict(RegistrationSerializer(Registration.objects.get(id=row["id"])).data)])
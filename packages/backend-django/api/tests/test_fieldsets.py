@@ -0,0 +1,89 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from api.models import Instructor, Course, Student, Registration
+
+
+ # ----------------- Sparse Fieldset Tests -----------------
+class SparseFieldsetTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.instructor = Instructor.objects.create(name_first="Erika", name_last="Celadon", email="erika@celadon.com")
+        cls.courses = [
+            Course.objects.create(
+                course_code=f"GRASS-{i}01",
+                title=f"Grass Types {i}",
+                description="Leafy",
+                description_full="All about grass types",
+                instructor=cls.instructor,
+                start_date="2025-01-01",
+                end_date="2025-06-01",
+                course_fee=100.00
+            )
+            for i in range(3)
+        ]
+        cls.students = [
+            Student.objects.create(name_first=f"Oddish{i}", name_last="Celadon", email=f"oddish{i}@celadon.com")
+            for i in range(3)
+        ]
+        for student in cls.students:
+            for course in cls.courses:
+                Registration.objects.create(student=student, course=course, registration_status="registered")
+
+    def get(self, url):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        return response, [query["sql"] for query in context.captured_queries]
+
+    def test_fields_restrict_output_and_columns(self):
+        response, queries = self.get("/api/courses/?fields=id,title,instructor_name")
+        self.assertEqual(response.status_code, 200)
+        row = response.data["results"][0]
+        self.assertEqual(set(row), {"id", "title", "instructor_name"})
+        self.assertEqual(row["instructor_name"], "Erika Celadon")
+        page_query = queries[-1]
+        self.assertNotIn("description_full", page_query)
+        # enrollment_count was not asked for, so neither is its subquery
+        self.assertNotIn("api_registration", page_query)
+
+    def test_fields_on_detail_and_export(self):
+        response = self.client.get(f"/api/students/{self.students[0].id}/?fields=email")
+        self.assertEqual(response.data, {"email": "oddish0@celadon.com"})
+        export = b"".join(self.client.get("/api/students/export/?fields=name_first,email").streaming_content)
+        self.assertEqual(export.decode().splitlines()[0], "name_first,email")
+
+    def test_fields_with_cursor_pagination(self):
+        url = "/api/registrations/?fields=student_name&pagination=cursor&page_size=4"
+        rows = []
+        while url:
+            response = self.client.get(url)
+            rows += response.data["results"]
+            url = response.data["next"]
+        self.assertEqual(len(rows), 9)
+        self.assertEqual(set(rows[0]), {"student_name"})
+
+    def test_expand_joins_related_objects(self):
+        _, plain = self.get("/api/registrations/")
+        response, queries = self.get("/api/registrations/?expand=student,course")
+        self.assertEqual(len(queries), len(plain))
+        row = response.data["results"][0]
+        self.assertEqual(row["student"]["email"], Student.objects.get(id=row["student_id"]).email)
+        self.assertEqual(row["course"]["instructor_id"], str(self.instructor.id))
+
+    def test_expand_with_fields(self):
+        response, queries = self.get("/api/courses/?fields=title&expand=instructor")
+        row = response.data["results"][0]
+        self.assertEqual(set(row), {"title", "instructor"})
+        self.assertEqual(row["instructor"]["email"], "erika@celadon.com")
+        self.assertEqual(len(queries), len(self.get("/api/courses/?fields=title")[1]))
+
+    def test_unknown_names_are_rejected(self):
+        self.assertEqual(self.client.get("/api/courses/?fields=title,nope").status_code, 400)
+        self.assertEqual(self.client.get("/api/students/?expand=instructor").status_code, 400)
+
+    def test_writes_return_every_field(self):
+        response = self.client.patch(
+            f"/api/students/{self.students[0].id}/?fields=email", {"notes": "Sleepy"}, format="json"
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("name_first", response.data)
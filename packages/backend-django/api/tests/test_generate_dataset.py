@@ -0,0 +1,121 @@
+from datetime import date
+from io import StringIO
+from unittest import mock
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from rest_framework.test import APITestCase
+from api.models import Instructor, Course, Student, Registration
+from api.signals import counter_service, prerequisite_service, search_index
+
+
+ # ----------------- Generate Dataset Tests -----------------
+class GenerateDatasetTests(APITestCase):
+    def setUp(self):
+        Student.objects.create(name_first="Old", name_last="Data", email="old@data.com")
+
+    def generate(self, *args):
+        out = StringIO()
+        call_command(
+            "generate_dataset", "--yes", "--instructors", "3", "--courses", "60", "--students", "40",
+            "--registrations", "300", "--batch-size", "50", *args, stdout=out,
+        )
+        return out.getvalue()
+
+    def snapshot(self):
+        return (
+            list(Instructor.objects.order_by("id").values_list("id", "email")),
+            list(Course.objects.order_by("id").values_list("id", "course_code", "prerequisites", "course_fee")),
+            list(Student.objects.order_by("id").values_list("id", "email", "created_at")),
+            list(Registration.objects.order_by("id").values_list(
+                "id", "student_id", "course_id", "registration_status", "payment_status", "created_at"
+            )),
+        )
+
+    def test_generates_requested_counts_and_replaces_old_data(self):
+        self.generate()
+        self.assertFalse(Student.objects.filter(email="old@data.com").exists())
+        self.assertEqual(Instructor.objects.count(), 3)
+        self.assertEqual(Course.objects.count(), 60)
+        self.assertEqual(Student.objects.count(), 40)
+        self.assertEqual(Registration.objects.count(), 300)
+
+    def test_same_seed_gives_same_rows(self):
+        self.generate("--seed", "7")
+        first = self.snapshot()
+        self.generate("--seed", "7")
+        self.assertEqual(self.snapshot(), first)
+        self.generate("--seed", "8")
+        self.assertNotEqual(self.snapshot(), first)
+
+    def test_rows_do_not_depend_on_run_date(self):
+        dates = lambda: list(Course.objects.order_by("id").values_list("start_date", "end_date"))
+        self.generate()
+        first = (self.snapshot(), dates())
+        with mock.patch("django.utils.timezone.localdate", return_value=date(2031, 6, 1)):
+            self.generate()
+        self.assertEqual((self.snapshot(), dates()), first)
+
+    def test_today_shifts_dates(self):
+        self.generate()
+        first = Course.objects.order_by("id").values_list("start_date", flat=True).first()
+        self.generate("--today", "2025-01-11")
+        self.assertEqual((Course.objects.order_by("id").values_list("start_date", flat=True).first() - first).days, 10)
+
+    def test_prerequisites_form_a_dag(self):
+        self.generate()
+        graph = dict(Course.objects.values_list("course_code", "prerequisites"))
+        self.assertTrue(any(graph.values()))
+        visiting, done = set(), set()
+
+        def visit(code):
+            self.assertNotIn(code, visiting, f"prerequisite cycle through {code}")
+            if code in done:
+                return
+            visiting.add(code)
+            for prerequisite in graph[code]:
+                self.assertIn(prerequisite, graph)
+                visit(prerequisite)
+            visiting.remove(code)
+            done.add(code)
+
+        for code in graph:
+            visit(code)
+
+    def test_registrations_respect_prerequisites(self):
+        self.generate()
+        pairs = list(Registration.objects.values_list("student_id", "course_id"))
+        self.assertEqual(len(pairs), len(set(pairs)))
+        students = Student.objects.in_bulk()
+        courses = Course.objects.in_bulk()
+        checked = 0
+        for student_id, course_id in pairs:
+            course = courses[course_id]
+            if course.prerequisites:
+                self.assertEqual(prerequisite_service.missing_prerequisites(students[student_id], course), [])
+                checked += 1
+        self.assertGreater(checked, 0)
+
+    def test_derived_state_rebuilt(self):
+        self.generate()
+        counters = counter_service.read()
+        self.assertEqual((counters.student_count, counters.course_count), (40, 60))
+        if search_index.is_available():
+            student = Student.objects.first()
+            self.assertIn(student, search_index.search(Student.objects.all(), student.email.split("@")[0]))
+        response = self.client.get("/api/courses/")
+        self.assertEqual(response.data["count"], 60)
+
+    def test_warns_when_students_run_out_of_courses(self):
+        output = self.generate("--courses", "2", "--registrations", "1000")
+        self.assertLess(Registration.objects.count(), 1000)
+        self.assertIn("ran out of eligible courses", output)
+
+    def test_rejects_courses_without_instructors(self):
+        with self.assertRaises(CommandError):
+            self.generate("--instructors", "0")
+        self.assertTrue(Student.objects.filter(email="old@data.com").exists())
+
+    def test_prompts_without_yes(self):
+        with mock.patch("builtins.input", return_value="n"):
+            call_command("generate_dataset", "--students", "5", stdout=StringIO())
+        self.assertTrue(Student.objects.filter(email="old@data.com").exists())
@@ -0,0 +1,200 @@
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from api.models import Instructor, Course, Student, Registration, DashboardCounters
+from api.pagination import lists_active_rows
+
+
+ # ----------------- Cursor Pagination Tests -----------------
+class CursorPaginationTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.instructor = Instructor.objects.create(
+            name_first="Misty",
+            name_last="Cerulean",
+            email="misty@cerulean.com"
+        )
+        cls.course = Course.objects.create(
+            course_code="WATER-101",
+            title="Water Types",
+            description="Splash",
+            description_full="All about water types",
+            instructor=cls.instructor,
+            start_date="2025-01-01",
+            end_date="2025-06-01",
+            course_fee=100.00
+        )
+        cls.students = [
+            Student.objects.create(
+                name_first=f"Swimmer{i}",
+                name_last="Cerulean",
+                email=f"swimmer{i}@cerulean.com"
+            )
+            for i in range(7)
+        ]
+        for student in cls.students:
+            Registration.objects.create(student=student, course=cls.course)
+
+    def walk(self, url):
+        ids = []
+        response = self.client.get(url)
+        while True:
+            self.assertEqual(response.status_code, 200)
+            self.assertNotIn("count", response.data)
+            ids += [row["id"] for row in response.data["results"]]
+            if not response.data["next"]:
+                return ids
+            response = self.client.get(response.data["next"])
+
+    def test_cursor_walk_returns_every_row_newest_first(self):
+        ids = self.walk("/api/students/?pagination=cursor&page_size=3")
+        self.assertEqual(ids, [str(student.id) for student in reversed(self.students)])
+
+    def test_cursor_walk_all_viewsets(self):
+        for url, expected in [
+            ("/api/registrations/", 7),
+            ("/api/instructors/", 1),
+            ("/api/courses/", 1),
+        ]:
+            self.assertEqual(len(self.walk(f"{url}?pagination=cursor&page_size=2")), expected)
+
+    def test_cursor_respects_filters(self):
+        ids = self.walk(f"/api/registrations/?pagination=cursor&page_size=2&student_id={self.students[0].id}")
+        self.assertEqual(len(ids), 1)
+
+    def test_previous_link(self):
+        first = self.client.get("/api/students/?pagination=cursor&page_size=3")
+        second = self.client.get(first.data["next"])
+        back = self.client.get(second.data["previous"])
+        self.assertEqual(back.data["results"], first.data["results"])
+
+    def test_rows_sharing_created_at_paged_by_id(self):
+        # As after a bulk_create: every row gets the same timestamp
+        Student.objects.update(created_at=self.students[0].created_at)
+        ids = self.walk("/api/students/?pagination=cursor&page_size=3")
+        self.assertEqual(ids, sorted((str(student.id) for student in self.students), reverse=True))
+
+        with CaptureQueriesContext(connection) as context:
+            second = self.client.get(self.client.get("/api/students/?pagination=cursor&page_size=3").data["next"])
+        self.assertNotIn("OFFSET", context.captured_queries[-1]["sql"])
+        back = self.client.get(second.data["previous"])
+        self.assertEqual([row["id"] for row in back.data["results"]], ids[:3])
+
+    def test_invalid_cursor(self):
+        self.assertEqual(self.client.get("/api/students/?cursor=not-a-cursor").status_code, 404)
+
+    def test_page_number_mode_unchanged(self):
+        response = self.client.get("/api/students/?page_size=3&page=2")
+        self.assertEqual(response.data["count"], 7)
+        self.assertEqual(len(response.data["results"]), 3)
+
+    def test_cursor_page_runs_no_count_query(self):
+        with CaptureQueriesContext(connection) as context:
+            self.client.get("/api/students/?pagination=cursor&page_size=3")
+        self.assertFalse(any("COUNT(" in query["sql"] for query in context.captured_queries))
+
+    def test_cursor_query_uses_keyset_index(self):
+        response = self.client.get("/api/students/?pagination=cursor&page_size=3")
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(response.data["next"])
+        page_sql = context.captured_queries[-1]["sql"]
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN QUERY PLAN {page_sql}")
+            plan = " ".join(row[-1] for row in cursor.fetchall())
+        self.assertIn("student_active_created_idx", plan)
+        self.assertNotIn("TEMP B-TREE", plan)
+
+
+ # ----------------- Cheap Count Tests -----------------
+class CheapCountTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        instructor = Instructor.objects.create(name_first="Brock", name_last="Pewter", email="brock@pewter.com")
+        cls.course = Course.objects.create(
+            course_code="ROCK-101",
+            title="Rock Types",
+            description="Tackle",
+            description_full="All about rock types",
+            instructor=instructor,
+            start_date="2025-01-01",
+            end_date="2025-06-01",
+            course_fee=100.00
+        )
+        for i in range(7):
+            student = Student.objects.create(name_first=f"Hiker{i}", name_last="Pewter", email=f"hiker{i}@pewter.com")
+            Registration.objects.create(student=student, course=cls.course)
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        return response, [query["sql"] for query in context.captured_queries if "COUNT(" in query["sql"]]
+
+    def test_unfiltered_list_reads_counters(self):
+        DashboardCounters.objects.update(registration_count=42)
+        response, counts = self.count_queries("/api/registrations/?page_size=2")
+        self.assertEqual(counts, [])
+        self.assertEqual(response.data["count"], 42)
+        self.assertTrue(response.data["count_is_exact"])
+
+    def test_every_viewset_matches_exact_count(self):
+        for url, expected in [
+            ("/api/registrations/", 7),
+            ("/api/students/", 7),
+            ("/api/instructors/", 1),
+            ("/api/courses/", 1),
+        ]:
+            response = self.client.get(url)
+            self.assertEqual(response.data["count"], expected)
+            self.assertTrue(response.data["count_is_exact"])
+
+    def test_filtered_list_under_cap_is_exact(self):
+        response, counts = self.count_queries(f"/api/registrations/?course_id={self.course.id}&page_size=2")
+        self.assertEqual(len(counts), 1)
+        self.assertIn("LIMIT 1001", counts[0])
+        self.assertEqual(response.data["count"], 7)
+        self.assertTrue(response.data["count_is_exact"])
+
+    @override_settings(PAGINATION_COUNT_CAP=3)
+    def test_filtered_list_over_cap_is_a_lower_bound(self):
+        response = self.client.get(f"/api/registrations/?course_id={self.course.id}&page_size=2")
+        self.assertEqual(response.data["count"], 3)
+        self.assertFalse(response.data["count_is_exact"])
+        self.assertIsNotNone(response.data["next"])
+
+        second = self.client.get(response.data["next"])
+        self.assertEqual(len(second.data["results"]), 2)
+        self.assertIsNotNone(second.data["next"])
+
+    @override_settings(PAGINATION_COUNT_CAP=3)
+    def test_pages_past_cap_count_to_their_end(self):
+        response = self.client.get(f"/api/registrations/?course_id={self.course.id}&page_size=2&page=4")
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertEqual(response.data["count"], 7)
+        self.assertTrue(response.data["count_is_exact"])
+        self.assertIsNone(response.data["next"])
+
+    @override_settings(PAGINATION_COUNT_CAP=3)
+    def test_last_page_counts_exactly(self):
+        response = self.client.get(f"/api/registrations/?course_id={self.course.id}&page_size=2&page=last")
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertEqual(response.data["count"], 7)
+        self.assertTrue(response.data["count_is_exact"])
+        self.assertIsNone(response.data["next"])
+
+    @override_settings(FAST_PAGINATION_COUNTS=False)
+    def test_disabled_runs_exact_count(self):
+        DashboardCounters.objects.update(registration_count=42)
+        response, counts = self.count_queries("/api/registrations/?page_size=2")
+        self.assertEqual(len(counts), 1)
+        self.assertNotIn("LIMIT", counts[0])
+        self.assertEqual(response.data["count"], 7)
+        self.assertTrue(response.data["count_is_exact"])
+
+    def test_lists_active_rows(self):
+        active = Registration.objects.filter(is_active=True)
+        self.assertTrue(lists_active_rows(active.filter(is_active=True).select_related("student").values("id")))
+        self.assertFalse(lists_active_rows(active.filter(course=self.course)))
+        self.assertFalse(lists_active_rows(Registration.objects.all()))
+        self.assertFalse(lists_active_rows(Registration.objects.filter(is_active=False)))
+        self.assertFalse(lists_active_rows(Registration.objects.exclude(is_active=True)))
@@ -0,0 +1,107 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from api.models import Instructor, Course, Student, Registration
+from api.services.prerequisites import GRAPH_CACHE_KEY
+from api.signals import prerequisite_service, table_versions
+
+
+ # ----------------- Prerequisite Check Tests -----------------
+class PrerequisiteCheckTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.instructor = Instructor.objects.create(
+            name_first="Giovanni",
+            name_last="Viridian",
+            email="giovanni@viridian.com"
+        )
+        self.student = Student.objects.create(
+            name_first="Blue",
+            name_last="Oak",
+            email="blue@pallet.com"
+        )
+
+    def create_course(self, code, prerequisites=None):
+        return Course.objects.create(
+            course_code=code,
+            title=f"Course {code}",
+            description="Course",
+            description_full="Course",
+            instructor=self.instructor,
+            start_date="2025-01-01",
+            end_date="2025-06-01",
+            course_fee=100.00,
+            prerequisites=prerequisites or []
+        )
+
+    def register(self, course):
+        return self.client.post(
+            "/api/registrations/register/",
+            {"student_id": str(self.student.id), "course_id": str(course.id)},
+            format="json"
+        )
+
+    def count_register_queries(self, prereq_count):
+        prereqs = [self.create_course(f"P{prereq_count}-{i}") for i in range(prereq_count)]
+        for prereq in prereqs:
+            Registration.objects.create(student=self.student, course=prereq)
+        target = self.create_course(f"T{prereq_count}", [prereq.course_code for prereq in prereqs])
+        prerequisite_service.graph()
+        with CaptureQueriesContext(connection) as context:
+            response = self.register(target)
+        self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries)
+
+    def test_register_query_count_independent_of_prerequisite_count(self):
+        self.assertEqual(self.count_register_queries(1), self.count_register_queries(8))
+
+    def test_missing_prerequisites_reported_in_order(self):
+        first = self.create_course("FIRST")
+        self.create_course("SECOND")
+        Registration.objects.create(student=self.student, course=first)
+        target = self.create_course("TARGET", ["UNKNOWN", "SECOND", "FIRST"])
+        self.assertEqual(prerequisite_service.missing_prerequisites(self.student, target), ["UNKNOWN", "SECOND"])
+
+    def test_cancelled_registration_does_not_satisfy_prerequisite(self):
+        prereq = self.create_course("CANCEL-1")
+        Registration.objects.create(student=self.student, course=prereq, registration_status="cancelled")
+        target = self.create_course("CANCEL-2", ["CANCEL-1"])
+        self.assertEqual(prerequisite_service.missing_prerequisites(self.student, target), ["CANCEL-1"])
+
+    def test_graph_cached_until_course_saved(self):
+        prereq = self.create_course("GRAPH-1")
+        graph = prerequisite_service.graph()
+        self.assertEqual(graph["GRAPH-1"]["id"], prereq.id)
+        self.assertIsNotNone(cache.get(GRAPH_CACHE_KEY))
+        # Only the Course version stamp is read
+        with self.assertNumQueries(1):
+            prerequisite_service.graph()
+
+        self.create_course("GRAPH-2", ["GRAPH-1"])
+        self.assertIsNone(cache.get(GRAPH_CACHE_KEY))
+        self.assertEqual(prerequisite_service.graph()["GRAPH-2"]["prerequisites"], ["GRAPH-1"])
+
+    def test_graph_rebuilt_after_write_in_another_process(self):
+        prereq = self.create_course("OTHER-1")
+        target = self.create_course("OTHER-2")
+        self.assertEqual(prerequisite_service.graph()["OTHER-2"]["prerequisites"], [])
+        stale = cache.get(GRAPH_CACHE_KEY)
+
+        # Another worker's write bumps the stamp but can't clear this process's cache
+        Course.objects.filter(pk=target.pk).update(prerequisites=[prereq.course_code])
+        table_versions.bump(Course)
+        cache.set(GRAPH_CACHE_KEY, stale, None)
+        self.assertEqual(prerequisite_service.graph()["OTHER-2"]["prerequisites"], ["OTHER-1"])
+
+    def test_graph_invalidated_on_prerequisite_change(self):
+        prereq = self.create_course("CHANGE-1")
+        target = self.create_course("CHANGE-2")
+        self.assertEqual(self.register(target).status_code, 200)
+
+        Registration.objects.filter(course=target).delete()
+        target.prerequisites = [prereq.course_code]
+        target.save()
+        response = self.register(target)
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("CHANGE-1", response.data["error"])
@@ -0,0 +1,134 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from api.conditional import response_cache
+from api.models import Instructor, Course, Student, Registration
+
+
+class QueryBudgetTestCase(APITestCase):
+    """Base class for asserting that list endpoints run a constant number of queries."""
+
+    def count_queries(self, url):
+        # Budgets are for the uncached path; a response cached by an earlier test would run one query
+        response_cache.clear()
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries)
+
+    def assertQueriesIndependentOfPageSize(self, url, small=1, large=20):
+        separator = "&" if "?" in url else "?"
+        small_count = self.count_queries(f"{url}{separator}page_size={small}")
+        large_count = self.count_queries(f"{url}{separator}page_size={large}")
+        self.assertEqual(
+            small_count,
+            large_count,
+            f"{url} ran {small_count} queries for {small} rows but {large_count} for {large} rows",
+        )
+
+
+ # ----------------- List Endpoint Query Budget Tests -----------------
+class ListEndpointQueryBudgetTests(QueryBudgetTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.instructors = [
+            Instructor.objects.create(
+                name_first=f"Instructor{i}",
+                name_last="Budget",
+                email=f"instructor{i}@budget.com"
+            )
+            for i in range(5)
+        ]
+        cls.courses = [
+            Course.objects.create(
+                course_code=f"BUD-{i:03}",
+                title=f"Budget Course {i}",
+                description="Budget",
+                description_full="Budget Full",
+                instructor=cls.instructors[i % len(cls.instructors)],
+                start_date="2025-01-01",
+                end_date="2025-06-01",
+                course_fee=100.00
+            )
+            for i in range(20)
+        ]
+        cls.students = [
+            Student.objects.create(
+                name_first=f"Student{i}",
+                name_last="Budget",
+                email=f"student{i}@budget.com"
+            )
+            for i in range(20)
+        ]
+        for i, student in enumerate(cls.students):
+            Registration.objects.create(student=student, course=cls.courses[i])
+            Registration.objects.create(student=student, course=cls.courses[(i + 1) % 20])
+
+    def test_course_list_query_budget(self):
+        self.assertQueriesIndependentOfPageSize("/api/courses/")
+
+    def test_course_list_filtered_query_budget(self):
+        self.assertQueriesIndependentOfPageSize(f"/api/courses/?instructor_id={self.instructors[0].id}", large=4)
+
+    def test_instructor_list_query_budget(self):
+        self.assertQueriesIndependentOfPageSize("/api/instructors/", large=5)
+
+    def test_student_list_query_budget(self):
+        self.assertQueriesIndependentOfPageSize("/api/students/")
+
+    def test_course_list_enrollment_count_annotated(self):
+        response = self.client.get("/api/courses/?page_size=20")
+        counts = {course["course_code"]: course["enrollment_count"] for course in response.data["results"]}
+        self.assertEqual(counts["BUD-000"], 2)
+        self.assertEqual(counts["BUD-019"], 2)
+        self.assertEqual(response.data["results"][0]["instructor_name"].split()[1], "Budget")
+
+    def test_registration_list_query_budget(self):
+        self.assertQueriesIndependentOfPageSize("/api/registrations/", large=40)
+
+    def test_registration_list_filtered_query_budget(self):
+        self.assertQueriesIndependentOfPageSize(f"/api/registrations/?course_id={self.courses[0].id}", large=2)
+
+    def test_registration_list_defers_unused_columns(self):
+        with CaptureQueriesContext(connection) as context:
+            self.client.get("/api/registrations/?page_size=5")
+        page_sql = context.captured_queries[-1]["sql"]
+        self.assertIn('"api_student"."name_first"', page_sql)
+        self.assertNotIn('"api_student"."notes"', page_sql)
+        self.assertNotIn('"api_course"."description_full"', page_sql)
+
+
+ # ----------------- Search Query Budget Tests -----------------
+class SearchQueryBudgetTests(QueryBudgetTestCase):
+    def setUp(self):
+        instructor = Instructor.objects.create(
+            name_first="Search",
+            name_last="Budget",
+            email="search@budget.com"
+        )
+        self.courses = [
+            Course.objects.create(
+                course_code=f"SRCH-{i:03}",
+                title=f"Searchable Course {i}",
+                description="Budget",
+                description_full="Budget Full",
+                instructor=instructor,
+                start_date="2025-01-01",
+                end_date="2025-06-01",
+                course_fee=100.00
+            )
+            for i in range(3)
+        ]
+        self.student = Student.objects.create(
+            name_first="Searchable",
+            name_last="Student",
+            email="searchable@budget.com"
+        )
+
+    def test_search_query_count_independent_of_result_size(self):
+        Registration.objects.create(student=self.student, course=self.courses[0])
+        small_counts = [self.count_queries(f"/api/search/?q={q}") for q in ("registered", "Course 0")]
+        for course in self.courses[1:]:
+            Registration.objects.create(student=self.student, course=course)
+        large_counts = [self.count_queries(f"/api/search/?q={q}") for q in ("registered", "Searchable Course")]
+        self.assertEqual(small_counts, large_counts)
@@ -0,0 +1,109 @@
+import re
+from datetime import timedelta
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils.timezone import now
+from rest_framework.test import APITestCase
+from api.models import Instructor, Course, Student, Registration
+from api.signals import prerequisite_service
+
+# A bare "SCAN api_x" reads the whole table; "SCAN api_x USING INDEX" walks an index in order
+FULL_SCAN = re.compile(r"^SCAN (api_\w+|U\d+)$")
+INDEX_WALK = re.compile(r"^SCAN (api_\w+|U\d+) USING (COVERING )?INDEX")
+
+
+ # ----------------- Query Plan Tests -----------------
+class HotQueryPlanTests(APITestCase):
+    """Runs EXPLAIN QUERY PLAN on every SELECT the hot endpoints issue and fails on full scans."""
+
+    def setUp(self):
+        cache.clear()
+        today = now().date()
+        self.instructor = Instructor.objects.create(
+            name_first="Erika",
+            name_last="Celadon",
+            email="erika@celadon.com"
+        )
+        self.prereq = Course.objects.create(
+            course_code="GRASS-101",
+            title="Grass Types",
+            description="Leafy",
+            description_full="Grass type basics",
+            instructor=self.instructor,
+            start_date=today - timedelta(days=365),
+            end_date=today + timedelta(days=365),
+            course_fee=100.00
+        )
+        self.course = Course.objects.create(
+            course_code="GRASS-201",
+            title="Advanced Grass",
+            description="Leafier",
+            description_full="Advanced grass types",
+            instructor=self.instructor,
+            start_date=today - timedelta(days=365),
+            end_date=today + timedelta(days=365),
+            course_fee=200.00,
+            prerequisites=["GRASS-101"]
+        )
+        self.student = Student.objects.create(
+            name_first="Gloom",
+            name_last="Trainer",
+            email="gloom@celadon.com"
+        )
+        Registration.objects.create(student=self.student, course=self.prereq)
+        # The prerequisite graph is read in full by design; build it outside the captured requests
+        prerequisite_service.graph()
+
+    def plans_for(self, send):
+        with CaptureQueriesContext(connection) as context:
+            send()
+        plans = []
+        with connection.cursor() as cursor:
+            for query in context.captured_queries:
+                if not query["sql"].startswith("SELECT"):
+                    continue
+                cursor.execute(f"EXPLAIN QUERY PLAN {query['sql']}")
+                plans.append((query["sql"], [row[-1] for row in cursor.fetchall()]))
+        self.assertTrue(plans)
+        return plans
+
+    def assertNoFullScan(self, send, allow_index_walk=False):
+        for sql, plan in self.plans_for(send):
+            for step in plan:
+                self.assertIsNone(FULL_SCAN.match(step), f"Full table scan in {plan} for {sql}")
+                if not allow_index_walk:
+                    self.assertIsNone(INDEX_WALK.match(step), f"Full index walk in {plan} for {sql}")
+
+    def test_unfiltered_lists_walk_ordered_indexes(self):
+        for url in ["/api/students/", "/api/instructors/", "/api/courses/", "/api/registrations/"]:
+            self.assertNoFullScan(lambda: self.client.get(url), allow_index_walk=True)
+
+    def test_registration_list_filters(self):
+        self.assertNoFullScan(lambda: self.client.get(f"/api/registrations/?student_id={self.student.id}"))
+        self.assertNoFullScan(lambda: self.client.get(f"/api/registrations/?course_id={self.prereq.id}"))
+
+    def test_course_list_filters(self):
+        self.assertNoFullScan(lambda: self.client.get("/api/courses/?active_courses=true"))
+        self.assertNoFullScan(lambda: self.client.get(f"/api/courses/?instructor_id={self.instructor.id}"))
+
+    def test_student_list_filters(self):
+        self.assertNoFullScan(lambda: self.client.get(f"/api/students/?course_id={self.prereq.id}"))
+        self.assertNoFullScan(lambda: self.client.get(f"/api/students/?instructor_id={self.instructor.id}"))
+        self.assertNoFullScan(
+            lambda: self.client.get(f"/api/students/?course_id={self.prereq.id}&eligible_for_course=true"),
+            allow_index_walk=True,
+        )
+
+    def test_register_and_unregister(self):
+        data = {"student_id": str(self.student.id), "course_id": str(self.course.id)}
+        self.assertNoFullScan(lambda: self.client.post("/api/registrations/register/", data, format="json"))
+        self.assertNoFullScan(lambda: self.client.post("/api/registrations/unregister/", data, format="json"))
+
+    def test_destroy_checks(self):
+        self.assertNoFullScan(lambda: self.client.delete(f"/api/instructors/{self.instructor.id}/"))
+        self.assertNoFullScan(lambda: self.client.delete(f"/api/students/{self.student.id}/"))
+        self.assertNoFullScan(lambda: self.client.delete(f"/api/courses/{self.prereq.id}/"))
+
+    def test_dashboard(self):
+        self.assertNoFullScan(lambda: self.client.get("/api/dashboard-summary/"))
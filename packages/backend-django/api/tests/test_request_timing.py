@@ -0,0 +1,85 @@
+import re
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from api.models import Instructor, Course, Student
+from api.timing import RequestTimingMiddleware, route_timings
+
+SERVER_TIMING = re.compile(
+    r'^db;dur=(?P<db>[\d.]+);desc="(?P<queries>\d+) queries", view;dur=(?P<view>[\d.]+), '
+    r'serialize;dur=(?P<serialize>[\d.]+), total;dur=(?P<total>[\d.]+)$'
+)
+
+
+ # ----------------- Request Timing Tests -----------------
+class RequestTimingTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.instructor = Instructor.objects.create(name_first="Sabrina", name_last="Saffron", email="sabrina@saffron.com")
+        cls.course = Course.objects.create(
+            course_code="PSY-101",
+            title="Psychic Types",
+            description="Spoon bending",
+            description_full="All about psychic types",
+            instructor=cls.instructor,
+            start_date="2025-01-01",
+            end_date="2025-06-01",
+            course_fee=100.00
+        )
+        for i in range(3):
+            Student.objects.create(name_first=f"Abra{i}", name_last="Saffron", email=f"abra{i}@saffron.com")
+
+    def setUp(self):
+        route_timings.reset()
+
+    def timings(self, response):
+        match = SERVER_TIMING.match(response["Server-Timing"])
+        self.assertIsNotNone(match, response["Server-Timing"])
+        return {key: float(value) for key, value in match.groupdict().items()}
+
+    def test_server_timing_header(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get("/api/students/")
+        timings = self.timings(response)
+        self.assertEqual(timings["queries"], len(context.captured_queries))
+        self.assertGreater(timings["db"], 0)
+        self.assertGreater(timings["serialize"], 0)
+        self.assertLessEqual(timings["db"], timings["view"])
+        self.assertLessEqual(timings["view"], timings["total"])
+
+    def test_header_on_non_drf_and_unresolved_responses(self):
+        self.assertIn("Server-Timing", self.client.get("/api/students/export/"))
+        response = self.client.get("/no/such/route/")
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(self.timings(response)["queries"], 0)
+
+    def test_routes_aggregated_by_url_name(self):
+        with CaptureQueriesContext(connection) as context:
+            students = self.client.get("/api/students/").json()["results"]
+        list_queries = len(context.captured_queries)
+        for student in students:
+            self.client.get(f"/api/students/{student['id']}/")
+        response = self.client.get("/api/internal/timings/")
+        self.assertEqual(response.status_code, 200)
+        routes = {row["route"]: row for row in response.data["routes"]}
+        self.assertEqual(routes["GET student-list"]["count"], 1)
+        self.assertEqual(routes["GET student-list"]["mean_queries"], list_queries)
+        self.assertEqual(routes["GET student-detail"]["count"], 3)
+        self.assertGreaterEqual(routes["GET student-detail"]["max_ms"], routes["GET student-detail"]["mean_total_ms"])
+
+    def test_reset(self):
+        self.client.get("/api/students/")
+        self.assertEqual(self.client.delete("/api/internal/timings/").status_code, 204)
+        routes = [row["route"] for row in self.client.get("/api/internal/timings/").data["routes"]]
+        self.assertNotIn("GET student-list", routes)
+
+    @override_settings(INTERNAL_IPS=[])
+    def test_endpoint_hidden_outside_internal_ips(self):
+        self.assertEqual(self.client.get("/api/internal/timings/").status_code, 404)
+
+    @override_settings(REQUEST_TIMING=False)
+    def test_disabled(self):
+        from django.core.exceptions import MiddlewareNotUsed
+        with self.assertRaises(MiddlewareNotUsed):
+            RequestTimingMiddleware(lambda request: None)
@@ -0,0 +1,96 @@
+import json
+import os
+import shutil
+import tempfile
+import uuid
+from io import StringIO
+from unittest import mock
+from django.core.management import call_command
+from rest_framework.test import APITestCase
+from api.models import Instructor, Course, Student, Registration
+from api.signals import counter_service, search_index
+
+
+ # ----------------- Reset Database Tests -----------------
+class ResetDatabaseTests(APITestCase):
+    def setUp(self):
+        Student.objects.create(name_first="Old", name_last="Data", email="old@data.com")
+        self.data_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.data_dir)
+        self.instructor_id = str(uuid.uuid4())
+        self.course_ids = [str(uuid.uuid4()), str(uuid.uuid4())]
+        self.student_ids = [str(uuid.uuid4()) for _ in range(3)]
+        self.write("instructors.json", [
+            {"id": self.instructor_id, "name_first": "Bruno", "name_last": "Elite", "email": "bruno@elite.com",
+             "created_at": "2024-01-01", "updated_at": "2024-01-01"},
+        ])
+        self.write("courses.json", [
+            {"id": course_id, "course_code": f"FIGHT-10{i}", "title": f"Fighting {i}", "description": "Punch",
+             "description_full": "Fighting types", "instructor_id": self.instructor_id,
+             "start_date": "2025-01-01", "end_date": "2025-06-01", "course_fee": "100.00",
+             "prerequisites": ["FIGHT-100", "MISSING-1"] if i else [],
+             "created_at": "2024-01-01", "updated_at": "2024-01-01"}
+            for i, course_id in enumerate(self.course_ids)
+        ])
+        self.write("students.json", [
+            {"id": student_id, "name_first": f"Machop{i}", "name_last": "Trainer", "email": f"machop{i}@elite.com",
+             "created_at": "2024-01-01", "updated_at": "2024-01-01"}
+            for i, student_id in enumerate(self.student_ids)
+        ])
+
+    def write(self, filename, records):
+        with open(os.path.join(self.data_dir, filename), "w") as f:
+            json.dump(records, f)
+
+    def reset(self, *args):
+        out = StringIO()
+        call_command("reset_database", "--yes", "--data-dir", self.data_dir, *args, stdout=out)
+        return out.getvalue()
+
+    def test_loads_every_file_and_replaces_old_data(self):
+        self.write("registrations.json", [
+            {"id": str(uuid.uuid4()), "student_id": student_id, "course_id": self.course_ids[0]}
+            for student_id in self.student_ids
+        ])
+        output = self.reset()
+        self.assertEqual(Instructor.objects.count(), 1)
+        self.assertEqual(Course.objects.get(course_code="FIGHT-101").prerequisites, ["FIGHT-100", "MISSING-1"])
+        self.assertFalse(Student.objects.filter(email="old@data.com").exists())
+        self.assertEqual(Student.objects.count(), 3)
+        self.assertEqual(Registration.objects.filter(course_id=self.course_ids[0]).count(), 3)
+        self.assertIn("unknown prerequisite MISSING-1", output)
+        self.assertNotIn("Machop0", output)
+
+    def test_counters_and_search_index_rebuilt(self):
+        self.reset()
+        counters = counter_service.read()
+        self.assertEqual((counters.student_count, counters.course_count), (3, 2))
+        if search_index.is_available():
+            self.assertEqual(len(search_index.search(Student.objects.all(), "Machop1")), 1)
+        response = self.client.post(
+            "/api/registrations/register/",
+            {"student_id": self.student_ids[0], "course_id": self.course_ids[1]},
+            format="json"
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("FIGHT-100", response.data["error"])
+
+    def test_registrations_file_optional(self):
+        self.reset()
+        self.assertEqual(Registration.objects.count(), 0)
+
+    def test_failed_load_keeps_old_data(self):
+        self.write("students.json", [{"id": "not-a-uuid"}])
+        with self.assertRaises(Exception):
+            self.reset()
+        self.assertTrue(Student.objects.filter(email="old@data.com").exists())
+
+    def test_prompts_without_yes(self):
+        with mock.patch("builtins.input", return_value="n"):
+            call_command("reset_database", "--data-dir", self.data_dir, stdout=StringIO())
+        self.assertTrue(Student.objects.filter(email="old@data.com").exists())
+
+    def test_sample_data_loads(self):
+        out = StringIO()
+        call_command("reset_database", "--yes", stdout=out)
+        self.assertGreater(Student.objects.count(), 0)
@@ -0,0 +1,110 @@
+import os
+import tempfile
+from unittest import mock
+from django.test import override_settings
+from rest_framework.test import APITestCase
+from api.conditional import response_cache
+from api.models import Instructor, Course, Student, Registration
+from api.fast_read import RowEncoder
+
+RESPONSE_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "responses": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "test-responses",
+        "OPTIONS": {"MAX_ENTRIES": 3, "CULL_FREQUENCY": 3},
+    },
+}
+
+
+ # ----------------- Response Cache Tests -----------------
+class ResponseCacheTests(APITestCase):
+    def setUp(self):
+        response_cache.clear()
+        self.instructor = Instructor.objects.create(
+            name_first="Sabrina",
+            name_last="Saffron",
+            email="sabrina@saffron.com"
+        )
+        self.course = Course.objects.create(
+            course_code="PSY-101",
+            title="Psychic Types",
+            description="Mind",
+            description_full="All about psychic types",
+            instructor=self.instructor,
+            start_date="2025-01-01",
+            end_date="2025-06-01",
+            course_fee=100.00
+        )
+
+    def test_hit_skips_queries_and_serializers(self):
+        first = self.client.get("/api/courses/")
+        with mock.patch.object(RowEncoder, "encode", return_value=[]) as encode:
+            with self.assertNumQueries(1):
+                second = self.client.get("/api/courses/")
+        encode.assert_not_called()
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second["ETag"], first["ETag"])
+        self.assertEqual(second["Content-Type"], first["Content-Type"])
+
+    def test_query_params_are_part_of_the_key(self):
+        self.client.get("/api/courses/?page_size=1")
+        response = self.client.get("/api/courses/?active_courses=true")
+        self.assertEqual(response.json()["count"], 0)
+
+    def test_save_and_soft_delete_invalidate(self):
+        self.client.get("/api/instructors/")
+        update = self.client.patch(
+            f"/api/instructors/{self.instructor.id}/", {"name_last": "Marsh"}, format="json"
+        )
+        self.assertEqual(update.status_code, 200)
+        self.assertEqual(self.client.get("/api/instructors/").json()["results"][0]["name_last"], "Marsh")
+
+        self.client.get("/api/courses/")
+        self.assertEqual(self.client.delete(f"/api/courses/{self.course.id}/").status_code, 204)
+        self.assertEqual(self.client.get("/api/courses/").json()["count"], 0)
+
+    def test_registration_write_invalidates_course_list(self):
+        self.assertEqual(self.client.get("/api/courses/").json()["results"][0]["enrollment_count"], 0)
+        student = Student.objects.create(name_first="Abra", name_last="Trainer", email="abra@saffron.com")
+        Registration.objects.create(student=student, course=self.course)
+        self.assertEqual(self.client.get("/api/courses/").json()["results"][0]["enrollment_count"], 1)
+
+    def test_uncached_viewsets_always_serialize(self):
+        Student.objects.create(name_first="Abra", name_last="Trainer", email="abra@saffron.com")
+        self.client.get("/api/students/")
+        with mock.patch.object(RowEncoder, "encode", return_value=[]) as encode:
+            self.client.get("/api/students/")
+        encode.assert_called()
+
+    @override_settings(RESPONSE_CACHE_MAX_ENTRY_BYTES=10)
+    def test_oversized_responses_not_stored(self):
+        self.client.get("/api/instructors/")
+        with mock.patch.object(RowEncoder, "encode", return_value=[]) as encode:
+            self.client.get("/api/instructors/")
+        encode.assert_called()
+
+    @override_settings(CACHES=RESPONSE_CACHES)
+    def test_least_recently_used_entries_evicted(self):
+        self.client.get("/api/instructors/?page=1")
+        for page_size in range(1, 4):
+            self.client.get("/api/instructors/?page=1")
+            self.client.get(f"/api/instructors/?page_size={page_size}")
+        with mock.patch.object(RowEncoder, "encode", return_value=[]) as encode:
+            self.client.get("/api/instructors/?page=1")
+            encode.assert_not_called()
+            self.client.get("/api/instructors/?page_size=1")
+            encode.assert_called()
+
+    @override_settings(CACHES={
+        **RESPONSE_CACHES,
+        "responses": {"BACKEND": "django.core.cache.backends.filebased.FileBasedCache", "LOCATION": os.path.join(tempfile.gettempdir(), "api-response-cache-test")},
+    })
+    def test_file_based_backend(self):
+        response_cache.clear()
+        first = self.client.get("/api/courses/")
+        with self.assertNumQueries(1):
+            second = self.client.get("/api/courses/")
+        self.assertEqual(second.content, first.content)
+        response_cache.clear()
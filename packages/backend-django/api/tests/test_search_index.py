@@ -0,0 +1,106 @@
+from io import StringIO
+from unittest import mock
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from api.models import Instructor, Course, Student, SearchDocument
+from api.services.search_index import SearchIndex
+
+
+ # ----------------- Search Index Tests -----------------
+class SearchIndexTests(APITestCase):
+    def setUp(self):
+        self.search_index = SearchIndex()
+        self.instructor = Instructor.objects.create(
+            name_first="Brock",
+            name_last="Pewter",
+            email="brock@pewtergym.com"
+        )
+        self.course = Course.objects.create(
+            course_code="ROCK-101",
+            title="Rock Types",
+            description="Geology for trainers",
+            description_full="Everything about rock types",
+            instructor=self.instructor,
+            start_date="2025-01-01",
+            end_date="2025-06-01",
+            course_fee=250.00
+        )
+        self.student = Student.objects.create(
+            name_first="Ash",
+            name_last="Ketchum",
+            email="ash@pallet.com"
+        )
+
+    def search_ids(self, model, query):
+        return self.search_index.search_ids(model, query)
+
+    def test_index_available_on_sqlite(self):
+        self.assertTrue(self.search_index.is_available())
+
+    def test_create_indexes_rows(self):
+        self.assertEqual(self.search_ids(Student, "Ketchum"), [self.student.id])
+        self.assertEqual(self.search_ids(Instructor, "brock@pewtergym.com"), [self.instructor.id])
+        self.assertEqual(self.search_ids(Course, "geology"), [self.course.id])
+
+    def test_prefix_match(self):
+        self.assertEqual(self.search_ids(Student, "Ketch"), [self.student.id])
+        self.assertEqual(self.search_ids(Course, "Ro Ty"), [self.course.id])
+
+    def test_update_reindexes_row(self):
+        self.student.name_last = "Satoshi"
+        self.student.save()
+        self.assertEqual(self.search_ids(Student, "Ketchum"), [])
+        self.assertEqual(self.search_ids(Student, "Satoshi"), [self.student.id])
+
+    def test_soft_delete_removes_row(self):
+        self.student.is_active = False
+        self.student.save()
+        self.assertEqual(self.search_ids(Student, "Ketchum"), [])
+        self.assertFalse(SearchDocument.objects.filter(object_id=self.student.id).exists())
+
+    def test_hard_delete_removes_row(self):
+        self.instructor.delete()
+        self.assertEqual(self.search_ids(Instructor, "Brock"), [])
+        self.assertEqual(self.search_ids(Course, "Rock"), [])
+        self.assertEqual(SearchDocument.objects.count(), 1)
+
+    def test_entities_are_kept_apart(self):
+        Instructor.objects.create(name_first="Ash", name_last="Teacher", email="ash@teachers.com")
+        self.assertEqual(self.search_ids(Student, "Ash"), [self.student.id])
+
+    def test_results_ranked_by_relevance(self):
+        delia = Student.objects.create(
+            name_first="Delia",
+            name_last="Ketchum",
+            email="ketchum@pallet.com"
+        )
+        self.assertEqual(self.search_ids(Student, "ketchum"), [delia.id, self.student.id])
+
+    def test_query_without_words_matches_nothing(self):
+        self.assertEqual(self.search_ids(Student, "@@ --"), [])
+        self.assertEqual(self.search_ids(Student, '"'), [])
+
+    def test_rebuild_repopulates_index(self):
+        Student.objects.bulk_create([
+            Student(name_first="Misty", name_last="Waterflower", email="misty@cerulean.com")
+        ])
+        self.assertEqual(self.search_ids(Student, "Misty"), [])
+
+        out = StringIO()
+        call_command("rebuild_search_index", stdout=out)
+
+        self.assertIn("student: 2 rows", out.getvalue())
+        self.assertEqual(len(self.search_ids(Student, "Misty")), 1)
+        self.assertEqual(self.search_ids(Course, "Rock"), [self.course.id])
+
+    def test_search_endpoint_uses_index(self):
+        response = self.client.get(reverse("search-all"), {"q": "Geology"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["courses"][0]["course_code"], "ROCK-101")
+
+    def test_search_endpoint_falls_back_without_index(self):
+        with mock.patch("api.views.search_index.is_available", return_value=False):
+            response = self.client.get(reverse("search-all"), {"q": "etchu"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["students"][0]["email"], "ash@pallet.com")
@@ -0,0 +1,143 @@
+import json
+import os
+import shutil
+import tempfile
+from io import StringIO
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection, transaction
+from django.test import override_settings
+from rest_framework.test import APITestCase
+from api.models import Student
+from api.services.slow_query_log import SlowQueryLog, fingerprint, normalize, read_entries
+
+
+ # ----------------- Slow Query Log Tests -----------------
+class SlowQueryLogTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        for i in range(3):
+            Student.objects.create(name_first=f"Gastly{i}", name_last="Lavender", email=f"gastly{i}@lavender.com")
+
+    def setUp(self):
+        log_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, log_dir)
+        self.log_file = os.path.join(log_dir, "slow.log")
+        log_settings = override_settings(SLOW_QUERY_LOG_FILE=self.log_file)
+        log_settings.enable()
+        self.addCleanup(log_settings.disable)
+
+    def logged(self, url):
+        with self.assertLogs("api.slow_queries", "WARNING") as logs:
+            response = self.client.get(url)
+        return response, [json.loads(record.getMessage()) for record in logs.records]
+
+    def test_fingerprint_ignores_values(self):
+        self.assertEqual(
+            fingerprint('SELECT "id" FROM "api_student" WHERE "id" IN (%s, %s) LIMIT 20 OFFSET 40'),
+            fingerprint('SELECT  "id" FROM "api_student"\nWHERE "id" IN (%s) LIMIT 100 OFFSET 0'),
+        )
+        self.assertNotEqual(fingerprint('SELECT "id" FROM "api_student"'), fingerprint('SELECT "id" FROM "api_course"'))
+        self.assertEqual(normalize("SELECT 'a''b', \"col1\" FROM t WHERE x = %s"), 'SELECT ?, "col1" FROM t WHERE x = ?')
+
+    @override_settings(SLOW_QUERY_MS=0)
+    def test_statements_over_threshold_logged_with_origin_and_plan(self):
+        response, entries = self.logged("/api/students/?name_last=Lavender")
+        self.assertEqual(response.status_code, 200)
+        # Every statement is logged once; the log's own EXPLAINs are neither logged nor counted
+        self.assertIn(f'desc="{len(entries)} queries"', response["Server-Timing"])
+        self.assertFalse(any(entry["sql"].startswith("EXPLAIN") for entry in entries))
+        page = next(entry for entry in entries if "LIMIT" in entry["sql"])
+        self.assertEqual(page["view"], "student-list")
+        self.assertEqual(page["method"], "GET")
+        self.assertEqual(page["path"], "/api/students/")
+        self.assertIn("students", page["route"])
+        self.assertEqual(page["fingerprint"], fingerprint(page["sql"]))
+        self.assertIsInstance(page["params"], list)
+        self.assertTrue(page["plan"])
+
+    @override_settings(SLOW_QUERY_MS=0)
+    def test_entries_written_to_log_file(self):
+        self.client.get("/api/students/")
+        entries = list(read_entries([self.log_file]))
+        self.assertTrue(entries)
+        self.assertTrue(all(entry["view"] == "student-list" for entry in entries))
+
+    def test_only_dml_is_explained(self):
+        log = SlowQueryLog()
+        self.assertTrue(log.explain('SELECT "id" FROM "api_student" WHERE "id" = %s', [1]))
+        with transaction.atomic():
+            sid = transaction.savepoint()
+            self.assertIsNone(log.explain(f'RELEASE SAVEPOINT "{sid}"', None))
+            self.assertIsNone(log.explain('CREATE TABLE "slow_log_probe" ("id" integer)', None))
+        self.assertNotIn("slow_log_probe", connection.introspection.table_names())
+
+    def test_failed_explain_leaves_transaction_usable(self):
+        with transaction.atomic():
+            self.assertIsNone(SlowQueryLog().explain('SELECT * FROM "no_such_table"', None))
+            self.assertEqual(Student.objects.count(), 3)
+
+    @override_settings(SLOW_QUERY_MS=None)
+    def test_disabled(self):
+        with self.assertNoLogs("api.slow_queries"):
+            self.client.get("/api/students/")
+
+    def test_fast_statements_not_logged(self):
+        with self.assertNoLogs("api.slow_queries"):
+            self.client.get("/api/students/")
+
+
+ # ----------------- Slow Queries Command Tests -----------------
+class SlowQueriesCommandTests(APITestCase):
+    def setUp(self):
+        self.log_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.log_dir)
+        self.path = os.path.join(self.log_dir, "slow.log")
+
+    def entry(self, sql, duration, view="student-list", time="2025-01-01T00:00:00+00:00"):
+        return {
+            "time": time, "duration_ms": duration, "fingerprint": fingerprint(sql), "sql": sql,
+            "params": [1], "many": False, "method": "GET", "path": "/api/students/",
+            "route": "api/^students/$", "view": view, "plan": ["SCAN api_student"],
+        }
+
+    def write(self, path, entries):
+        with open(path, "w") as f:
+            for entry in entries:
+                f.write(json.dumps(entry) + "\n")
+
+    def run_command(self, *args):
+        out = StringIO()
+        call_command("slow_queries", "--file", self.path, *args, stdout=out)
+        return out.getvalue()
+
+    def test_groups_by_fingerprint_across_rotated_files(self):
+        listing = 'SELECT * FROM "api_student" LIMIT 20'
+        self.write(f"{self.path}.1", [self.entry(listing, 150.0), self.entry('SELECT * FROM "api_course"', 400.0, "course-list")])
+        self.write(self.path, [self.entry(listing.replace("20", "100"), 250.0)])
+        with open(self.path, "a") as f:
+            f.write("truncated line\n")
+
+        groups = json.loads(self.run_command("--json"))
+        self.assertEqual([group["count"] for group in groups], [2, 1])
+        self.assertEqual(groups[0]["total_ms"], 400.0)
+        self.assertEqual(groups[0]["max_ms"], 250.0)
+        self.assertEqual(groups[0]["routes"], {"GET student-list": 2})
+        self.assertEqual(groups[0]["slowest"]["duration_ms"], 250.0)
+
+        by_max = json.loads(self.run_command("--json", "--sort", "max"))
+        self.assertEqual(by_max[0]["routes"], {"GET course-list": 1})
+
+    def test_text_report_and_view_filter(self):
+        self.write(self.path, [
+            self.entry('SELECT * FROM "api_student"', 150.0),
+            self.entry('SELECT * FROM "api_course"', 400.0, "course-list"),
+        ])
+        output = self.run_command("--view", "student-list")
+        self.assertIn('SELECT * FROM "api_student"', output)
+        self.assertIn("SCAN api_student", output)
+        self.assertNotIn("api_course", output)
+
+    def test_missing_log(self):
+        with self.assertRaises(CommandError):
+            self.run_command()
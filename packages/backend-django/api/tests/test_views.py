@@ -1,7 +1,12 @@
+from unittest import mock
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework.test import APITestCase
 from rest_framework import status
 from api.models import Instructor, Course, Student, Registration
+from api.signals import prerequisite_service
+from api.views import StudentViewSet
 
 
  # ----------------- Registration Tests -----------------
@@ -703,6 +708,49 @@ class StudentTests(APITestCase):
         self.assertEqual(response.status_code, 200)
         self.assertGreaterEqual(len(response.data), 1)
 
+    def test_student_filters_combine(self):
+        instructor = Instructor.objects.create(
+            name_first="Lt.",
+            name_last="Surge",
+            email="surge@vermillion.com"
+        )
+        courses = [
+            Course.objects.create(
+                course_code=f"ELEC-10{i}",
+                title="Electric Mastery",
+                description="Harness electric powers",
+                description_full="Electric techniques",
+                instructor=instructor,
+                start_date="2025-04-01",
+                end_date="2025-10-01",
+                course_fee=500.00
+            )
+            for i in range(2)
+        ]
+        pikachu, raichu, magnemite, voltorb = [
+            Student.objects.create(name_first=name, name_last="Trainer", email=f"{name.lower()}@kanto.com")
+            for name in ["Pikachu", "Raichu", "Magnemite", "Voltorb"]
+        ]
+        Registration.objects.create(student=pikachu, course=courses[0])
+        Registration.objects.create(student=raichu, course=courses[1])
+        Registration.objects.create(student=voltorb, course=courses[0], registration_status="cancelled")
+
+        def names(query):
+            response = self.client.get(f"/api/students/?{query}")
+            self.assertEqual(response.status_code, 200)
+            return {row["name_first"] for row in response.data["results"]}
+
+        self.assertEqual(names(f"course_id={courses[0].id}"), {"Pikachu"})
+        self.assertEqual(names(f"course_id={courses[0].id}&eligible_for_course=true"), {"Raichu", "Magnemite", "Voltorb"})
+        self.assertEqual(names(f"instructor_id={instructor.id}"), {"Pikachu", "Raichu"})
+        self.assertEqual(names(f"course_id={courses[1].id}&instructor_id={instructor.id}"), {"Raichu"})
+        for not_exists in [False, True]:
+            with mock.patch.object(StudentViewSet, "anti_join_with_not_exists", return_value=not_exists):
+                self.assertEqual(
+                    names(f"course_id={courses[1].id}&instructor_id={instructor.id}&eligible_for_course=true"),
+                    {"Magnemite", "Voltorb"}
+                )
+
 
  # ----------------- Dashboard Tests -----------------
 class DashboardTests(APITestCase):
@@ -858,4 +906,212 @@ class SearchTests(APITestCase):
         url = reverse("search-all")
         response = self.client.get(url)  # No "q" parameter provided
         self.assertEqual(response.status_code, 400)
-        self.assertIn("Missing search query parameter", response.data["error"])
\ No newline at end of file
+        self.assertIn("Missing search query parameter", response.data["error"])
+
+ # ----------------- Search Pagination Tests -----------------
+class SearchPaginationTests(APITestCase):
+    def setUp(self):
+        self.instructor = Instructor.objects.create(
+            name_first="Sabrina",
+            name_last="Saffron",
+            email="sabrina@saffron.com"
+        )
+        self.course = Course.objects.create(
+            course_code="PSY-201",
+            title="Psychic Training",
+            description="Mind over matter",
+            description_full="Advanced psychic training",
+            instructor=self.instructor,
+            start_date="2025-02-01",
+            end_date="2025-08-01",
+            course_fee=500.00
+        )
+        self.students = [
+            Student.objects.create(
+                name_first=f"Trainer{i}",
+                name_last="Kanto",
+                email=f"trainer{i}@kanto.com"
+            )
+            for i in range(5)
+        ]
+        for student in self.students:
+            Registration.objects.create(student=student, course=self.course)
+
+    def collect_section(self, section, limit=2):
+        url = reverse("search-all")
+        response = self.client.get(url, {"q": "Kanto" if section == "students" else "registered", "limit": limit})
+        self.assertEqual(response.status_code, 200)
+        ids = [row["id"] for row in response.data[section]]
+        next_cursor = response.data["meta"][section]["next"]
+        while next_cursor:
+            response = self.client.get(url, {
+                "q": "Kanto" if section == "students" else "registered",
+                "limit": limit,
+                "section": section,
+                "cursor": next_cursor,
+            })
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(list(response.data["meta"]), [section])
+            ids += [row["id"] for row in response.data[section]]
+            next_cursor = response.data["meta"][section]["next"]
+        return ids
+
+    def test_search_limit_bounds_each_section(self):
+        response = self.client.get(reverse("search-all"), {"q": "Kanto", "limit": 2})
+        self.assertEqual(len(response.data["students"]), 2)
+        self.assertEqual(response.data["meta"]["students"]["count"], 5)
+        self.assertTrue(response.data["meta"]["students"]["count_is_exact"])
+        self.assertIsNotNone(response.data["meta"]["students"]["next"])
+
+    def test_search_cursor_walks_ranked_section(self):
+        ids = self.collect_section("students")
+        self.assertEqual(sorted(ids), sorted(str(student.id) for student in self.students))
+
+    def test_search_cursor_walks_keyset_section(self):
+        ids = self.collect_section("registrations")
+        self.assertEqual(len(ids), 5)
+        self.assertEqual(len(set(ids)), 5)
+
+    def test_search_cursor_walks_fallback_section(self):
+        with mock.patch("api.views.search_index.is_available", return_value=False):
+            ids = self.collect_section("students")
+        self.assertEqual(sorted(ids), sorted(str(student.id) for student in self.students))
+
+    def test_search_count_capped(self):
+        with mock.patch("api.views.SEARCH_COUNT_CAP", 3):
+            response = self.client.get(reverse("search-all"), {"q": "Kanto"})
+        self.assertEqual(response.data["meta"]["students"]["count"], 3)
+        self.assertFalse(response.data["meta"]["students"]["count_is_exact"])
+
+    def test_search_invalid_cursor(self):
+        response = self.client.get(reverse("search-all"), {"q": "Kanto", "section": "students", "cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_search_cursor_requires_section(self):
+        response = self.client.get(reverse("search-all"), {"q": "Kanto", "cursor": "e30="})
+        self.assertEqual(response.status_code, 400)
+
+    def test_search_unknown_section(self):
+        response = self.client.get(reverse("search-all"), {"q": "Kanto", "section": "payments"})
+        self.assertEqual(response.status_code, 400)
+
+
+ # ----------------- Bulk Registration Tests -----------------
+class BulkRegistrationTests(APITestCase):
+    url = "/api/registrations/register-bulk/"
+
+    def setUp(self):
+        self.instructor = Instructor.objects.create(
+            name_first="Blaine",
+            name_last="Cinnabar",
+            email="blaine@cinnabar.com"
+        )
+        self.prereq_course = Course.objects.create(
+            course_code="FIRE-101",
+            title="Fire Basics",
+            description="Basics",
+            description_full="Fire type basics",
+            instructor=self.instructor,
+            start_date="2025-01-01",
+            end_date="2025-03-01",
+            course_fee=100.00
+        )
+        self.advanced_course = Course.objects.create(
+            course_code="FIRE-201",
+            title="Advanced Fire",
+            description="Advanced",
+            description_full="Advanced fire types",
+            instructor=self.instructor,
+            start_date="2025-04-01",
+            end_date="2025-06-01",
+            course_fee=200.00,
+            prerequisites=["FIRE-101"]
+        )
+        self.students = [
+            Student.objects.create(
+                name_first=f"Cohort{i}",
+                name_last="Member",
+                email=f"cohort{i}@corp.com"
+            )
+            for i in range(3)
+        ]
+
+    def pair(self, student, course):
+        return {"student_id": str(student.id), "course_id": str(course.id)}
+
+    def test_bulk_register_cohort(self):
+        data = {"registrations": [self.pair(student, self.prereq_course) for student in self.students]}
+        response = self.client.post(self.url, data, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["registered"], 3)
+        self.assertEqual(response.data["failed"], 0)
+        self.assertTrue(all(result["status"] == "registered" for result in response.data["results"]))
+        self.assertEqual(Registration.objects.filter(course=self.prereq_course).count(), 3)
+        self.assertEqual(self.client.get(reverse("dashboard-summary")).data["registrationCount"], 3)
+
+    def test_bulk_register_per_item_errors(self):
+        Registration.objects.create(student=self.students[0], course=self.prereq_course)
+        data = {"registrations": [
+            self.pair(self.students[0], self.prereq_course),
+            self.pair(self.students[1], self.prereq_course),
+            self.pair(self.students[1], self.prereq_course),
+            self.pair(self.students[0], self.advanced_course),
+            self.pair(self.students[2], self.advanced_course),
+            {"student_id": str(self.students[2].id)},
+            {"student_id": "not-a-uuid", "course_id": str(self.prereq_course.id)},
+            {"student_id": str(self.instructor.id), "course_id": str(self.prereq_course.id)},
+        ]}
+        response = self.client.post(self.url, data, format="json")
+        self.assertEqual(response.status_code, 200)
+        results = response.data["results"]
+        self.assertEqual([result["status"] for result in results], [
+            "error", "registered", "error", "registered", "error", "error", "error", "error"
+        ])
+        self.assertIn("already registered", results[0]["error"])
+        self.assertIn("Duplicate", results[2]["error"])
+        self.assertIn("missing required prerequisites", results[4]["error"])
+        self.assertIn("required", results[5]["error"])
+        self.assertIn("UUIDs", results[6]["error"])
+        self.assertEqual(results[7]["error"], "Student not found.")
+        self.assertEqual(response.data["registered"], 2)
+
+    def test_bulk_register_query_count_independent_of_batch_size(self):
+        for student in self.students:
+            Registration.objects.create(student=student, course=self.prereq_course)
+        extra_course = Course.objects.create(
+            course_code="FIRE-301",
+            title="Expert Fire",
+            description="Expert",
+            description_full="Expert fire types",
+            instructor=self.instructor,
+            start_date="2025-07-01",
+            end_date="2025-09-01",
+            course_fee=300.00,
+            prerequisites=["FIRE-101"]
+        )
+        prerequisite_service.graph()
+        with CaptureQueriesContext(connection) as small:
+            response = self.client.post(self.url, {"registrations": [
+                self.pair(self.students[0], self.advanced_course)
+            ]}, format="json")
+        self.assertEqual(response.data["registered"], 1)
+        with CaptureQueriesContext(connection) as large:
+            response = self.client.post(self.url, {"registrations": [
+                self.pair(student, extra_course) for student in self.students
+            ]}, format="json")
+        self.assertEqual(response.data["registered"], 3)
+        self.assertEqual(len(small.captured_queries), len(large.captured_queries))
+
+    def test_bulk_register_requires_list(self):
+        response = self.client.post(self.url, {"registrations": []}, format="json")
+        self.assertEqual(response.status_code, 400)
+        response = self.client.post(self.url, {}, format="json")
+        self.assertEqual(response.status_code, 400)
+        response = self.client.post(self.url, [self.pair(self.students[0], self.advanced_course)], format="json")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data["error"], "registrations must be a non-empty list")
+
+    def test_bulk_register_size_limit(self):
+        data = {"registrations": [self.pair(self.students[0], self.prereq_course)] * 1001}
+        response = self.client.post(self.url, data, format="json")
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,226 @@
+import threading
+from contextvars import ContextVar
+from time import perf_counter
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+from django.utils.timezone import now
+from .services.slow_query_log import SlowQueryLog
+
+# The RequestTiming of the request being served, for code below the middleware (serializers)
+current_timing = ContextVar("request_timing", default=None)
+slow_query_log = SlowQueryLog()
+
+
+class RequestTiming:
+    """Where one request's time went, in seconds. Phases overlap: queries run inside the view and
+    the serializers, and serializers run inside the view before DRF renders the response. Async
+    views may run queries from several threads at once, so ``sql`` can exceed the view's time."""
+
+    __slots__ = (
+        "queries", "sql", "serialize", "view", "serializing", "request", "slow_threshold", "explaining", "lock",
+    )
+
+    def __init__(self, request=None, slow_threshold=None):
+        self.queries = 0
+        self.sql = 0.0
+        self.serialize = 0.0
+        self.view = 0.0
+        self.serializing = False
+        self.request = request
+        self.slow_threshold = slow_threshold
+        # Ident of the thread running the slow-query log's EXPLAIN, if any
+        self.explaining = None
+        self.lock = threading.Lock()
+
+    def record_query(self, execute, sql, params, many, context):
+        if self.explaining == threading.get_ident():
+            # The slow-query log's own EXPLAIN is not part of the request
+            return execute(sql, params, many, context)
+        start = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = perf_counter() - start
+            with self.lock:
+                self.sql += elapsed
+                self.queries += 1
+            if self.slow_threshold is not None and elapsed >= self.slow_threshold:
+                self.explaining = threading.get_ident()
+                try:
+                    slow_query_log.record(sql, params, many, elapsed, self.request)
+                finally:
+                    self.explaining = None
+
+    def server_timing(self, total):
+        """The Server-Timing header value, durations in milliseconds."""
+        return ", ".join([
+            f'db;dur={self.sql * 1000:.3f};desc="{self.queries} queries"',
+            f"view;dur={self.view * 1000:.3f}",
+            f"serialize;dur={self.serialize * 1000:.3f}",
+            f"total;dur={total * 1000:.3f}",
+        ])
+
+
+def record_current_query(execute, sql, params, many, context):
+    """Execute wrapper timing the statement into the current request's RequestTiming, if any."""
+    timing = current_timing.get()
+    if timing is None:
+        return execute(sql, params, many, context)
+    return timing.record_query(execute, sql, params, many, context)
+
+
+@receiver(connection_created)
+def install_query_timer(sender, connection, **kwargs):
+    """Install ``record_current_query`` on every connection, in every thread, once.
+
+    Under ASGI, sync views run on a worker thread and the async views' concurrent sections on
+    executor threads, each with its own connection; the request's RequestTiming follows them
+    there through ``current_timing``, which asgiref copies into each thread.
+    """
+    if record_current_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_current_query)
+
+
+class TimedRepresentationMixin:
+    """Serializer mixin adding ``to_representation`` time to the current request's ``serialize``.
+
+    Only the outermost call is timed, so nested and ``many=True`` serializers count once.
+    """
+
+    def to_representation(self, instance):
+        timing = current_timing.get()
+        if timing is None or timing.serializing:
+            return super().to_representation(instance)
+        timing.serializing = True
+        start = perf_counter()
+        try:
+            return super().to_representation(instance)
+        finally:
+            timing.serialize += perf_counter() - start
+            timing.serializing = False
+
+
+class RouteTimings:
+    """Per-route request counts and time totals for this process, read by ``/api/internal/timings/``.
+
+    Routes are keyed by method and URL name (e.g. "GET student-list"), so every id shares a row.
+    """
+
+    FIELDS = ("total", "sql", "view", "serialize")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.routes = {}
+            self.since = now()
+
+    def record(self, route, timing, total):
+        with self.lock:
+            stats = self.routes.get(route)
+            if stats is None:
+                stats = self.routes[route] = {"count": 0, "queries": 0, "max": 0.0, **dict.fromkeys(self.FIELDS, 0.0)}
+            stats["count"] += 1
+            stats["queries"] += timing.queries
+            stats["total"] += total
+            stats["sql"] += timing.sql
+            stats["view"] += timing.view
+            stats["serialize"] += timing.serialize
+            stats["max"] = max(stats["max"], total)
+
+    def snapshot(self):
+        """Per-route means in milliseconds, the routes with the most total time first."""
+        with self.lock:
+            routes = {route: dict(stats) for route, stats in self.routes.items()}
+            since = self.since
+        rows = []
+        for route, stats in sorted(routes.items(), key=lambda item: -item[1]["total"]):
+            count = stats["count"]
+            rows.append({
+                "route": route,
+                "count": count,
+                "total_ms": round(stats["total"] * 1000, 3),
+                "max_ms": round(stats["max"] * 1000, 3),
+                "mean_queries": round(stats["queries"] / count, 2),
+                **{f"mean_{field}_ms": round(stats[field] * 1000 / count, 3) for field in self.FIELDS},
+            })
+        return {"since": since, "routes": rows}
+
+
+route_timings = RouteTimings()
+
+
+class RequestTimingMiddleware:
+    """Times SQL, view and serialization per request and reports them in a Server-Timing header.
+
+    SQL goes through ``record_current_query``, installed on every connection, which also hands
+    statements slower than SLOW_QUERY_MS to the slow-query log. View time runs from
+    ``process_view`` until the view returns; DRF then renders the response, which counts as
+    serialization together with serializer ``to_representation`` calls. Runs natively in both
+    WSGI and ASGI middleware chains. Disabled with REQUEST_TIMING=False.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.REQUEST_TIMING:
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        timing = self.start_timing(request)
+        token = current_timing.set(timing)
+        start = perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            current_timing.reset(token)
+        return self.finish_timing(request, response, timing, start)
+
+    async def __acall__(self, request):
+        timing = self.start_timing(request)
+        token = current_timing.set(timing)
+        start = perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            current_timing.reset(token)
+        return self.finish_timing(request, response, timing, start)
+
+    def start_timing(self, request):
+        threshold = settings.SLOW_QUERY_MS
+        request.timing = RequestTiming(request, None if threshold is None else threshold / 1000)
+        return request.timing
+
+    def finish_timing(self, request, response, timing, start):
+        end = perf_counter()
+
+        view_started = getattr(request, "_timing_view_started", None)
+        if view_started is not None:
+            view_ended = getattr(request, "_timing_view_ended", end)
+            timing.view = view_ended - view_started
+            # Rendering after the view returned (DRF responses) is serialization too
+            timing.serialize += end - view_ended
+        total = end - start
+        response["Server-Timing"] = timing.server_timing(total)
+
+        match = request.resolver_match
+        route = match.view_name if match else "unresolved"
+        route_timings.record(f"{request.method} {route}", timing, total)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request._timing_view_started = perf_counter()
+
+    def process_template_response(self, request, response):
+        request._timing_view_ended = perf_counter()
+        return response
@@ -1,6 +1,7 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import InstructorViewSet, CourseViewSet, StudentViewSet, RegistrationViewSet, dashboard_summary, search_all
+from . import async_views
+from .views import InstructorViewSet, CourseViewSet, StudentViewSet, RegistrationViewSet, dashboard_summary, search_all, request_timings
 
 router = DefaultRouter()
 router.register(r'instructors', InstructorViewSet)
@@ -12,5 +13,9 @@ urlpatterns = [
     path('', include(router.urls)),
     path('search/', search_all, name='search-all'),
     path('dashboard-summary/', dashboard_summary, name='dashboard-summary'),
+    # Async variants for ASGI deployments (core.asgi)
+    path('search/async/', async_views.search_all, name='search-all-async'),
+    path('dashboard-summary/async/', async_views.dashboard_summary, name='dashboard-summary-async'),
+    path('internal/timings/', request_timings, name='request-timings'),
 
 ]
\ No newline at end of file
@@ -1,23 +1,44 @@
+import base64
+import json
+from datetime import datetime
+from uuid import UUID
 from .models import Instructor, Course, Student, Registration
 from .serializers import InstructorSerializer, CourseSerializer, StudentSerializer, RegistrationSerializer, CourseListSerializer
 from rest_framework import viewsets, filters
-from rest_framework.pagination import PageNumberPagination
+from .pagination import StandardResultsSetPagination, capped_count
+from .conditional import ConditionalGetMixin, conditional_response
+from .export import ExportMixin
+from .fieldsets import SparseFieldsetMixin
+from .fast_read import FastListMixin
 from rest_framework.decorators import api_view, action
 from rest_framework.response import Response
+from django.conf import settings
 from django.utils.timezone import now
-from django.db import transaction
+from django.db import connection, transaction
+from django.db.models import Count, Exists, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
 from .services.email_service import EmailService
+from .services.table_versions import make_etag
+from .signals import search_index, counter_service, prerequisite_service, table_versions
+from .timing import route_timings
 from django.core.exceptions import ValidationError
 
-class StandardResultsSetPagination(PageNumberPagination):
-    page_size = 25
-    page_size_query_param = "page_size"
-    max_page_size = 100
+BULK_REGISTRATION_MAX = 1000
 
-class InstructorViewSet(viewsets.ModelViewSet):
+def select_registration_related(queryset):
+    """Join the student and course columns that RegistrationSerializer reads."""
+    return queryset.select_related("student", "course").only(
+        "id", "created_at", "updated_at", "registered_at", "registration_status", "payment_status", "is_active",
+        "student__id", "student__name_first", "student__name_last",
+        "course__id", "course__title",
+    )
+
+class InstructorViewSet(ConditionalGetMixin, SparseFieldsetMixin, FastListMixin, viewsets.ModelViewSet):
     queryset = Instructor.objects.filter(is_active=True).order_by("-created_at")
     serializer_class = InstructorSerializer
     pagination_class = StandardResultsSetPagination
+    version_models = [Instructor]
+    cache_responses = True
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
     search_fields = ["name_first", "name_last", "email"]
     ordering_fields = ["name_last"]
@@ -44,13 +65,15 @@ class InstructorViewSet(viewsets.ModelViewSet):
         instance.save()
         return Response(status=204)
 
-class CourseViewSet(viewsets.ModelViewSet):
+class CourseViewSet(ConditionalGetMixin, ExportMixin, SparseFieldsetMixin, FastListMixin, viewsets.ModelViewSet):
     queryset = Course.objects.filter(is_active=True).order_by("-created_at")
     serializer_class = CourseSerializer
     pagination_class = StandardResultsSetPagination
+    version_models = [Course, Instructor, Registration]
+    cache_responses = True
 
     def get_serializer_class(self):
-        if self.action == "list":
+        if self.action in ("list", "export"):
             return CourseListSerializer
         return CourseSerializer
 
@@ -62,6 +85,18 @@ class CourseViewSet(viewsets.ModelViewSet):
         instructor_id = self.request.query_params.get("instructor_id")
         if instructor_id:
             queryset = queryset.filter(instructor_id=instructor_id)
+        if self.action in ("list", "export") and self.wants_field("enrollment_count"):
+            # Join the instructor and count enrollments in the page query instead of issuing
+            # two extra queries per row in CourseListSerializer. A correlated subquery (rather
+            # than JOIN + GROUP BY) keeps the paginator's COUNT(*) a plain index scan.
+            queryset = queryset.select_related("instructor").annotate(
+                enrollment_count=Coalesce(Subquery(
+                    Registration.objects.filter(course=OuterRef("pk"))
+                    .values("course")
+                    .annotate(count=Count("*"))
+                    .values("count")
+                ), 0)
+            )
         return queryset
             
     def destroy(self, request, *args, **kwargs):
@@ -77,10 +112,11 @@ class CourseViewSet(viewsets.ModelViewSet):
         instance.save()
         return Response(status=204)
     
-class StudentViewSet(viewsets.ModelViewSet):
+class StudentViewSet(ConditionalGetMixin, ExportMixin, SparseFieldsetMixin, FastListMixin, viewsets.ModelViewSet):
     queryset = Student.objects.filter(is_active=True).order_by("-created_at")
     serializer_class = StudentSerializer
     pagination_class = StandardResultsSetPagination
+    version_models = [Student, Registration, Course]
 
     def get_queryset(self):
         queryset = super().get_queryset().filter(is_active=True)
@@ -88,30 +124,37 @@ class StudentViewSet(viewsets.ModelViewSet):
         eligible = self.request.query_params.get("eligible_for_course")
 
         if course_id:
-            registered_ids = Registration.objects.filter(
-                registration_status="registered",
-                course_id=course_id
-            ).values_list("student_id", flat=True)
-            if eligible == "true":
-                queryset = queryset.exclude(id__in=registered_ids)
-            else:
-                queryset = queryset.filter(id__in=registered_ids)
+            queryset = self.filter_registered(queryset, eligible == "true", course_id=course_id)
 
         instructor_id = self.request.query_params.get("instructor_id")
 
         if instructor_id:
-            registered_ids = Registration.objects.filter(
-                registration_status="registered",
-                course__instructor_id=instructor_id
-            ).values_list("student_id", flat=True)
-            if eligible == "true":
-                queryset = queryset.exclude(id__in=registered_ids)
-            else:
-                queryset = queryset.filter(id__in=registered_ids)
-
+            # Match the instructor's course ids rather than joining api_course for every registration
+            instructor_courses = Course.objects.filter(instructor_id=instructor_id).values("id")
+            queryset = self.filter_registered(queryset, eligible == "true", course_id__in=instructor_courses)
 
         return queryset
 
+    def filter_registered(self, queryset, eligible, **registration_filters):
+        """Keep students with a registration matching ``registration_filters``, or only those without one when ``eligible``.
+
+        Each call adds one subquery (IN / NOT IN, or a correlated NOT EXISTS off SQLite; see
+        ``anti_join_with_not_exists``), so course and instructor filters combine with AND and no id
+        list is ever pulled into Python. Registered students are a semi-join driven from
+        reg_course_status_idx, which stays cheap for the usual small course.
+        """
+        registrations = Registration.objects.filter(registration_status="registered", **registration_filters)
+        if not eligible:
+            return queryset.filter(id__in=registrations.values("student_id"))
+        if self.anti_join_with_not_exists():
+            return queryset.filter(~Exists(registrations.filter(student=OuterRef("pk"))))
+        return queryset.exclude(id__in=registrations.values("student_id"))
+
+    def anti_join_with_not_exists(self):
+        # Planners with a real anti-join (PostgreSQL) want NOT EXISTS; SQLite runs it as a probe per
+        # student but builds the NOT IN subquery once into an ephemeral index, which is 2-3x faster
+        return connection.vendor != "sqlite"
+
     def destroy(self, request, *args, **kwargs):
         instance = self.get_object()
         # Check for active or upcoming registrations before marking inactive
@@ -130,10 +173,11 @@ class StudentViewSet(viewsets.ModelViewSet):
         return Response(status=204)
 
 
-class RegistrationViewSet(viewsets.ModelViewSet):
+class RegistrationViewSet(ConditionalGetMixin, ExportMixin, SparseFieldsetMixin, FastListMixin, viewsets.ModelViewSet):
     queryset = Registration.objects.filter(is_active=True).order_by("-created_at")
     serializer_class = RegistrationSerializer
     pagination_class = StandardResultsSetPagination
+    version_models = [Registration, Student, Course]
 
     email_service = EmailService()    
 
@@ -145,7 +189,7 @@ class RegistrationViewSet(viewsets.ModelViewSet):
             queryset = queryset.filter(student_id=student_id)
         if course_id:
             queryset = queryset.filter(course_id=course_id)
-        return queryset
+        return select_registration_related(queryset)
 
     @transaction.atomic
     @action(detail=False, methods=["post"], url_path="unregister")
@@ -190,7 +234,7 @@ class RegistrationViewSet(viewsets.ModelViewSet):
             course_id=course_id,
             registration_status="registered",
             is_active=True
-        ).first()
+        ).exists()
 
         if existing_registration:
             return Response({"error": "Student is already registered for this course."}, status=400)
@@ -200,20 +244,7 @@ class RegistrationViewSet(viewsets.ModelViewSet):
             student = Student.objects.get(id=student_id)
 
             # Check for missing prerequisites
-            missing_prereqs = []
-            for prereq_code in course.prerequisites:
-                completed_course = Course.objects.filter(course_code=prereq_code).first()
-                if not completed_course:
-                    missing_prereqs.append(prereq_code)
-                    continue
-                completed_registration = Registration.objects.filter(
-                    student=student,
-                    course=completed_course,
-                    registration_status="registered",
-                    is_active=True
-                ).exists()
-                if not completed_registration:
-                    missing_prereqs.append(prereq_code)
+            missing_prereqs = prerequisite_service.missing_prerequisites(student, course)
 
             if missing_prereqs:
                 return Response(
@@ -234,19 +265,150 @@ class RegistrationViewSet(viewsets.ModelViewSet):
         except Exception as e:
             return Response({"error": str(e)}, status=500)
 
+    @transaction.atomic
+    @action(detail=False, methods=["post"], url_path="register-bulk")
+    def register_students_bulk(self, request):
+        """Register many (student_id, course_id) pairs at once, validating set-wise.
+
+        Prerequisites are checked against registrations that exist before the request, so a
+        pair cannot satisfy another pair's prerequisite in the same batch.
+        """
+        items = request.data.get("registrations") if isinstance(request.data, dict) else None
+        if not isinstance(items, list) or not items:
+            return Response({"error": "registrations must be a non-empty list"}, status=400)
+        if len(items) > BULK_REGISTRATION_MAX:
+            return Response({"error": f"At most {BULK_REGISTRATION_MAX} registrations per request"}, status=400)
+
+        results = []
+        pairs = {}
+        for index, item in enumerate(items):
+            student_id = item.get("student_id") if isinstance(item, dict) else None
+            course_id = item.get("course_id") if isinstance(item, dict) else None
+            results.append({"student_id": student_id, "course_id": course_id, "status": "error"})
+            if not student_id or not course_id:
+                results[index]["error"] = "student_id and course_id are required"
+                continue
+            try:
+                pair = (UUID(str(student_id)), UUID(str(course_id)))
+            except ValueError:
+                results[index]["error"] = "student_id and course_id must be UUIDs"
+                continue
+            if pair in pairs:
+                results[index]["error"] = "Duplicate of an earlier item in this request."
+                continue
+            pairs[pair] = index
+
+        students = Student.objects.in_bulk({student_id for student_id, _ in pairs})
+        courses = Course.objects.in_bulk({course_id for _, course_id in pairs})
+        already_registered = set(Registration.objects.filter(
+            student_id__in=students.keys(),
+            course_id__in=courses.keys(),
+            registration_status="registered",
+            is_active=True
+        ).values_list("student_id", "course_id"))
+
+        graph = prerequisite_service.graph()
+        required_ids = {
+            graph[code]["id"]
+            for course in courses.values()
+            for code in course.prerequisites
+            if code in graph
+        }
+        completed = prerequisite_service.completed_course_ids(students.keys(), required_ids) if required_ids else {}
+
+        to_create = []
+        for (student_id, course_id), index in pairs.items():
+            student = students.get(student_id)
+            course = courses.get(course_id)
+            if student is None or course is None:
+                results[index]["error"] = "Student not found." if student is None else "Course not found."
+                continue
+            if (student_id, course_id) in already_registered:
+                results[index]["error"] = "Student is already registered for this course."
+                continue
+            student_completed = completed.get(student_id, set())
+            missing_prereqs = [
+                code for code in course.prerequisites
+                if code not in graph or graph[code]["id"] not in student_completed
+            ]
+            if missing_prereqs:
+                results[index]["error"] = f"Student is missing required prerequisites: {missing_prereqs}"
+                continue
+            to_create.append((index, Registration(
+                student=student,
+                course=course,
+                registration_status="registered",
+                payment_status="pending"
+            )))
+
+        Registration.objects.bulk_create([registration for _, registration in to_create], batch_size=500)
+        # bulk_create skips the post_save hooks that maintain the dashboard counters and table versions
+        counter_service.adjust(Registration, len(to_create))
+        table_versions.bump(Registration)
+
+        for index, registration in to_create:
+            results[index].update(status="registered", registration_id=str(registration.id))
+        self.email_service.send_registration_emails(
+            (registration.student, registration.course) for _, registration in to_create
+        )
+
+        return Response({
+            "registered": len(to_create),
+            "failed": len(results) - len(to_create),
+            "results": results,
+        })
+
     def destroy(self, request, *args, **kwargs):
         instance = self.get_object()
         instance.is_active = False
         instance.save()
         return Response(status=204)
 
-@api_view(["GET"])
-def search_all(request):
-    query = request.query_params.get("q", "").strip()
-
-    if not query:
-        return Response({"error": "Missing search query parameter 'q'"}, status=400)
-
+SEARCH_DEFAULT_LIMIT = 20
+SEARCH_MAX_LIMIT = 100
+SEARCH_COUNT_CAP = 1000
+
+def encode_search_cursor(position):
+    return base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+
+def decode_search_cursor(token):
+    try:
+        position = json.loads(base64.urlsafe_b64decode(token.encode()))
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor.")
+    if not isinstance(position, dict):
+        raise ValueError("Invalid cursor.")
+    return position
+
+def ranked_section(queryset, query, limit, position):
+    """A page of FTS5 matches in rank order, continued by offset."""
+    offset = position.get("offset", 0)
+    if not isinstance(offset, int) or offset < 0:
+        raise ValueError("Invalid cursor.")
+    objects = search_index.search(queryset, query, limit + 1, offset)
+    next_position = {"offset": offset + limit} if len(objects) > limit else None
+    return objects[:limit], next_position, search_index.count(queryset.model, query, SEARCH_COUNT_CAP)
+
+def keyset_section(queryset, limit, position):
+    """A page of newest-first rows, continued after the last (created_at, id) seen."""
+    queryset = queryset.order_by("-created_at", "-id")
+    total = capped_count(queryset, SEARCH_COUNT_CAP)
+    if position:
+        try:
+            created_at = datetime.fromisoformat(position["created_at"])
+            last_id = UUID(position["id"])
+        except (KeyError, TypeError, ValueError):
+            raise ValueError("Invalid cursor.")
+        queryset = queryset.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=last_id))
+    objects = list(queryset[:limit + 1])
+    next_position = None
+    if len(objects) > limit:
+        last = objects[limit - 1]
+        next_position = {"created_at": last.created_at.isoformat(), "id": str(last.id)}
+    return objects[:limit], next_position, total
+
+def icontains_search(query):
+    """Fallback for search_all on databases without the FTS5 search index."""
     students = Student.objects.filter(
         is_active=True,
         name_first__icontains=query
@@ -277,23 +439,121 @@ def search_all(request):
         description__icontains=query
     )
 
-    registrations = Registration.objects.filter(
-        is_active=True,
-        registration_status__icontains=query
-    )
+    return students.distinct(), instructors.distinct(), courses.distinct().select_related("instructor")
+
+SEARCH_SECTIONS = ["students", "instructors", "courses", "registrations"]
+SEARCH_SERIALIZERS = {
+    "students": StudentSerializer,
+    "instructors": InstructorSerializer,
+    "courses": CourseSerializer,
+    "registrations": RegistrationSerializer,
+}
+
+def parse_search_params(params):
+    """Validate search_all's query parameters into ``(query, limit, sections, position)``.
 
-    return Response({
-        "students": StudentSerializer(students.distinct(), many=True).data,
-        "instructors": InstructorSerializer(instructors.distinct(), many=True).data,
-        "courses": CourseSerializer(courses.distinct(), many=True).data,
-        "registrations": RegistrationSerializer(registrations.distinct(), many=True).data,
-    })
+    Raises ValueError with the message for the 400 response.
+    """
+    query = params.get("q", "").strip()
+    if not query:
+        raise ValueError("Missing search query parameter 'q'")
+
+    try:
+        limit = int(params.get("limit", SEARCH_DEFAULT_LIMIT))
+    except ValueError:
+        raise ValueError("'limit' must be an integer")
+    limit = max(1, min(limit, SEARCH_MAX_LIMIT))
+
+    sections = SEARCH_SECTIONS
+    section = params.get("section")
+    if section:
+        if section not in SEARCH_SECTIONS:
+            raise ValueError(f"'section' must be one of {SEARCH_SECTIONS}")
+        sections = [section]
+
+    position = {}
+    cursor = params.get("cursor")
+    if cursor:
+        if not section:
+            raise ValueError("'cursor' requires 'section'")
+        position = decode_search_cursor(cursor)
+    return query, limit, sections, position
+
+def search_queryset(name, query, ranked):
+    if name == "registrations":
+        # Registration statuses are not in the full-text index and always page by keyset
+        return select_registration_related(Registration.objects.filter(
+            is_active=True,
+            registration_status__icontains=query
+        ))
+    if ranked:
+        return {
+            "students": Student.objects.all(),
+            "instructors": Instructor.objects.all(),
+            "courses": Course.objects.select_related("instructor"),
+        }[name]
+    return dict(zip(["students", "instructors", "courses"], icontains_search(query)))[name]
+
+def search_section(name, query, limit, position):
+    """One section of search_all: its serialized rows and its ``meta`` entry.
+
+    Sections share no state, so the async search_all runs them concurrently. Raises ValueError
+    for a cursor that does not fit the section.
+    """
+    ranked = name != "registrations" and search_index.is_available()
+    queryset = search_queryset(name, query, ranked)
+    if ranked:
+        objects, next_position, total = ranked_section(queryset, query, limit, position)
+    else:
+        objects, next_position, total = keyset_section(queryset, limit, position)
+    return SEARCH_SERIALIZERS[name](objects, many=True).data, {
+        "next": encode_search_cursor(next_position) if next_position else None,
+        "count": min(total, SEARCH_COUNT_CAP),
+        "count_is_exact": total <= SEARCH_COUNT_CAP,
+    }
+
+@api_view(["GET"])
+def search_all(request):
+    """Search every entity, returning at most ``limit`` results per section.
+
+    Each section's ``meta`` entry carries a ``next`` cursor and a ``count`` that is exact
+    up to SEARCH_COUNT_CAP. Pass ``section`` and ``cursor`` to continue a single section.
+    """
+    data = {}
+    meta = {}
+    try:
+        query, limit, sections, position = parse_search_params(request.query_params)
+        for name in sections:
+            data[name], meta[name] = search_section(name, query, limit, position)
+    except ValueError as e:
+        return Response({"error": str(e)}, status=400)
+
+    return Response({**data, "meta": meta})
+
+def dashboard_counts(counters):
+    return {
+        "studentCount": counters.student_count,
+        "instructorCount": counters.instructor_count,
+        "courseCount": counters.course_count,
+        "registrationCount": counters.registration_count,
+    }
 
 @api_view(["GET"])
 def dashboard_summary(request):
-    return Response({
-        "studentCount": Student.objects.filter(is_active=True).count(),
-        "instructorCount": Instructor.objects.filter(is_active=True).count(),
-        "courseCount": Course.objects.filter(is_active=True).count(),
-        "registrationCount": Registration.objects.filter(is_active=True).count(),
-    })
+    # Counters are maintained on every write, so this is a single-row read that also serves as
+    # the response's version stamp
+    counters = counter_service.read()
+    counts = dashboard_counts(counters)
+    etag = make_etag(*counts.values(), counters.updated_at, request.accepted_renderer.format)
+    return conditional_response(request, etag, counters.updated_at, lambda: Response(counts), cache=True)
+
+
+@api_view(["GET", "DELETE"])
+def request_timings(request):
+    """Per-route timing aggregates of this process since start-up or the last DELETE."""
+    if request.META.get("REMOTE_ADDR") not in settings.INTERNAL_IPS:
+        return Response({"detail": "Not found."}, status=404)
+    if request.method == "DELETE":
+        route_timings.reset()
+        return Response(status=204)
+    return Response(route_timings.snapshot())
@@ -0,0 +1,72 @@
+"""DATABASES["default"] for each DB_PROFILE, configured from environment variables.
+
+sqlite        WAL journal, synchronous=NORMAL, mmap, a larger page cache and a busy timeout, set
+              on every new connection through the backend's init_command hook. Transactions
+              begin IMMEDIATE so concurrent writers queue on busy_timeout instead of failing on a
+              read-to-write lock upgrade. Connections persist for DB_CONN_MAX_AGE seconds.
+sqlite-basic  The previous setup: library defaults and a new connection per request. Kept for
+              comparison (manage.py benchmark concurrency).
+postgres      PostgreSQL through psycopg 3, pooled by psycopg_pool unless POSTGRES_POOL=False,
+              in which case connections persist like the sqlite profile's. Needs
+              ``pip install "psycopg[binary,pool]"``.
+"""
+import os
+from django.core.exceptions import ImproperlyConfigured
+
+PROFILES = ["sqlite", "sqlite-basic", "postgres"]
+
+
+def env_flag(env, name, default):
+    return env.get(name, default).lower() in ("true", "1", "yes")
+
+
+def sqlite_pragmas(env):
+    return {
+        "journal_mode": env.get("SQLITE_JOURNAL_MODE", "WAL"),
+        "synchronous": env.get("SQLITE_SYNCHRONOUS", "NORMAL"),
+        "busy_timeout": int(env.get("SQLITE_BUSY_TIMEOUT_MS", "5000")),
+        # Negative sizes are in KiB: 64 MiB of page cache per connection
+        "cache_size": int(env.get("SQLITE_CACHE_SIZE", "-65536")),
+        "mmap_size": int(env.get("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024))),
+    }
+
+
+def database_config(profile, sqlite_path, env=None):
+    env = os.environ if env is None else env
+    conn_max_age = int(env.get("DB_CONN_MAX_AGE", "600"))
+    if profile == "sqlite":
+        init_command = ";".join(f"PRAGMA {name}={value}" for name, value in sqlite_pragmas(env).items())
+        return {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": sqlite_path,
+            "CONN_MAX_AGE": conn_max_age,
+            "CONN_HEALTH_CHECKS": True,
+            "OPTIONS": {
+                "init_command": init_command,
+                "transaction_mode": env.get("SQLITE_TRANSACTION_MODE", "IMMEDIATE"),
+            },
+        }
+    if profile == "sqlite-basic":
+        return {"ENGINE": "django.db.backends.sqlite3", "NAME": sqlite_path}
+    if profile == "postgres":
+        pooled = env_flag(env, "POSTGRES_POOL", "True")
+        config = {
+            "ENGINE": "django.db.backends.postgresql",
+            "NAME": env.get("POSTGRES_DB", "backend"),
+            "USER": env.get("POSTGRES_USER", "postgres"),
+            "PASSWORD": env.get("POSTGRES_PASSWORD", ""),
+            "HOST": env.get("POSTGRES_HOST", "localhost"),
+            "PORT": env.get("POSTGRES_PORT", "5432"),
+            # The pool owns connection lifetime; Django refuses persistent connections alongside it
+            "CONN_MAX_AGE": 0 if pooled else conn_max_age,
+            "CONN_HEALTH_CHECKS": not pooled,
+            "OPTIONS": {},
+        }
+        if pooled:
+            config["OPTIONS"]["pool"] = {
+                "min_size": int(env.get("POSTGRES_POOL_MIN_SIZE", "2")),
+                "max_size": int(env.get("POSTGRES_POOL_MAX_SIZE", "10")),
+                "timeout": int(env.get("POSTGRES_POOL_TIMEOUT", "10")),
+            }
+        return config
+    raise ImproperlyConfigured(f"DB_PROFILE must be one of {PROFILES}, not {profile!r}")
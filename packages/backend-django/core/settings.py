@@ -1,6 +1,7 @@
 from pathlib import Path
 from dotenv import load_dotenv
 import os
+from .database import database_config
 
 load_dotenv()
 
@@ -25,6 +26,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'api.timing.RequestTimingMiddleware',
+    'api.compression.CompressionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -55,11 +58,11 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'core.wsgi.application'
 
+# sqlite (tuned, default), sqlite-basic or postgres; see core/database.py for each profile's variables
+DB_PROFILE = os.getenv("DB_PROFILE", "sqlite")
+
 DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
-    }
+    'default': database_config(DB_PROFILE, os.getenv("SQLITE_PATH", str(BASE_DIR / 'db.sqlite3'))),
 }
 
 AUTH_PASSWORD_VALIDATORS = []
@@ -74,6 +77,96 @@ STATIC_ROOT = BASE_DIR / 'staticfiles'
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# Outbox emails are delivered through this backend; the console backend stands in for SMTP.
+# Use django.core.mail.backends.filebased.EmailBackend to write them under EMAIL_FILE_PATH instead.
+EMAIL_BACKEND = os.getenv("EMAIL_BACKEND", "django.core.mail.backends.console.EmailBackend")
+EMAIL_FILE_PATH = os.getenv("EMAIL_FILE_PATH", str(BASE_DIR / "sent_emails"))
+DEFAULT_FROM_EMAIL = os.getenv("DEFAULT_FROM_EMAIL", "crm@example.com")
+
+EMAIL_OUTBOX_WORKERS = int(os.getenv("EMAIL_OUTBOX_WORKERS", "2"))  # 0 dispatches inline after commit
+EMAIL_OUTBOX_BATCH_SIZE = int(os.getenv("EMAIL_OUTBOX_BATCH_SIZE", "50"))
+EMAIL_OUTBOX_MAX_ATTEMPTS = int(os.getenv("EMAIL_OUTBOX_MAX_ATTEMPTS", "5"))
+EMAIL_OUTBOX_BACKOFF_SECONDS = int(os.getenv("EMAIL_OUTBOX_BACKOFF_SECONDS", "30"))
+
+# Rendered GET responses of the read-heavy endpoints (see api.services.response_cache). The
+# local-memory backend keeps entries in LRU order and culls the oldest past MAX_ENTRIES; use
+# django.core.cache.backends.filebased.FileBasedCache with RESPONSE_CACHE_LOCATION set to a
+# directory to share the cache between worker processes.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "responses": {
+        "BACKEND": os.getenv("RESPONSE_CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": os.getenv("RESPONSE_CACHE_LOCATION", "api-responses"),
+        "TIMEOUT": int(os.getenv("RESPONSE_CACHE_TIMEOUT", "3600")),
+        "OPTIONS": {"MAX_ENTRIES": int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "500"))},
+    },
+}
+RESPONSE_CACHE_MAX_ENTRY_BYTES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRY_BYTES", str(256 * 1024)))  # larger bodies are not cached
+
+# Server-Timing header and per-route aggregates (see api.timing); the aggregates are served at
+# /api/internal/timings/ to clients in INTERNAL_IPS only
+REQUEST_TIMING = os.getenv("REQUEST_TIMING", "True").lower() in ("true", "1", "yes")
+INTERNAL_IPS = [ip.strip() for ip in os.getenv("INTERNAL_IPS", "127.0.0.1,::1").split(",") if ip.strip()]
+
+# List endpoints render values() rows through compiled encoders instead of ModelSerializer
+# instances (see api.fast_read); the JSON is identical either way
+FAST_LIST_READS = os.getenv("FAST_LIST_READS", "True").lower() in ("true", "1", "yes")
+
+# Page-number counts (see api.pagination.CheapCountPaginator): unfiltered lists read the
+# maintained counters row, filtered lists count at most PAGINATION_COUNT_CAP rows (or to the end
+# of the requested page) and say so with count_is_exact. False runs an exact COUNT(*) every time.
+FAST_PAGINATION_COUNTS = os.getenv("FAST_PAGINATION_COUNTS", "True").lower() in ("true", "1", "yes")
+PAGINATION_COUNT_CAP = int(os.getenv("PAGINATION_COUNT_CAP", "1000"))
+
+# Responses are rendered with orjson (api.renderers.FastJSONRenderer) when it is installed and
+# FAST_JSON_RENDERER is on; the browsable API stays available for browsers
+FAST_JSON_RENDERER = os.getenv("FAST_JSON_RENDERER", "True").lower() in ("true", "1", "yes")
+REST_FRAMEWORK = {
+    "DEFAULT_RENDERER_CLASSES": [
+        "api.renderers.FastJSONRenderer" if FAST_JSON_RENDERER else "rest_framework.renderers.JSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+}
+
+# Response bodies of at least COMPRESSION_MIN_BYTES are compressed with brotli (if installed) or
+# gzip, as the client's Accept-Encoding allows (see api.compression). Set it to an empty value
+# to turn compression off, e.g. behind a proxy that compresses.
+_compression_min_bytes = os.getenv("COMPRESSION_MIN_BYTES", "1024")
+COMPRESSION_MIN_BYTES = int(_compression_min_bytes) if _compression_min_bytes else None
+COMPRESSION_GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+COMPRESSION_BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "4"))  # 0-11; 4 suits dynamic responses
+
+# Statements slower than SLOW_QUERY_MS inside a timed request are written, with their plan, to
+# SLOW_QUERY_LOG_FILE (see api.services.slow_query_log and manage.py slow_queries). Set
+# SLOW_QUERY_MS to an empty value to turn the log off.
+_slow_query_ms = os.getenv("SLOW_QUERY_MS", "100")
+SLOW_QUERY_MS = float(_slow_query_ms) if _slow_query_ms else None
+SLOW_QUERY_LOG_FILE = os.getenv("SLOW_QUERY_LOG_FILE", str(BASE_DIR / "slow_queries.log"))
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {
+        "message": {"format": "%(message)s"},
+    },
+    "handlers": {
+        "slow_queries": {
+            "class": "logging.handlers.RotatingFileHandler",
+            "filename": SLOW_QUERY_LOG_FILE,
+            "maxBytes": int(os.getenv("SLOW_QUERY_LOG_MAX_BYTES", str(10 * 1024 * 1024))),
+            "backupCount": int(os.getenv("SLOW_QUERY_LOG_BACKUPS", "5")),
+            "encoding": "utf-8",
+            "delay": True,  # don't create the file until the first slow query
+            "formatter": "message",
+        },
+    },
+    "loggers": {
+        "api.slow_queries": {"handlers": ["slow_queries"], "level": "INFO", "propagate": False},
+    },
+}
+
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:5173",  # Vite dev server
     "http://localhost:5174",  # Vite dev server (sometimes)